@@ -0,0 +1,126 @@
+"""Dial apply policy benchmark.
+
+Replays a scripted dial rotation against a simulated monitor for each apply
+mode (debounce / throttle / adaptive) and reports how many hardware writes
+were issued and how long after the last tick the monitor reached the final
+value.
+
+    python benchmarks/dial_apply.py [--write-ms 60] [--ticks 40] [--tick-ms 30]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.apply_policy import APPLY_MODES  # noqa: E402
+from src.core.brightness_hub import BrightnessHub  # noqa: E402
+from src.core.monitor_control import MonitorBackend, MonitorInfo, MonitorManager, MonitorSnapshot  # noqa: E402
+from src.core.settings_store import GlobalSettingsStore  # noqa: E402
+from src.core.timer import Timer  # noqa: E402
+
+
+class _SimMonitor(MonitorBackend):
+    def __init__(self, name: str, write_s: float):
+        self._name = name
+        self._write_s = write_s
+        self._lock = threading.Lock()
+        self.value = 0
+        self.writes = 0
+        self.reached: Optional[float] = None
+        self.target: Optional[int] = None
+
+    def get_info(self) -> MonitorInfo:
+        return MonitorInfo(name=self._name, backend="bench")
+
+    def get_brightness_percent(self) -> Optional[int]:
+        return self.value
+
+    def set_brightness_percent(self, percent: int) -> bool:
+        time.sleep(self._write_s)
+        with self._lock:
+            self.writes += 1
+            self.value = int(percent)
+            if self.value == self.target and self.reached is None:
+                self.reached = time.monotonic()
+        return True
+
+
+class _BenchManager(MonitorManager):
+    def __init__(self, monitor: _SimMonitor):
+        super().__init__(read_cache_ttl_s=0.0)
+        self._bench_monitors = (monitor,)
+
+    def scan(self) -> List[MonitorBackend]:
+        self._snapshot = MonitorSnapshot(monitors=self._bench_monitors, generation=1, scanned_at=time.time())
+        return list(self._bench_monitors)
+
+
+class _StubPlugin:
+    actions: dict = {}
+
+    def __init__(self):
+        self.timer = Timer()
+
+    def get_global_settings(self) -> None:
+        return None
+
+    def set_global_settings(self, payload) -> None:
+        return None
+
+    def add_shutdown_hook(self, hook) -> None:
+        return None
+
+    def settings_store(self) -> GlobalSettingsStore:
+        # No mirror path: benchmarks must not write a settings file.
+        return GlobalSettingsStore(self.timer, self.set_global_settings)
+
+
+def _run(mode: str, write_s: float, ticks: int, tick_s: float, step: int) -> None:
+    monitor = _SimMonitor("bench-1", write_s)
+    plugin = _StubPlugin()
+    hub = BrightnessHub(plugin, manager=_BenchManager(monitor), settings_store=plugin.settings_store())
+    hub.set_all_brightness_preview(0)
+    final = min(100, ticks * step)
+    monitor.target = final
+
+    # Lag between preview and hardware, sampled at every tick.
+    lag: List[int] = []
+    last_tick = time.monotonic()
+    for _ in range(ticks):
+        value = hub.set_all_brightness_preview(hub.get_all_brightness() + step)
+        hub.schedule_apply_all(delay_ms=350, mode=mode)
+        last_tick = time.monotonic()
+        time.sleep(tick_s)
+        lag.append(value - monitor.value)
+
+    deadline = last_tick + 5.0
+    while monitor.reached is None and time.monotonic() < deadline:
+        time.sleep(0.002)
+    time.sleep(0.3)  # let trailing writes land so they are counted
+
+    settle = "n/a" if monitor.reached is None else f"{(monitor.reached - last_tick) * 1000.0:7.1f}ms"
+    print(
+        f"{mode:<9} writes={monitor.writes:<4} time-to-final={settle}  "
+        f"mean preview lag={sum(lag) / len(lag):5.1f}%  final={monitor.value}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--write-ms", type=float, default=60.0, help="simulated hardware write latency")
+    parser.add_argument("--ticks", type=int, default=40, help="dial ticks in the scripted rotation")
+    parser.add_argument("--tick-ms", type=float, default=30.0, help="time between ticks")
+    parser.add_argument("--step", type=int, default=2)
+    args = parser.parse_args()
+    for mode in APPLY_MODES:
+        _run(mode, args.write_ms / 1000.0, args.ticks, args.tick_ms / 1000.0, args.step)
+
+
+if __name__ == "__main__":
+    main()
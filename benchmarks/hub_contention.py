@@ -0,0 +1,143 @@
+"""BrightnessHub lock contention benchmark.
+
+Measures how long ``get_all_brightness`` (what a dial rotation calls) takes
+while another thread keeps running slow hardware reads through
+``get_monitor_brightness``. "before" reproduces the old hub, which held its
+RLock across the backend read; "after" is the current snapshot-based hub.
+
+    python benchmarks/hub_contention.py [--read-ms 200] [--samples 200]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.brightness_hub import BrightnessHub  # noqa: E402
+from src.core.monitor_control import MonitorBackend, MonitorInfo, MonitorManager, MonitorSnapshot  # noqa: E402
+from src.core.settings_store import GlobalSettingsStore  # noqa: E402
+from src.core.timer import Timer  # noqa: E402
+
+
+class _SlowMonitor(MonitorBackend):
+    def __init__(self, name: str, read_s: float):
+        self._name = name
+        self._read_s = read_s
+        self._value = 50
+
+    def get_info(self) -> MonitorInfo:
+        return MonitorInfo(name=self._name, backend="bench")
+
+    def get_brightness_percent(self) -> Optional[int]:
+        time.sleep(self._read_s)
+        return self._value
+
+    def set_brightness_percent(self, percent: int) -> bool:
+        self._value = int(percent)
+        return True
+
+
+class _BenchManager(MonitorManager):
+    def __init__(self, read_s: float):
+        super().__init__(read_cache_ttl_s=0.0)
+        self._bench_monitors = (_SlowMonitor("bench-1", read_s),)
+
+    def scan(self) -> List[MonitorBackend]:
+        self._snapshot = MonitorSnapshot(monitors=self._bench_monitors, generation=1, scanned_at=time.time())
+        return list(self._bench_monitors)
+
+
+class _StubPlugin:
+    actions: dict = {}
+
+    def __init__(self):
+        self.timer = Timer()
+
+    def get_global_settings(self) -> None:
+        return None
+
+    def set_global_settings(self, payload) -> None:
+        return None
+
+    def add_shutdown_hook(self, hook) -> None:
+        return None
+
+    def settings_store(self) -> GlobalSettingsStore:
+        # No mirror path: benchmarks must not write a settings file.
+        return GlobalSettingsStore(self.timer, self.set_global_settings)
+
+
+class _LockedHub:
+    """The pre-snapshot access pattern: one RLock around state and backend reads."""
+
+    def __init__(self, manager: MonitorManager):
+        self._lock = threading.RLock()
+        self._manager = manager
+        self._all = 50
+
+    def get_all_brightness(self) -> int:
+        with self._lock:
+            return self._all
+
+    def get_monitor_brightness(self, index: int) -> Optional[int]:
+        with self._lock:
+            return self._manager.get_brightness_percent(index)
+
+
+def _measure(get_all: Callable[[], int], slow_read: Callable[[int], Optional[int]], samples: int) -> List[float]:
+    stop = threading.Event()
+
+    def _reader():
+        while not stop.is_set():
+            slow_read(0)
+
+    t = threading.Thread(target=_reader, daemon=True)
+    t.start()
+    time.sleep(0.05)
+    latencies: List[float] = []
+    try:
+        for _ in range(samples):
+            start = time.perf_counter()
+            get_all()
+            latencies.append((time.perf_counter() - start) * 1000.0)
+            time.sleep(0.005)
+    finally:
+        stop.set()
+        t.join()
+    return latencies
+
+
+def _report(label: str, latencies: List[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"{label:<7} get_all_brightness  p50={statistics.median(ordered):8.3f}ms  "
+        f"p99={p99:8.3f}ms  max={ordered[-1]:8.3f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--read-ms", type=float, default=200.0, help="simulated hardware read latency")
+    parser.add_argument("--samples", type=int, default=200)
+    args = parser.parse_args()
+    read_s = args.read_ms / 1000.0
+
+    before_manager = _BenchManager(read_s)
+    before_manager.scan()
+    before = _LockedHub(before_manager)
+    _report("before", _measure(before.get_all_brightness, before.get_monitor_brightness, args.samples))
+
+    plugin = _StubPlugin()
+    after = BrightnessHub(plugin, manager=_BenchManager(read_s), settings_store=plugin.settings_store())
+    _report("after", _measure(after.get_all_brightness, after.get_monitor_brightness, args.samples))
+
+
+if __name__ == "__main__":
+    main()
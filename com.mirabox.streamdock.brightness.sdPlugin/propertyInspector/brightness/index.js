@@ -47,21 +47,30 @@ function _setHint(text) {
   if (el) el.textContent = text || "";
 }
 
+const _APPLY_MODES = ["debounce", "throttle", "adaptive"];
+
+function _applyMode(v) {
+  return _APPLY_MODES.indexOf(v) >= 0 ? v : "debounce";
+}
+
 function _applyUiModel() {
   const a = _action || "";
   const showStep = a.endsWith("all_brightness_dial") || a.endsWith("monitor_brightness_dial") || a.endsWith("increase_all_brightness") || a.endsWith("decrease_all_brightness");
+  const showApplyMode = a.endsWith("all_brightness_dial") || a.endsWith("monitor_brightness_dial");
   const showRefreshMs = a.endsWith("monitor_brightness_dial") || a.endsWith("show_monitor_brightness");
   const showMonitorIndex = a.endsWith("show_monitor_brightness");
   const showValue = a.endsWith("set_all_brightness");
 
   _setVisible("row-step", showStep);
+  _setVisible("row-applyMode", showApplyMode);
   _setVisible("row-refreshMs", showRefreshMs);
+  _setVisible("row-refreshMode", showRefreshMs);
   _setVisible("row-monitorIndex", showMonitorIndex);
   _setVisible("row-value", showValue);
 
-  if (a.endsWith("all_brightness_dial")) _setHint("旋钮：调整全部亮度；旋转停止后应用。");
+  if (a.endsWith("all_brightness_dial")) _setHint("旋钮：调整全部亮度；按应用方式写入显示器。");
   else if (a.endsWith("monitor_brightness_dial")) _setHint("旋钮：调整当前显示器亮度；按下切换显示器。");
-  else if (a.endsWith("show_monitor_brightness")) _setHint("定时刷新指定显示器亮度。");
+  else if (a.endsWith("show_monitor_brightness")) _setHint("刷新指定显示器亮度；自适应模式在操作后加快、空闲时放慢。");
   else if (a.endsWith("set_all_brightness")) _setHint("按下将全部显示器亮度设为目标值。");
   else if (a.endsWith("increase_all_brightness")) _setHint("按下将全部亮度增加一个步长并应用。");
   else if (a.endsWith("decrease_all_brightness")) _setHint("按下将全部亮度减少一个步长并应用。");
@@ -70,19 +79,25 @@ function _applyUiModel() {
 
 function _hydrateControls() {
   const stepEl = document.getElementById("step");
+  const applyModeEl = document.getElementById("applyMode");
   const refreshEl = document.getElementById("refreshMs");
+  const refreshModeEl = document.getElementById("refreshMode");
   const monitorEl = document.getElementById("monitorIndex");
   const valueEl = document.getElementById("value");
 
   if (stepEl) stepEl.value = _int(_settings.step, 5);
+  if (applyModeEl) applyModeEl.value = _applyMode(_settings.applyMode);
   if (refreshEl) refreshEl.value = _int(_settings.refreshMs, 3000);
+  if (refreshModeEl) refreshModeEl.value = _settings.refreshMode === "adaptive" ? "adaptive" : "fixed";
   if (monitorEl) monitorEl.value = _int(_settings.monitorIndex, 1);
   if (valueEl) valueEl.value = _int(_settings.value, 50);
 }
 
 function _wireControls() {
   const stepEl = document.getElementById("step");
+  const applyModeEl = document.getElementById("applyMode");
   const refreshEl = document.getElementById("refreshMs");
+  const refreshModeEl = document.getElementById("refreshMode");
   const monitorEl = document.getElementById("monitorIndex");
   const valueEl = document.getElementById("value");
 
@@ -92,12 +107,24 @@ function _wireControls() {
       _saveSettingsDebounced();
     });
   }
+  if (applyModeEl) {
+    applyModeEl.addEventListener("change", () => {
+      _settings.applyMode = _applyMode(applyModeEl.value);
+      _saveSettingsDebounced();
+    });
+  }
   if (refreshEl) {
     refreshEl.addEventListener("input", () => {
       _settings.refreshMs = _clamp(_int(refreshEl.value, 3000), 250, 60000);
       _saveSettingsDebounced();
     });
   }
+  if (refreshModeEl) {
+    refreshModeEl.addEventListener("change", () => {
+      _settings.refreshMode = refreshModeEl.value === "fixed" ? "fixed" : "adaptive";
+      _saveSettingsDebounced();
+    });
+  }
   if (monitorEl) {
     monitorEl.addEventListener("input", () => {
       _settings.monitorIndex = _clamp(_int(monitorEl.value, 1), 1, 99);
@@ -1,5 +1,6 @@
 from src.core.plugin import Plugin
 import json
+import multiprocessing
 import argparse
 import sys
 import threading
@@ -25,7 +26,8 @@ def main():
         plugin = Plugin(args.port, args.pluginUUID, args.registerEvent, info)
         stop_event = threading.Event()
         def on_close(ws, close_status_code, close_msg):
-            plugin.stop()
+            # The host closed the socket: nothing more can be sent to it.
+            plugin.stop(connection_lost=True)
             stop_event.set()
             Logger.info('Plugin stopped')
         
@@ -37,4 +39,6 @@ def main():
         sys.exit(0)
 
 if __name__ == '__main__':
+    # The monitor I/O worker is started with the spawn method; needed for frozen builds.
+    multiprocessing.freeze_support()
     main()
@@ -1,4 +1,5 @@
 from src.core.brightness_action_base import BrightnessAction, clamp_int
+from src.core.brightness_hub import REFRESH_ALL_VALUE, RefreshScope
 
 
 class AllBrightnessDial(BrightnessAction):
@@ -11,6 +12,9 @@ class AllBrightnessDial(BrightnessAction):
         #self.set_title(f"全部\n{value}%")
         self.set_title(f"{value}%\n")
 
+    def depends_on(self, scope: RefreshScope) -> bool:
+        return scope.all_value
+
     def on_dial_rotate(self, payload: dict):
         ticks = payload.get("ticks")
         if ticks is None:
@@ -25,8 +29,8 @@ class AllBrightnessDial(BrightnessAction):
         new_value = clamp_int(current + ticks * step, 0, 100, current)
         self.hub.set_all_brightness_preview(new_value)
         self.hub.save_global_settings()
-        self.hub.broadcast_refresh()
-        self.hub.schedule_apply_all(delay_ms=350)
+        self.hub.broadcast_refresh(REFRESH_ALL_VALUE)
+        self.hub.schedule_apply_all(delay_ms=350, mode=self._get_apply_mode())
 
     def on_key_up(self, payload: dict):
         self.refresh_title()
@@ -1,4 +1,5 @@
 from src.core.brightness_action_base import BrightnessAction
+from src.core.brightness_hub import REFRESH_ALL_APPLIED, RefreshScope
 
 
 class IncreaseAllBrightness(BrightnessAction):
@@ -10,14 +11,17 @@ class IncreaseAllBrightness(BrightnessAction):
         step = self._get_step(default_step=5)
         self.set_title(self.plugin.t("inc_all", step=step))
 
+    def depends_on(self, scope: RefreshScope) -> bool:
+        return False
+
     def on_key_up(self, payload: dict):
         step = self._get_step(default_step=5)
         current = self.hub.get_all_brightness()
         self.hub.set_all_brightness_preview(current + step)
         self.hub.save_global_settings()
-        ok_count = self.hub.apply_all_now()
-        self.hub.broadcast_refresh()
-        if ok_count > 0:
+        result = self.hub.apply_all_now()
+        self.hub.broadcast_refresh(REFRESH_ALL_APPLIED)
+        if result.ok_count > 0:
             self.show_ok()
         else:
             self.show_alert()
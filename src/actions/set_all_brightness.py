@@ -1,4 +1,5 @@
 from src.core.brightness_action_base import BrightnessAction, clamp_int
+from src.core.brightness_hub import REFRESH_ALL_APPLIED, RefreshScope
 
 
 class SetAllBrightness(BrightnessAction):
@@ -13,13 +14,16 @@ class SetAllBrightness(BrightnessAction):
         value = self._get_target()
         self.set_title(self.plugin.t("set_to", value=value))
 
+    def depends_on(self, scope: RefreshScope) -> bool:
+        return False
+
     def on_key_up(self, payload: dict):
         value = self._get_target()
         self.hub.set_all_brightness_preview(value)
         self.hub.save_global_settings()
-        ok_count = self.hub.apply_all_now()
-        self.hub.broadcast_refresh()
-        if ok_count > 0:
+        result = self.hub.apply_all_now()
+        self.hub.broadcast_refresh(REFRESH_ALL_APPLIED)
+        if result.ok_count > 0:
             self.show_ok()
         else:
             self.show_alert()
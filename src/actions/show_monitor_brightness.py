@@ -1,32 +1,21 @@
+from typing import Optional
+
 from src.core.brightness_action_base import BrightnessAction, clamp_int
+from src.core.brightness_hub import RefreshScope
 
 
 class ShowMonitorBrightness(BrightnessAction):
     def __init__(self, action: str, context: str, settings: dict, plugin):
         super().__init__(action, context, settings or {}, plugin)
-        self._timer_key = f"show_monitor_brightness_{context}"
-        self._ensure_timer()
         self.refresh_title()
 
     def on_will_disappear(self):
-        try:
-            self.plugin.timer.clear_interval(self._timer_key)
-        except Exception:
-            pass
+        self._close_subscription()
 
     def on_did_receive_settings(self, settings: dict):
         self.settings = settings or {}
-        self._ensure_timer()
         self.refresh_title()
 
-    def _ensure_timer(self):
-        refresh_ms = self._get_refresh_ms(default_ms=3000)
-        try:
-            self.plugin.timer.clear_interval(self._timer_key)
-        except Exception:
-            pass
-        self.plugin.timer.set_interval(self._timer_key, refresh_ms, self.refresh_title)
-
     def _get_monitor_index(self, count: int) -> int:
         raw = (self.settings or {}).get("monitorIndex")
         idx = clamp_int(raw, 1, 999, 1) - 1
@@ -34,18 +23,32 @@ class ShowMonitorBrightness(BrightnessAction):
             return 0
         return idx % count
 
+    def _render(self, idx: int, brightness: Optional[int]) -> None:
+        if brightness is None:
+            self.set_title(self.plugin.t("screen_n_unknown", n=idx + 1))
+        else:
+            self.set_title(self.plugin.t("screen_n_value", n=idx + 1, value=brightness))
+
+    def _on_brightness_changed(self, monitor_id: Optional[str], value: Optional[int]) -> None:
+        if monitor_id != self._subscribed_monitor_id:
+            return
+        idx = self.hub.get_monitor_index(monitor_id)
+        if idx >= 0:
+            self._render(idx, value)
+
     def refresh_title(self) -> None:
         self.hub.scan(force=False)
         count = self.hub.get_monitor_count()
         if count <= 0:
+            self._ensure_subscription(None)
             self.set_title(self.plugin.t("no_monitors"))
             return
         idx = self._get_monitor_index(count)
-        brightness = self.hub.get_monitor_brightness(idx)
-        if brightness is None:
-            self.set_title(self.plugin.t("screen_n_unknown", n=idx + 1))
-        else:
-            self.set_title(self.plugin.t("screen_n_value", n=idx + 1, value=brightness))
+        self._ensure_subscription(self.hub.get_monitor_id(idx))
+        self._render(idx, self._read_brightness(idx))
+
+    def depends_on(self, scope: RefreshScope) -> bool:
+        return scope.touches_monitor(self._subscribed_monitor_id)
 
     def on_key_up(self, payload: dict):
         self.refresh_title()
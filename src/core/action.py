@@ -1,88 +1,189 @@
-import json
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
 
 _TRANSPARENT_PNG_DATA_URL = (
     "data:image/png;base64,"
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mP8/x8AAwMB/6X5zP0AAAAASUVORK5CYII="
 )
 
+_DEFAULT_MAX_FPS = 20.0
+
+
+class _Frame:
+    """Render state of one channel (setTitle or setImage) of a context."""
+
+    __slots__ = ("sent", "sent_at", "pending", "scheduled")
+
+    def __init__(self):
+        self.sent: Optional[str] = None
+        self.sent_at = 0.0
+        self.pending: Optional[Tuple[str, Dict[str, Any]]] = None
+        self.scheduled = False
+
+
+def _parse_max_fps(value: Any) -> Optional[float]:
+    try:
+        fps = float(value)
+    except (TypeError, ValueError):
+        return None
+    return fps if fps >= 0 else None
+
+
 class Action:
-    def __init__(self, action: str, context: str, settings: Dict, plugin):
+    def __init__(self, action: str, context: str, settings: Dict, plugin, max_fps: Optional[float] = None):
         self.action = action
         self.context = context
         self.settings = settings
         self.title = ""
         self.title_parameters = {}
-        self._server = plugin.ws
         self.plugin = plugin
+        self._default_max_fps = _parse_max_fps(max_fps)
+        if self._default_max_fps is None:
+            self._default_max_fps = _DEFAULT_MAX_FPS
+        self._render_lock = threading.Lock()
+        self._frames: Dict[str, _Frame] = {}
+        self._frames_sent = 0
+        self._frames_suppressed = 0
+        self._frames_deferred = 0
         self.set_image(_TRANSPARENT_PNG_DATA_URL)
     
+    @property
+    def max_fps(self) -> float:
+        """Cap on setTitle/setImage frames per second for this context (0 = no cap).
+
+        The ``maxFps`` setting wins over the constructor's ``max_fps``. Frames
+        over the cap are held back and only the newest is sent, so the final
+        frame always reaches the device.
+        """
+        fps = _parse_max_fps((self.settings or {}).get('maxFps'))
+        return self._default_max_fps if fps is None else fps
+    
     def send_to_property_inspector(self, payload: Any):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'sendToPropertyInspector',
-                'action': self.action,
-                'context': self.context,
-                'payload': payload
-            }))
+        self.plugin.send({
+            'event': 'sendToPropertyInspector',
+            'action': self.action,
+            'context': self.context,
+            'payload': payload
+        })
     
     def set_state(self, state: int):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'setState',
-                'context': self.context,
-                'payload': {'state': state}
-            }))
+        self.plugin.send({
+            'event': 'setState',
+            'context': self.context,
+            'payload': {'state': state}
+        })
     
     def set_title(self, title: str):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'setTitle',
-                'context': self.context,
-                'payload': {'title': title, 'target': 0}
-            }))
+        self._render_frame('setTitle', title, {'title': title, 'target': 0})
     
     def set_settings(self, payload: Any):
-        if self._server:
-            self.settings = payload
-            self._server.send(json.dumps({
-                'event': 'setSettings',
-                'context': self.context,
-                'payload': payload
-            }))
+        self.settings = payload
+        self.plugin.send({
+            'event': 'setSettings',
+            'context': self.context,
+            'payload': payload
+        })
     
     def open_url(self, url: str):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'openUrl',
-                'payload': {'url': url}
-            }))
+        self.plugin.send({
+            'event': 'openUrl',
+            'payload': {'url': url}
+        })
     
     def show_ok(self):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'showOk',
-                'context': self.context
-            }))
+        self.plugin.send({
+            'event': 'showOk',
+            'context': self.context
+        })
     
     def show_alert(self):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'showAlert',
-                'context': self.context
-            }))
+        self.plugin.send({
+            'event': 'showAlert',
+            'context': self.context
+        })
     
     def set_image(self, url: str):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'setImage',
-                'context': self.context,
-                'payload': {'target': 0, 'image': url}
-            }))
+        self._render_frame('setImage', url, {'target': 0, 'image': url})
     
     def log_message(self, message: str):
-        if self._server:
-            self._server.send(json.dumps({
-                'event': 'logMessage',
-                'payload': {'message': message}
-            }))
+        self.plugin.send({
+            'event': 'logMessage',
+            'payload': {'message': message}
+        })
+    
+    def _render_frame(self, event: str, value: str, payload: Dict[str, Any]):
+        """Send a setTitle/setImage frame unless it is a no-op, pacing frames to ``max_fps``."""
+        max_fps = self.max_fps
+        interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        with self._render_lock:
+            frame = self._frames.setdefault(event, _Frame())
+            if value == frame.sent:
+                # Already on the device; a frame still held back would only be replaced by this one.
+                frame.pending = None
+                self._frames_suppressed += 1
+                return
+            wait = frame.sent_at + interval - time.monotonic()
+            if wait <= 0 and not frame.scheduled:
+                self._send_frame(event, frame, value, payload)
+                return
+            if frame.pending is not None:
+                self._frames_suppressed += 1
+            frame.pending = (value, payload)
+            self._frames_deferred += 1
+            if frame.scheduled:
+                return
+            frame.scheduled = True
+        self.plugin.timer.call_later(
+            max(0.0, wait) * 1000.0,
+            lambda: self._flush_frame(event),
+            key=self._frame_timer_key(event),
+        )
+    
+    def _send_frame(self, event: str, frame: _Frame, value: str, payload: Dict[str, Any]):
+        # Called with the render lock held so frames of one context are queued in order.
+        frame.sent = value
+        frame.sent_at = time.monotonic()
+        self._frames_sent += 1
+        self.plugin.send({
+            'event': event,
+            'context': self.context,
+            'payload': payload
+        })
+    
+    def _flush_frame(self, event: str):
+        with self._render_lock:
+            frame = self._frames.get(event)
+            if frame is None:
+                return
+            frame.scheduled = False
+            pending = frame.pending
+            frame.pending = None
+            if pending is not None and pending[0] != frame.sent:
+                self._send_frame(event, frame, pending[0], pending[1])
+    
+    def _frame_timer_key(self, event: str) -> str:
+        return f"action.render.{self.context}.{event}"
+    
+    def invalidate_render(self):
+        """Forget what the device shows so the next frame is sent even if unchanged (e.g. after a reconnect)."""
+        with self._render_lock:
+            for frame in self._frames.values():
+                frame.sent = None
+    
+    def dispose(self):
+        """Drop frames still held back; called once the context has disappeared."""
+        with self._render_lock:
+            events = list(self._frames)
+            for frame in self._frames.values():
+                frame.pending = None
+        for event in events:
+            self.plugin.timer.clear_interval(self._frame_timer_key(event))
+    
+    def get_render_stats(self) -> Dict[str, int]:
+        with self._render_lock:
+            return {
+                'sent': self._frames_sent,
+                'suppressed': self._frames_suppressed,
+                'deferred': self._frames_deferred,
+            }
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict
+
+from .timer import Timer
+
+
+APPLY_MODE_DEBOUNCE = "debounce"
+APPLY_MODE_THROTTLE = "throttle"
+APPLY_MODE_ADAPTIVE = "adaptive"
+APPLY_MODES = (APPLY_MODE_DEBOUNCE, APPLY_MODE_THROTTLE, APPLY_MODE_ADAPTIVE)
+
+
+class ApplyScheduler:
+    """Debounce or leading/trailing-edge throttle for keyed apply callbacks.
+
+    Both run on the plugin ``Timer`` under the caller's key, so a newer request
+    for the same key replaces one that has not fired yet. The callback is
+    expected to read the newest target when it runs.
+    """
+
+    def __init__(self, timer: Timer):
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._last_run: Dict[str, float] = {}
+        self._requests: Dict[str, int] = {}
+        self._runs: Dict[str, int] = {}
+
+    def debounce(self, key: str, delay_ms: int, fn: Callable[[], None]) -> None:
+        """Run ``fn`` once ``delay_ms`` after the last request."""
+        self._submit(key, max(50, int(delay_ms)), fn)
+
+    def throttle(self, key: str, interval_ms: int, fn: Callable[[], None]) -> None:
+        """Run ``fn`` at most once per ``interval_ms``.
+
+        The first request in a quiet period runs right away (leading edge);
+        requests inside the window collapse into one run at its end
+        (trailing edge), so the final target is always applied.
+        """
+        with self._lock:
+            last = self._last_run.get(key)
+        delay = 0.0
+        if last is not None:
+            delay = max(0.0, last + interval_ms / 1000.0 - time.monotonic()) * 1000.0
+        self._submit(key, delay, fn)
+
+    def _submit(self, key: str, delay_ms: float, fn: Callable[[], None]) -> None:
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+        def _run():
+            with self._lock:
+                self._last_run[key] = time.monotonic()
+                self._runs[key] = self._runs.get(key, 0) + 1
+            fn()
+
+        self._timer.call_later(delay_ms, _run, key=key)
+
+    def cancel(self, key: str) -> None:
+        """Drop a pending run for ``key``; a run already in progress is not interrupted."""
+        self._timer.clear_interval(key)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {key: {"requests": n, "runs": self._runs.get(key, 0)} for key, n in self._requests.items()}
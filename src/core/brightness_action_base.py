@@ -3,9 +3,14 @@ from __future__ import annotations
 from typing import Any, Dict, Optional
 
 from .action import Action
-from .brightness_hub import BrightnessHub, get_brightness_hub
+from .apply_policy import APPLY_MODE_DEBOUNCE, APPLY_MODES
+from .brightness_hub import BrightnessHub, RefreshScope, get_brightness_hub
+from .brightness_poller import REFRESH_MODE_FIXED, REFRESH_MODES
 
 
+# Titles are drawn on the Timer / WebSocket threads; past this they show the last known value.
+_TITLE_READ_TIMEOUT_S = 0.25
+
 def clamp_int(value: Any, lo: int, hi: int, default: int) -> int:
     try:
         v = int(value)
@@ -19,6 +24,14 @@ def clamp_int(value: Any, lo: int, hi: int, default: int) -> int:
 
 
 class BrightnessAction(Action):
+    def __init__(self, action: str, context: str, settings: Dict, plugin):
+        self._subscription: Optional[int] = None
+        self._subscribed_monitor_id: Optional[str] = None
+        self._subscribed_interval_ms: Optional[int] = None
+        self._subscribed_mode: Optional[str] = None
+        self._subscription_closed = False
+        super().__init__(action, context, settings, plugin)
+
     @property
     def hub(self) -> BrightnessHub:
         return get_brightness_hub(self.plugin)
@@ -31,12 +44,75 @@ class BrightnessAction(Action):
         self.settings = settings or {}
         self.refresh_title()
 
+    def on_system_did_wake_up(self, data: dict):
+        self.hub.handle_system_wake()
+        self.invalidate_render()
+        self.refresh_title()
+
+    def on_device_did_connect(self, data: dict):
+        self.hub.handle_device_connected(data.get("device"))
+        # A reconnected device shows defaults, not what was last sent.
+        self.invalidate_render()
+        self.refresh_title()
+
+    def on_device_did_disconnect(self, data: dict):
+        self.hub.handle_device_disconnected(data.get("device"))
+
     def refresh_title(self) -> None:
         return None
 
+    def depends_on(self, scope: RefreshScope) -> bool:
+        """Whether this action's title shows something in ``scope``; others skip the broadcast."""
+        return True
+
     def _get_step(self, default_step: int = 5) -> int:
         return clamp_int((self.settings or {}).get("step"), 1, 50, default_step)
 
     def _get_refresh_ms(self, default_ms: int = 3000) -> int:
         return clamp_int((self.settings or {}).get("refreshMs"), 250, 60000, default_ms)
 
+    def _get_refresh_mode(self, default_mode: str = REFRESH_MODE_FIXED) -> str:
+        # New keys get "adaptive" from the manifest defaults; keys saved before
+        # refreshMode existed keep polling at a fixed interval.
+        mode = (self.settings or {}).get("refreshMode")
+        return mode if mode in REFRESH_MODES else default_mode
+
+    def _get_apply_mode(self, default_mode: str = APPLY_MODE_DEBOUNCE) -> str:
+        mode = (self.settings or {}).get("applyMode")
+        return mode if mode in APPLY_MODES else default_mode
+
+    def _read_brightness(self, index: int) -> Optional[int]:
+        """Brightness of monitor ``index`` for display, never waiting long on the hardware."""
+        return self.hub.get_monitor_brightness(index, timeout_s=_TITLE_READ_TIMEOUT_S)
+
+    def _on_brightness_changed(self, monitor_id: Optional[str], value: Optional[int]) -> None:
+        return None
+
+    def _ensure_subscription(self, monitor_id: Optional[str]) -> None:
+        if self._subscription_closed:
+            return
+        interval_ms = self._get_refresh_ms(default_ms=3000)
+        mode = self._get_refresh_mode()
+        if self._subscription is not None and (
+            self._subscribed_monitor_id,
+            self._subscribed_interval_ms,
+            self._subscribed_mode,
+        ) == (monitor_id, interval_ms, mode):
+            return
+        self._unsubscribe()
+        self._subscribed_monitor_id = monitor_id
+        self._subscribed_interval_ms = interval_ms
+        self._subscribed_mode = mode
+        self._subscription = self.hub.subscribe_brightness(
+            monitor_id, interval_ms, self._on_brightness_changed, mode=mode
+        )
+
+    def _unsubscribe(self) -> None:
+        token = self._subscription
+        self._subscription = None
+        if token is not None:
+            self.hub.unsubscribe_brightness(token)
+
+    def _close_subscription(self) -> None:
+        self._subscription_closed = True
+        self._unsubscribe()
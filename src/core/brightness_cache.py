@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Flight:
+    def __init__(self, generation: int, writes: int):
+        self.generation = generation
+        # ``put`` count for the key when the load started; a later put makes the load stale.
+        self.writes = writes
+        self.event = threading.Event()
+        self.value: Optional[int] = None
+
+
+class BrightnessReadCache:
+    """Per-monitor brightness values with a TTL.
+
+    Concurrent ``get`` calls for the same key share one loader call
+    (single-flight). Failed reads (``None``) are not cached, and neither is a
+    read that started before a ``put`` for the same key. The last value
+    seen per key is kept apart from the TTL entries and survives
+    invalidation, so callers that cannot wait can still show something.
+    """
+
+    def __init__(self, ttl_s: float = 1.0):
+        self._lock = threading.Lock()
+        self._ttl_s = max(0.0, float(ttl_s))
+        self._values: Dict[Hashable, Tuple[int, float]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        # key -> (value, monotonic time); not cleared by ``invalidate``.
+        self._last: Dict[Hashable, Tuple[int, float]] = {}
+        # key -> number of ``put`` calls, to spot loads that started before a write.
+        self._writes: Dict[Hashable, int] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._shared = 0
+        self._timeouts = 0
+        self._stale_loads = 0
+
+    @property
+    def ttl_s(self) -> float:
+        return self._ttl_s
+
+    @ttl_s.setter
+    def ttl_s(self, value: float) -> None:
+        self._ttl_s = max(0.0, float(value))
+
+    def _begin(self, key: Hashable) -> Tuple[Optional[int], Optional[_Flight], bool]:
+        """Return ``(cached, flight, owner)``; ``cached`` is set on a fresh hit."""
+        with self._lock:
+            cached = self._values.get(key)
+            if cached is not None and time.monotonic() - cached[1] < self._ttl_s:
+                self._hits += 1
+                return cached[0], None, False
+            flight = self._flights.get(key)
+            if flight is not None:
+                self._shared += 1
+                return None, flight, False
+            self._misses += 1
+            flight = _Flight(self._generation, self._writes.get(key, 0))
+            self._flights[key] = flight
+            return None, flight, True
+
+    def _load(self, key: Hashable, flight: _Flight, loader: Callable[[], Optional[int]]) -> Optional[int]:
+        value: Optional[int] = None
+        try:
+            value = loader()
+        finally:
+            with self._lock:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+                if value is not None and self._writes.get(key, 0) != flight.writes:
+                    # A write landed while this read was on the bus; the read is older than it.
+                    self._stale_loads += 1
+                    written = self._last.get(key)
+                    value = written[0] if written is not None else None
+                elif value is not None:
+                    now = time.monotonic()
+                    self._last[key] = (int(value), now)
+                    if flight.generation == self._generation:
+                        self._values[key] = (int(value), now)
+            flight.value = value
+            flight.event.set()
+        return value
+
+    def get(self, key: Hashable, loader: Callable[[], Optional[int]]) -> Optional[int]:
+        cached, flight, owner = self._begin(key)
+        if flight is None:
+            return cached
+        if not owner:
+            flight.event.wait()
+            return flight.value
+        return self._load(key, flight, loader)
+
+    def get_within(
+        self,
+        key: Hashable,
+        loader: Callable[[], Optional[int]],
+        submit: Callable[[Callable[[], Any]], Any],
+        timeout_s: Optional[float],
+    ) -> Tuple[Optional[int], bool]:
+        """Like ``get`` but waits at most ``timeout_s``; returns ``(value, completed)``.
+
+        A new load runs through ``submit`` (e.g. an executor's ``submit``) and
+        keeps going after a timeout, so its result still lands in the cache.
+        """
+        cached, flight, owner = self._begin(key)
+        if flight is None:
+            return cached, True
+        if owner:
+            try:
+                submit(lambda: self._load(key, flight, loader))
+            except RuntimeError:
+                # Executor shut down: load on the caller's thread instead.
+                return self._load(key, flight, loader), True
+        if not flight.event.wait(timeout_s):
+            with self._lock:
+                self._timeouts += 1
+            return None, False
+        return flight.value, True
+
+    def put(self, key: Hashable, value: int) -> None:
+        with self._lock:
+            entry = (int(value), time.monotonic())
+            self._values[key] = entry
+            self._last[key] = entry
+            self._writes[key] = self._writes.get(key, 0) + 1
+
+    def peek(self, key: Hashable) -> Optional[Tuple[int, float]]:
+        with self._lock:
+            return self._values.get(key)
+
+    def last_known(self, key: Hashable) -> Optional[Tuple[int, float]]:
+        """Newest value ever stored for ``key`` with its monotonic timestamp, even if invalidated."""
+        with self._lock:
+            return self._last.get(key)
+
+    def forget(self, key: Hashable) -> None:
+        with self._lock:
+            self._values.pop(key, None)
+            self._last.pop(key, None)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._values.clear()
+            else:
+                self._values.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "shared": self._shared,
+                "timeouts": self._timeouts,
+                "stale_loads": self._stale_loads,
+                "entries": len(self._values),
+                "ttl_s": self._ttl_s,
+            }
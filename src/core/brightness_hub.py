@@ -2,11 +2,34 @@ from __future__ import annotations
 
 import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
-
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Tuple
+
+from .apply_policy import APPLY_MODE_ADAPTIVE, APPLY_MODE_DEBOUNCE, APPLY_MODE_THROTTLE, ApplyScheduler
+from .brightness_poller import REFRESH_MODE_FIXED, BrightnessPoller
+from .io_worker import create_monitor_manager
+from .known_state import KnownBrightnessModel
 from .logger import Logger
-from .monitor_control import MonitorManager
+from .monitor_control import (
+    RESULT_FAILED,
+    RESULT_OK,
+    RESULT_SKIPPED,
+    ApplyResult,
+    MonitorManager,
+    ReadResult,
+    WriteResult,
+)
+from .monitor_writer import WRITE_FAILED, WRITE_OK, WriteTicket
+from .monitor_scanner import BackgroundScanner
+from .settings_store import GlobalSettingsStore, default_mirror_path
+
+
+_SCAN_MIN_INTERVAL_S = 3.0
+_FORCED_SCAN_TIMEOUT_S = 5.0
+# Background polls give up on a slow monitor and report its last known value.
+_POLL_READ_TIMEOUT_S = 1.0
+_APPLY_ALL_DEADLINE_S = 5.0
 
 
 def _clamp_int(value: int, lo: int, hi: int) -> int:
@@ -17,24 +40,92 @@ def _clamp_int(value: int, lo: int, hi: int) -> int:
     return value
 
 
-@dataclass
+_PREVIEW_HOLD_S = 1.2
+_APPLY_ALL_TIMER_KEY = "brightness_hub.apply_all"
+_APPLY_SELECTED_TIMER_KEY = "brightness_hub.apply_selected"
+# Live apply while a dial turns: fixed throttle window, or one derived from the
+# measured write latency of the monitors involved.
+_THROTTLE_INTERVAL_MS = 150
+_ADAPTIVE_MIN_INTERVAL_MS = 50
+_ADAPTIVE_MAX_INTERVAL_MS = 1000
+# How long a confirmed brightness is trusted to skip a write of the same value.
+_KNOWN_STATE_CONFIDENCE_S = 30.0
+_HEALTH_PROBE_TIMER_KEY = "brightness_hub.health_probe"
+_HEALTH_PROBE_INTERVAL_MS = 2000
+
+
+@dataclass(frozen=True)
 class BrightnessState:
     all_brightness: int = 50
     selected_monitor_index: int = 0
+    selected_monitor_id: Optional[str] = None
+    # monitor_id -> (preview percent, wall-clock timestamp)
+    previews: Mapping[str, Tuple[int, float]] = field(default_factory=lambda: MappingProxyType({}))
+
+
+@dataclass(frozen=True)
+class RefreshScope:
+    """What changed, so ``broadcast_refresh`` only redraws actions that show it.
+
+    ``monitor_ids=None`` means every monitor.
+    """
+
+    all_value: bool = False
+    selection: bool = False
+    monitor_ids: Optional[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def monitors(cls, monitor_ids: Optional[Iterable[Optional[str]]] = None) -> 'RefreshScope':
+        if monitor_ids is None:
+            return cls(monitor_ids=None)
+        return cls(monitor_ids=frozenset(m for m in monitor_ids if m))
+
+    def touches_monitor(self, monitor_id: Optional[str]) -> bool:
+        return self.monitor_ids is None or (monitor_id is not None and monitor_id in self.monitor_ids)
+
+
+REFRESH_ALL_VALUE = RefreshScope(all_value=True)
+REFRESH_SELECTION = RefreshScope(selection=True)
+# "All" changed and was written to every monitor.
+REFRESH_ALL_APPLIED = RefreshScope(all_value=True, monitor_ids=None)
 
 
 class BrightnessHub:
-    def __init__(self, plugin):
+    def __init__(
+        self,
+        plugin,
+        read_cache_ttl_s: float = 1.0,
+        manager: Optional[MonitorManager] = None,
+        settings_store: Optional[GlobalSettingsStore] = None,
+    ):
         self._plugin = plugin
-        self._lock = threading.RLock()
-        self._manager = MonitorManager()
+        # Only guards swapping in a new state snapshot; never held across backend I/O.
+        self._lock = threading.Lock()
+        self._manager = manager or create_monitor_manager(read_cache_ttl_s=read_cache_ttl_s)
         self._state = BrightnessState()
-        self._last_scan_ts = 0.0
-        self._apply_all_timer: Optional[threading.Timer] = None
-        self._apply_selected_timer: Optional[threading.Timer] = None
+        self._known = KnownBrightnessModel(confidence_s=_KNOWN_STATE_CONFIDENCE_S)
+        self._manager.add_write_listener(self._on_write_settled)
+        self._scanner = BackgroundScanner(self._scan_and_publish, min_interval_s=_SCAN_MIN_INTERVAL_S)
+        self._poller = BrightnessPoller(
+            plugin.timer,
+            lambda monitor_id: self.get_monitor_brightness_by_id(monitor_id, timeout_s=_POLL_READ_TIMEOUT_S),
+            on_tick=lambda: self.scan(force=False),
+            on_resync=self.handle_system_wake,
+        )
+        self._apply = ApplyScheduler(plugin.timer)
+        self._last_wake_ts = 0.0
+        self._connected_devices: set = set()
+        self._devices_paused = False
         self._saved_global_loaded = False
-        self._brightness_preview: Dict[int, tuple[int, float]] = {}
-
+        self._settings = settings_store or GlobalSettingsStore(
+            plugin.timer, self._send_global_settings, mirror_path=default_mirror_path()
+        )
+        plugin.add_shutdown_hook(self.flush_global_settings)
+
+        # The local mirror covers a host that never answers getGlobalSettings.
+        mirrored = self._settings.load_mirror()
+        if mirrored:
+            self.load_global_settings(mirrored)
         try:
             self._plugin.get_global_settings()
         except Exception:
@@ -42,177 +133,501 @@ class BrightnessHub:
 
         self.scan(force=True)
         self._init_all_from_first_monitor_if_needed()
+        plugin.timer.set_interval(_HEALTH_PROBE_TIMER_KEY, _HEALTH_PROBE_INTERVAL_MS, self._probe_quarantined)
+
+    @property
+    def state(self) -> BrightnessState:
+        return self._state
 
-    def scan(self, force: bool = False) -> None:
+    def _update_state(self, fn: Callable[[BrightnessState], BrightnessState]) -> BrightnessState:
+        with self._lock:
+            self._state = fn(self._state)
+            return self._state
+
+    def scan(self, force: bool = False, timeout_s: Optional[float] = _FORCED_SCAN_TIMEOUT_S) -> bool:
+        """Request a monitor scan on the background scanner.
+
+        A throttled request returns immediately. A forced request waits up to
+        ``timeout_s`` for a fresh scan to complete (``0`` returns immediately)
+        and reports whether it did.
+        """
+        ticket = self._scanner.request(force=force)
+        if not force or (timeout_s is not None and timeout_s <= 0):
+            return True
+        return self._scanner.wait(ticket, timeout_s)
+
+    def _scan_and_publish(self) -> None:
+        before = self._manager.snapshot()
+        self._manager.scan()
+        after = self._manager.snapshot()
+        # The first scan runs while the hub is still being built; actions render themselves then.
+        if before.generation > 0 and after.ids != before.ids:
+            self.broadcast_refresh()
+
+    def subscribe_brightness(
+        self,
+        monitor_id: Optional[str],
+        interval_ms: int,
+        callback: Callable[[Optional[str], Optional[int]], None],
+        mode: str = REFRESH_MODE_FIXED,
+    ) -> int:
+        return self._poller.subscribe(monitor_id, interval_ms, callback, mode=mode)
+
+    def unsubscribe_brightness(self, token: Optional[int]) -> None:
+        self._poller.unsubscribe(token)
+
+    def get_poll_stats(self) -> Dict[str, Any]:
+        return self._poller.stats()
+
+    def note_interaction(self, monitor_id: Optional[str] = None) -> None:
+        """Poll adaptive subscribers of ``monitor_id`` (or every monitor) fast for a while."""
+        self._poller.note_activity(monitor_id)
+
+    def handle_device_connected(self, device: Optional[str]) -> None:
+        with self._lock:
+            self._connected_devices.add(device)
+            resume = self._devices_paused
+            self._devices_paused = False
+        if resume:
+            Logger.info("StreamDock device connected; resuming brightness polling")
+            self._poller.resume()
+
+    def handle_device_disconnected(self, device: Optional[str]) -> None:
+        with self._lock:
+            self._connected_devices.discard(device)
+            pause = not self._connected_devices and not self._devices_paused
+            if pause:
+                self._devices_paused = True
+        if pause:
+            Logger.info("No StreamDock device connected; pausing brightness polling")
+            self._poller.pause()
+
+    def invalidate_brightness_cache(self) -> None:
+        self._manager.invalidate_cache()
+        self._known.invalidate()
+
+    def _on_write_settled(self, ticket: WriteTicket) -> None:
+        if ticket.status == WRITE_OK:
+            self._known.confirm(ticket.monitor_id, ticket.percent)
+        elif ticket.status == WRITE_FAILED:
+            self._known.invalidate(ticket.monitor_id)
+
+    def _skip_write(self, monitor_id: Optional[str], percent: int, force: bool) -> bool:
+        # While a write is in flight the model lags the hardware, so it cannot vouch for it.
+        if monitor_id is None or self._manager.is_writing(monitor_id):
+            return False
+        return self._known.should_skip(monitor_id, percent, force=force)
+
+    def _probe_quarantined(self) -> None:
+        recovered = self._manager.probe_quarantined()
+        if recovered:
+            for monitor_id in recovered:
+                self._known.invalidate(monitor_id)
+            self.broadcast_refresh(RefreshScope.monitors(recovered))
+
+    def get_health_stats(self) -> Dict[str, Any]:
+        return self._manager.get_health_stats()
+
+    def get_known_state_stats(self) -> Dict[str, Any]:
+        return self._known.stats()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        return self._manager.read_cache.stats()
+
+    def handle_system_wake(self) -> None:
         with self._lock:
             now = time.time()
-            if not force and now - self._last_scan_ts < 3.0:
+            if now - self._last_wake_ts < 1.0:
                 return
-            self._manager.scan()
-            self._last_scan_ts = now
+            self._last_wake_ts = now
+            self._state = replace(self._state, previews=MappingProxyType({}))
+            devices_paused = self._devices_paused
+        self.invalidate_brightness_cache()
+        self.scan(force=True, timeout_s=0)
+        if not devices_paused:
+            self._poller.resume()
 
     def _init_all_from_first_monitor_if_needed(self) -> None:
+        if self._saved_global_loaded:
+            return
+        try:
+            current = self._manager.get_brightness_percent(0)
+        except Exception:
+            return
+        if current is None:
+            return
         with self._lock:
-            if self._saved_global_loaded:
-                return
-            try:
-                current = self._manager.get_brightness_percent(0)
-                if current is not None:
-                    self._state.all_brightness = int(current)
-            except Exception:
-                pass
+            if not self._saved_global_loaded:
+                self._state = replace(self._state, all_brightness=int(current))
 
     def load_global_settings(self, settings: Any) -> None:
         if not isinstance(settings, dict):
             return
+        all_b = settings.get("allBrightness")
+        sel = settings.get("selectedMonitorIndex")
+        sel_id = settings.get("selectedMonitorId")
+        changes: Dict[str, Any] = {}
+        if isinstance(all_b, (int, float)):
+            changes["all_brightness"] = _clamp_int(int(all_b), 0, 100)
+        if isinstance(sel, (int, float)):
+            changes["selected_monitor_index"] = max(0, int(sel))
+        if isinstance(sel_id, str) and sel_id:
+            changes["selected_monitor_id"] = sel_id
         with self._lock:
-            all_b = settings.get("allBrightness")
-            sel = settings.get("selectedMonitorIndex")
-            if isinstance(all_b, (int, float)):
-                self._state.all_brightness = _clamp_int(int(all_b), 0, 100)
-            if isinstance(sel, (int, float)):
-                self._state.selected_monitor_index = max(0, int(sel))
+            self._state = replace(self._state, **changes)
             self._saved_global_loaded = True
+        self._settings.note_persisted(settings)
 
     def save_global_settings(self) -> None:
-        with self._lock:
-            payload = {
-                "allBrightness": int(self._state.all_brightness),
-                "selectedMonitorIndex": int(self._state.selected_monitor_index),
-            }
+        """Mark the shared state for saving; the store flushes it once changes settle."""
+        state = self._state
+        payload = {
+            "allBrightness": int(state.all_brightness),
+            "selectedMonitorIndex": int(self.get_selected_monitor_index()),
+        }
+        if state.selected_monitor_id:
+            payload["selectedMonitorId"] = state.selected_monitor_id
+        self._settings.update(payload)
+
+    def flush_global_settings(self) -> bool:
+        """Save pending changes now (e.g. on shutdown); ``False`` if there were none."""
+        return self._settings.flush()
+
+    def _send_global_settings(self, payload: Dict[str, Any]) -> None:
         try:
             self._plugin.set_global_settings(payload)
         except Exception:
             pass
 
+    def get_settings_stats(self) -> Dict[str, Any]:
+        return self._settings.stats()
+
     def get_all_brightness(self) -> int:
-        with self._lock:
-            return int(self._state.all_brightness)
+        return int(self._state.all_brightness)
 
     def set_all_brightness_preview(self, percent: int) -> int:
-        with self._lock:
-            self._state.all_brightness = _clamp_int(int(percent), 0, 100)
-            return int(self._state.all_brightness)
+        value = _clamp_int(int(percent), 0, 100)
+        self._update_state(lambda st: replace(st, all_brightness=value))
+        self.note_interaction()
+        return value
 
     def get_selected_monitor_index(self) -> int:
-        with self._lock:
-            self._state.selected_monitor_index = max(0, int(self._state.selected_monitor_index))
-            return int(self._state.selected_monitor_index)
+        state = self._state
+        # The stable ID wins over the stored index when the enumeration order moved.
+        idx = self._manager.index_of(state.selected_monitor_id)
+        if idx >= 0:
+            return idx
+        return max(0, int(state.selected_monitor_index))
+
+    def get_selected_monitor_id(self) -> Optional[str]:
+        return self._state.selected_monitor_id
 
     def set_selected_monitor_index(self, index: int) -> int:
-        with self._lock:
-            self._state.selected_monitor_index = max(0, int(index))
-            return int(self._state.selected_monitor_index)
+        idx = max(0, int(index))
+        monitor_id = self._manager.get_monitor_id(idx)
+
+        def _select(st: BrightnessState) -> BrightnessState:
+            return replace(st, selected_monitor_index=idx, selected_monitor_id=monitor_id or st.selected_monitor_id)
+
+        self._update_state(_select)
+        if monitor_id:
+            self.note_interaction(monitor_id)
+        return idx
 
     def cycle_selected_monitor(self, delta: int = 1) -> int:
-        with self._lock:
-            count = len(self._manager.get_monitors())
-            if count <= 0:
-                self._state.selected_monitor_index = 0
-                return 0
-            cur = self._state.selected_monitor_index % count
-            nxt = (cur + delta) % count
-            self._state.selected_monitor_index = nxt
-            return int(nxt)
+        count = self.get_monitor_count()
+        if count <= 0:
+            self._update_state(lambda st: replace(st, selected_monitor_index=0))
+            return 0
+        cur = self.get_selected_monitor_index() % count
+        return self.set_selected_monitor_index((cur + delta) % count)
 
-    def get_monitor_count(self) -> int:
-        with self._lock:
-            return len(self._manager.get_monitors())
+    def get_monitor_id(self, index: int) -> Optional[str]:
+        return self._manager.get_monitor_id(int(index))
 
-    def get_monitor_brightness(self, index: int) -> Optional[int]:
-        with self._lock:
-            idx = int(index)
-            preview = self._brightness_preview.get(idx)
-            if preview:
-                value, ts = preview
-                if time.time() - ts < 1.2:
-                    return int(value)
-                self._brightness_preview.pop(idx, None)
-            return self._manager.get_brightness_percent(idx)
+    def get_monitor_index(self, monitor_id: Optional[str]) -> int:
+        return self._manager.index_of(monitor_id)
+
+    def get_monitor_count(self) -> int:
+        return len(self._manager.snapshot().monitors)
+
+    def read_monitor_brightness(self, index: int, timeout_s: Optional[float] = None) -> ReadResult:
+        """Current brightness of monitor ``index``, waiting at most ``timeout_s`` for hardware.
+
+        A live preview counts as ``ok``. On a timeout the result is ``stale``
+        with the last known value, if any (see ``MonitorManager.read_brightness``).
+        """
+        idx = int(index)
+        monitor_id = self._manager.get_monitor_id(idx)
+        preview = self._state.previews.get(monitor_id) if monitor_id else None
+        if preview:
+            value, ts = preview
+            if time.time() - ts < _PREVIEW_HOLD_S:
+                return ReadResult(monitor_id, int(value), RESULT_OK)
+        result = self._manager.read_brightness(idx, timeout_s)
+        if result.ok and monitor_id and not self._manager.is_writing(monitor_id):
+            self._known.observe(monitor_id, result.value)
+        return result
+
+    def get_monitor_brightness(self, index: int, timeout_s: Optional[float] = None) -> Optional[int]:
+        """Like ``read_monitor_brightness`` but returns the (possibly stale) value only."""
+        return self.read_monitor_brightness(index, timeout_s).value
+
+    def get_monitor_brightness_by_id(self, monitor_id: str, timeout_s: Optional[float] = None) -> Optional[int]:
+        idx = self._manager.index_of(monitor_id)
+        if idx < 0:
+            return None
+        return self.get_monitor_brightness(idx, timeout_s)
 
     def set_monitor_brightness_preview(self, index: int, percent: int) -> int:
-        with self._lock:
-            idx = int(index)
-            value = _clamp_int(int(percent), 0, 100)
-            self._brightness_preview[idx] = (value, time.time())
+        value = _clamp_int(int(percent), 0, 100)
+        monitor_id = self._manager.get_monitor_id(int(index))
+        if not monitor_id:
             return value
-
-    def set_monitor_brightness_now(self, index: int, percent: int) -> bool:
-        self.scan(force=False)
-        ok = self._manager.set_brightness_percent(int(index), int(percent))
-        if not ok:
-            self.scan(force=True)
-            ok = self._manager.set_brightness_percent(int(index), int(percent))
+        now = time.time()
+
+        def _preview(st: BrightnessState) -> BrightnessState:
+            previews = {k: v for k, v in st.previews.items() if now - v[1] < _PREVIEW_HOLD_S}
+            previews[monitor_id] = (value, now)
+            return replace(st, previews=MappingProxyType(previews))
+
+        self._update_state(_preview)
+        self.note_interaction(monitor_id)
+        return value
+
+    def _recover_monitor(self, monitor_id: Optional[str]) -> bool:
+        """Re-open just ``monitor_id`` after a failure; rescan only if it cannot be resolved."""
+        if not monitor_id:
+            return False
+        started = time.monotonic()
+        if self._manager.reopen_monitor(monitor_id):
+            Logger.info(f"Re-opened {monitor_id} in {(time.monotonic() - started) * 1000.0:.0f}ms")
+            return True
+        ok = self.scan(force=True) and self._manager.index_of(monitor_id) >= 0
+        outcome = "recovered" if ok else "not found"
+        Logger.info(
+            f"Could not re-open {monitor_id}; full rescan {outcome} in {(time.monotonic() - started) * 1000.0:.0f}ms"
+        )
         return ok
 
-    def apply_all_now(self) -> int:
+    def write_monitor_brightness(
+        self,
+        index: int,
+        percent: int,
+        timeout_s: Optional[float] = None,
+        force: bool = False,
+    ) -> WriteResult:
+        """Write monitor ``index`` and wait at most ``timeout_s`` (per attempt) for the hardware.
+
+        A failed write re-opens the monitor and retries once; a timed-out one
+        is not retried since it may still land.
+        """
+        self.scan(force=False)
+        percent = _clamp_int(int(percent), 0, 100)
+        monitor_id = self._manager.get_monitor_id(int(index))
+        if self._skip_write(monitor_id, percent, force):
+            return WriteResult(monitor_id, percent, RESULT_SKIPPED)
+        if self._manager.is_quarantined(monitor_id):
+            return WriteResult(monitor_id, percent, RESULT_FAILED)
+        result = self._manager.write_brightness(int(index), percent, timeout_s)
+        if (
+            result.status == WRITE_FAILED
+            and not self._manager.is_quarantined(monitor_id)
+            and self._recover_monitor(monitor_id)
+        ):
+            result = self._manager.write_brightness(self._manager.index_of(monitor_id), percent, timeout_s)
+        return result
+
+    def set_monitor_brightness_now(
+        self,
+        index: int,
+        percent: int,
+        force: bool = False,
+        timeout_s: Optional[float] = None,
+    ) -> bool:
+        return self.write_monitor_brightness(index, percent, timeout_s, force=force).ok
+
+    def apply_all_now(self, force: bool = False, deadline_s: float = _APPLY_ALL_DEADLINE_S) -> ApplyResult:
+        """Write ``all_brightness`` to every monitor not already known to be there.
+
+        Writes not finished within ``deadline_s`` are reported as timed out and,
+        if they had not started yet, cancelled.
+        """
         self.scan(force=False)
         target = self.get_all_brightness()
-        ok_count = self._manager.set_all_brightness_percent(target)
-        if ok_count <= 0:
-            self.scan(force=True)
-            ok_count = self._manager.set_all_brightness_percent(target)
-        return ok_count
+        skip = {mid for mid in self._manager.get_monitor_ids() if self._skip_write(mid, target, force)}
+        result = self._manager.apply_all_brightness_percent(target, deadline_s=deadline_s, skip_ids=skip)
+        # Quarantined monitors are expected to fail and a timed-out write may still
+        # land; only outright failures are re-opened and retried once.
+        failed = [r.monitor_id for r in result.monitors if not (r.ok or r.quarantined or r.timed_out)]
+        retry = {mid for mid in failed if self._recover_monitor(mid)}
+        if retry:
+            others = set(self._manager.get_monitor_ids()) - retry
+            retried = self._manager.apply_all_brightness_percent(target, deadline_s=deadline_s, skip_ids=others)
+            fresh = {r.monitor_id: r for r in retried.monitors if r.monitor_id in retry}
+            result.monitors = [fresh.get(r.monitor_id, r) for r in result.monitors]
+            result.elapsed_ms += retried.elapsed_ms
+        for r in result.monitors:
+            if not r.ok and not r.quarantined:
+                reason = "timed out" if r.timed_out else "failed"
+                Logger.error(f"Apply brightness {reason} on monitor {r.index} ({r.backend}): {r.latency_ms:.0f}ms")
+        return result
+
+    def _schedule_apply(
+        self,
+        key: str,
+        mode: str,
+        delay_ms: int,
+        monitor_id: Optional[str],
+        fn: Callable[[], None],
+    ) -> None:
+        if mode == APPLY_MODE_THROTTLE:
+            self._apply.throttle(key, _THROTTLE_INTERVAL_MS, fn)
+        elif mode == APPLY_MODE_ADAPTIVE:
+            latency = self._manager.get_write_latency_ms(monitor_id)
+            interval = _THROTTLE_INTERVAL_MS if latency is None else int(latency)
+            self._apply.throttle(key, _clamp_int(interval, _ADAPTIVE_MIN_INTERVAL_MS, _ADAPTIVE_MAX_INTERVAL_MS), fn)
+        else:
+            self._apply.debounce(key, delay_ms, fn)
+
+    def schedule_apply_all(self, delay_ms: int = 350, mode: str = APPLY_MODE_DEBOUNCE) -> None:
+        """Apply ``all_brightness`` to every monitor according to ``mode``.
+
+        Debounce runs one synchronised ``apply_all_now`` after the dial settles.
+        Throttle/adaptive hand the current target to each monitor's writer while
+        the dial is still turning, without waiting for the hardware.
+        """
+        if mode in (APPLY_MODE_THROTTLE, APPLY_MODE_ADAPTIVE):
 
-    def schedule_apply_all(self, delay_ms: int = 350) -> None:
-        with self._lock:
-            if self._apply_all_timer:
+            def _run():
                 try:
-                    self._apply_all_timer.cancel()
-                except Exception:
-                    pass
-                self._apply_all_timer = None
+                    target = self.get_all_brightness()
+                    for idx in range(self.get_monitor_count()):
+                        self.submit_monitor_brightness(idx, target)
+                except Exception as e:
+                    Logger.error(f"Apply all brightness failed: {e}")
+
+        else:
 
             def _run():
                 try:
                     self.apply_all_now()
-                    self.broadcast_refresh()
+                    self.broadcast_refresh(RefreshScope.monitors())
                 except Exception as e:
                     Logger.error(f"Apply all brightness failed: {e}")
 
-            t = threading.Timer(max(0.05, delay_ms / 1000.0), _run)
-            t.daemon = True
-            self._apply_all_timer = t
-            t.start()
-
-    def schedule_apply_selected(self, delay_ms: int = 180, percent: Optional[int] = None) -> None:
-        with self._lock:
-            if self._apply_selected_timer:
-                try:
-                    self._apply_selected_timer.cancel()
-                except Exception:
-                    pass
-                self._apply_selected_timer = None
-
-            idx = self.get_selected_monitor_index()
-            if percent is None:
-                current = self.get_monitor_brightness(idx)
-                if current is None:
+        self._schedule_apply(_APPLY_ALL_TIMER_KEY, mode, delay_ms, None, _run)
+
+    def get_apply_stats(self) -> Dict[str, Any]:
+        return self._apply.stats()
+
+    def submit_monitor_brightness(
+        self,
+        index: int,
+        percent: int,
+        on_complete: Optional[Callable[[WriteTicket], None]] = None,
+        force: bool = False,
+    ) -> Optional[WriteTicket]:
+        """Queue a write on the monitor's writer; newer targets replace pending ones.
+
+        A failed write triggers one rescan and a resubmit. ``on_complete`` gets
+        the final ticket; the UI is refreshed once the write settles either way.
+        Both run on the timer's executor, never on the monitor's writer thread,
+        so a slow recovery or redraw does not hold up that monitor's next write.
+        Returns ``None`` (without calling ``on_complete``) when the monitor is
+        already known to be at ``percent`` and ``force`` is not set.
+        """
+        idx = int(index)
+        percent = _clamp_int(int(percent), 0, 100)
+        monitor_id = self._manager.get_monitor_id(idx)
+        if self._skip_write(monitor_id, percent, force):
+            return None
+
+        def _retry(ticket: WriteTicket) -> None:
+            if ticket.status == WRITE_FAILED and self._recover_monitor(monitor_id):
+                target = self._manager.index_of(monitor_id)
+                resubmitted = None
+                if target >= 0:
+                    resubmitted = self._manager.submit_brightness_percent(
+                        target, percent, on_complete=lambda t: self._off_writer(_done, t)
+                    )
+                if resubmitted is not None:
                     return
-                percent = int(current)
-            percent = _clamp_int(int(percent), 0, 100)
+            _done(ticket)
+
+        def _done(ticket: WriteTicket) -> None:
+            if ticket.status == WRITE_FAILED:
+                Logger.error(f"Set brightness failed on {ticket.monitor_id}")
+            if on_complete is not None:
+                on_complete(ticket)
+            # Superseded/cancelled writes leave the refresh to the write that replaced them.
+            if ticket.status in (WRITE_OK, WRITE_FAILED):
+                self.broadcast_refresh(RefreshScope.monitors([ticket.monitor_id]))
+
+        return self._manager.submit_brightness_percent(
+            idx, percent, on_complete=lambda t: self._off_writer(_retry, t)
+        )
+
+    def _off_writer(self, fn: Callable[[WriteTicket], None], ticket: WriteTicket) -> None:
+        # Write callbacks fire on the writer's drain thread; move the work elsewhere.
+        self._plugin.timer.call_later(0, lambda: fn(ticket))
+
+    def cancel_pending_writes(self, monitor_id: Optional[str] = None) -> int:
+        """Drop queued writes for ``monitor_id`` (or all monitors), including scheduled applies.
+
+        Writes already running on the hardware finish. Returns how many queued
+        writes were cancelled.
+        """
+        if monitor_id is None:
+            self._apply.cancel(_APPLY_ALL_TIMER_KEY)
+            self._apply.cancel(_APPLY_SELECTED_TIMER_KEY)
+        elif monitor_id == self.get_monitor_id(self.get_selected_monitor_index()):
+            self._apply.cancel(_APPLY_SELECTED_TIMER_KEY)
+        return self._manager.cancel_pending_writes(monitor_id)
+
+    def get_writer_stats(self) -> Dict[str, Any]:
+        return self._manager.get_writer_stats()
+
+    def get_bus_stats(self) -> Dict[str, Any]:
+        return self._manager.get_bus_stats()
+
+    def schedule_apply_selected(
+        self,
+        delay_ms: int = 180,
+        percent: Optional[int] = None,
+        mode: str = APPLY_MODE_DEBOUNCE,
+    ) -> None:
+        idx = self.get_selected_monitor_index()
+        if percent is None:
+            current = self.get_monitor_brightness(idx)
+            if current is None:
+                return
+            percent = int(current)
+        percent = _clamp_int(int(percent), 0, 100)
+        monitor_id = self._manager.get_monitor_id(idx)
 
-            def _run():
-                try:
-                    self.set_monitor_brightness_now(idx, percent)
-                    self.broadcast_refresh()
-                except Exception as e:
-                    Logger.error(f"Apply selected brightness failed: {e}")
+        def _run():
+            try:
+                target = self._manager.index_of(monitor_id)
+                self.submit_monitor_brightness(target if target >= 0 else idx, percent)
+            except Exception as e:
+                Logger.error(f"Apply selected brightness failed: {e}")
 
-            t = threading.Timer(max(0.05, delay_ms / 1000.0), _run)
-            t.daemon = True
-            self._apply_selected_timer = t
-            t.start()
+        self._schedule_apply(_APPLY_SELECTED_TIMER_KEY, mode, delay_ms, monitor_id, _run)
 
-    def broadcast_refresh(self) -> None:
+    def broadcast_refresh(self, scope: Optional[RefreshScope] = None) -> None:
+        """Call ``refresh_title`` on actions that depend on ``scope`` (all actions when ``None``)."""
         try:
             actions = list(getattr(self._plugin, "actions", {}).values())
         except Exception:
             actions = []
         for a in actions:
             try:
-                if hasattr(a, "refresh_title"):
-                    a.refresh_title()
+                if not hasattr(a, "refresh_title"):
+                    continue
+                if scope is not None and hasattr(a, "depends_on") and not a.depends_on(scope):
+                    continue
+                a.refresh_title()
             except Exception:
                 continue
 
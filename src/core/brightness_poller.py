@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from .logger import Logger
+from .timer import Timer
+
+
+_UNSET = object()
+
+REFRESH_MODE_FIXED = "fixed"
+REFRESH_MODE_ADAPTIVE = "adaptive"
+REFRESH_MODES = (REFRESH_MODE_FIXED, REFRESH_MODE_ADAPTIVE)
+
+# Adaptive cadence: poll fast for a while after an interaction or a detected
+# change, then double the interval on every unchanged poll up to the cap.
+_FAST_INTERVAL_MS = 500
+_FAST_WINDOW_S = 5.0
+_BACKOFF_FACTOR = 8
+_MAX_INTERVAL_MS = 60000
+# A poll firing this much later than planned means the machine was suspended.
+_SLEEP_GAP_S = 10.0
+
+
+@dataclass
+class _Subscription:
+    token: int
+    monitor_id: Optional[str]
+    interval_ms: int
+    mode: str
+    callback: Callable[[Optional[str], Optional[int]], None]
+
+
+@dataclass
+class _Loop:
+    monitor_id: Optional[str]
+    due: float = 0.0
+    scheduled: bool = False
+    fast_until: float = 0.0
+    backoff_ms: Optional[int] = None
+    last: Any = _UNSET
+    polls: int = 0
+
+
+class BrightnessPoller:
+    """One poll loop per monitor, shared by every subscriber of that monitor.
+
+    Each loop runs at the fastest cadence any of its subscribers asks for and
+    pushes a value to subscribers only when it differs from the last one seen.
+    Fixed subscribers poll at their interval; adaptive ones poll fast after
+    activity and back off exponentially while the value stays the same.
+    A ``None`` monitor ID subscribes to the tick only (e.g. to notice monitors
+    appearing while none are connected).
+    """
+
+    def __init__(
+        self,
+        timer: Timer,
+        read_fn: Callable[[str], Optional[int]],
+        on_tick: Optional[Callable[[], None]] = None,
+        on_resync: Optional[Callable[[], None]] = None,
+    ):
+        self._timer = timer
+        self._read_fn = read_fn
+        self._on_tick = on_tick
+        self._on_resync = on_resync
+        self._lock = threading.Lock()
+        self._tokens = itertools.count(1)
+        self._subs: Dict[int, _Subscription] = {}
+        self._loops: Dict[Optional[str], _Loop] = {}
+        self._paused = False
+        self._total_polls = 0
+
+    @staticmethod
+    def _timer_key(monitor_id: Optional[str]) -> str:
+        return f"brightness_poller.{monitor_id or '-'}"
+
+    def subscribe(
+        self,
+        monitor_id: Optional[str],
+        interval_ms: int,
+        callback: Callable[[Optional[str], Optional[int]], None],
+        mode: str = REFRESH_MODE_FIXED,
+    ) -> int:
+        if mode not in REFRESH_MODES:
+            mode = REFRESH_MODE_FIXED
+        with self._lock:
+            token = next(self._tokens)
+            self._subs[token] = _Subscription(token, monitor_id, max(50, int(interval_ms)), mode, callback)
+            loop = self._loops.get(monitor_id)
+            if loop is None:
+                loop = self._loops[monitor_id] = _Loop(monitor_id)
+            self._schedule_locked(loop, self._interval_locked(loop, time.monotonic()), sooner_only=True)
+        return token
+
+    def unsubscribe(self, token: Optional[int]) -> None:
+        if token is None:
+            return
+        with self._lock:
+            sub = self._subs.pop(token, None)
+            if sub is None:
+                return
+            if any(s.monitor_id == sub.monitor_id for s in self._subs.values()):
+                return
+            self._loops.pop(sub.monitor_id, None)
+            self._timer.clear_interval(self._timer_key(sub.monitor_id))
+
+    def note_activity(self, monitor_id: Optional[str] = None) -> None:
+        """Switch adaptive loops to the fast cadence; ``None`` means every monitor."""
+        now = time.monotonic()
+        with self._lock:
+            for loop in self._loops.values():
+                if monitor_id is not None and loop.monitor_id != monitor_id:
+                    continue
+                loop.fast_until = now + _FAST_WINDOW_S
+                loop.backoff_ms = None
+                self._schedule_locked(loop, self._interval_locked(loop, now), sooner_only=True)
+
+    def pause(self) -> None:
+        with self._lock:
+            if self._paused:
+                return
+            self._paused = True
+            for loop in self._loops.values():
+                loop.scheduled = False
+                self._timer.clear_interval(self._timer_key(loop.monitor_id))
+
+    def resume(self) -> None:
+        """Resume polling and resync every loop right away at the fast cadence."""
+        now = time.monotonic()
+        with self._lock:
+            self._paused = False
+            for loop in self._loops.values():
+                loop.fast_until = now + _FAST_WINDOW_S
+                loop.backoff_ms = None
+                loop.last = _UNSET
+                self._schedule_locked(loop, 0, sooner_only=False)
+
+    def _interval_locked(self, loop: _Loop, now: float) -> int:
+        subs = [s for s in self._subs.values() if s.monitor_id == loop.monitor_id]
+        candidates = [s.interval_ms for s in subs if s.mode == REFRESH_MODE_FIXED]
+        adaptive = [s.interval_ms for s in subs if s.mode == REFRESH_MODE_ADAPTIVE]
+        if adaptive:
+            base = min(adaptive)
+            if now < loop.fast_until:
+                candidates.append(min(base, _FAST_INTERVAL_MS))
+            else:
+                candidates.append(loop.backoff_ms or base)
+        if not candidates:
+            return _MAX_INTERVAL_MS
+        return min(candidates)
+
+    def _schedule_locked(self, loop: _Loop, delay_ms: int, sooner_only: bool) -> None:
+        if self._paused:
+            return
+        due = time.monotonic() + delay_ms / 1000.0
+        if sooner_only and loop.scheduled and loop.due <= due:
+            return
+        loop.due = due
+        loop.scheduled = True
+        monitor_id = loop.monitor_id
+        self._timer.call_later(delay_ms, lambda: self._poll(monitor_id), key=self._timer_key(monitor_id))
+
+    def _poll(self, monitor_id: Optional[str]) -> None:
+        with self._lock:
+            loop = self._loops.get(monitor_id)
+            if loop is None or self._paused:
+                return
+            loop.scheduled = False
+            slept = time.monotonic() - loop.due > _SLEEP_GAP_S
+
+        if slept:
+            Logger.info("Brightness polling resumed after a suspend gap; resyncing")
+            if self._on_resync is not None:
+                try:
+                    self._on_resync()
+                except Exception as e:
+                    Logger.error(f"Poll resync failed: {e}")
+
+        if self._on_tick is not None:
+            try:
+                self._on_tick()
+            except Exception as e:
+                Logger.error(f"Poll tick failed: {e}")
+
+        value: Optional[int] = None
+        if monitor_id is not None:
+            try:
+                value = self._read_fn(monitor_id)
+            except Exception as e:
+                Logger.error(f"Brightness poll failed: {e}")
+
+        callbacks = []
+        with self._lock:
+            if self._loops.get(monitor_id) is not loop:
+                return
+            now = time.monotonic()
+            if monitor_id is not None:
+                loop.polls += 1
+                self._total_polls += 1
+                if loop.last is _UNSET or loop.last != value:
+                    if loop.last is not _UNSET:
+                        # Changed behind our back (e.g. the monitor's own OSD): poll fast for a while.
+                        loop.fast_until = now + _FAST_WINDOW_S
+                        loop.backoff_ms = None
+                    loop.last = value
+                    callbacks = [s.callback for s in self._subs.values() if s.monitor_id == monitor_id]
+            if now >= loop.fast_until:
+                adaptive = [
+                    s.interval_ms
+                    for s in self._subs.values()
+                    if s.monitor_id == monitor_id and s.mode == REFRESH_MODE_ADAPTIVE
+                ]
+                if adaptive:
+                    base = min(adaptive)
+                    cap = min(_MAX_INTERVAL_MS, base * _BACKOFF_FACTOR)
+                    loop.backoff_ms = base if loop.backoff_ms is None else min(cap, loop.backoff_ms * 2)
+            if not loop.scheduled:
+                self._schedule_locked(loop, self._interval_locked(loop, now), sooner_only=False)
+
+        for cb in callbacks:
+            try:
+                cb(monitor_id, value)
+            except Exception as e:
+                Logger.error(f"Brightness subscriber failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "subscriptions": len(self._subs),
+                "paused": self._paused,
+                "total_polls": self._total_polls,
+                "loops": {
+                    str(loop.monitor_id): {
+                        "interval_ms": self._interval_locked(loop, now),
+                        "polls": loop.polls,
+                        "fast": now < loop.fast_until,
+                    }
+                    for loop in self._loops.values()
+                },
+            }
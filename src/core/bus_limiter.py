@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+
+class BusBusyError(TimeoutError):
+    """A command gave up waiting for the bus; says nothing about the monitor itself."""
+
+
+class BusLimiter:
+    """Gate for one DDC/CI bus: one command at a time with a minimum gap between.
+
+    The gap grows by ``backoff`` after a failed command (up to ``max_gap_s``)
+    and decays back towards ``min_gap_s`` after successful ones. Interactive
+    callers (writes) go ahead of background callers (polling reads) that are
+    still waiting for the bus.
+    """
+
+    def __init__(
+        self,
+        min_gap_s: float = 0.05,
+        max_gap_s: float = 2.0,
+        backoff: float = 2.0,
+        decay: float = 0.7,
+    ):
+        self._cond = threading.Condition()
+        self._min_gap_s = float(min_gap_s)
+        self._max_gap_s = max(float(max_gap_s), self._min_gap_s)
+        self._backoff = float(backoff)
+        self._decay = float(decay)
+        self._gap_s = self._min_gap_s
+        self._busy = False
+        self._next_free = 0.0
+        self._waiting = {PRIORITY_INTERACTIVE: 0, PRIORITY_BACKGROUND: 0}
+        self._created = time.monotonic()
+        self._busy_s = 0.0
+        self._wait_s = 0.0
+        self._commands = 0
+        self._failures = 0
+        self._timeouts = 0
+        self._preempted = 0
+
+    def acquire(self, priority: int = PRIORITY_BACKGROUND, timeout_s: Optional[float] = None) -> bool:
+        start = time.monotonic()
+        deadline = None if timeout_s is None else start + max(0.0, timeout_s)
+        yielded = False
+        with self._cond:
+            self._waiting[priority] += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    blocked_by_priority = priority != PRIORITY_INTERACTIVE and self._waiting[PRIORITY_INTERACTIVE] > 0
+                    if not self._busy and now >= self._next_free and not blocked_by_priority:
+                        break
+                    if blocked_by_priority and not yielded:
+                        yielded = True
+                        self._preempted += 1
+                    wait_s = None if self._busy or blocked_by_priority else self._next_free - now
+                    if deadline is not None:
+                        remaining = deadline - now
+                        if remaining <= 0:
+                            self._timeouts += 1
+                            return False
+                        wait_s = remaining if wait_s is None else min(wait_s, remaining)
+                    self._cond.wait(wait_s)
+                self._busy = True
+                self._wait_s += time.monotonic() - start
+                return True
+            finally:
+                self._waiting[priority] -= 1
+                if priority == PRIORITY_INTERACTIVE:
+                    # Background callers held back for us may proceed now.
+                    self._cond.notify_all()
+
+    def release(self, ok: bool, held_since: float) -> None:
+        with self._cond:
+            now = time.monotonic()
+            self._busy = False
+            self._busy_s += max(0.0, now - held_since)
+            self._commands += 1
+            if ok:
+                self._gap_s = max(self._min_gap_s, self._gap_s * self._decay)
+            else:
+                self._failures += 1
+                self._gap_s = min(self._max_gap_s, self._gap_s * self._backoff)
+            self._next_free = now + self._gap_s
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self, priority: int = PRIORITY_BACKGROUND, timeout_s: Optional[float] = None) -> Iterator['_Slot']:
+        """Hold the bus for one command; set ``slot.ok = False`` when it failed.
+
+        ``slot.acquired`` is ``False`` if the bus did not free up in time; the
+        caller must then skip the command.
+        """
+        slot = _Slot(self.acquire(priority, timeout_s))
+        held_since = time.monotonic()
+        try:
+            yield slot
+        except BaseException:
+            slot.ok = False
+            raise
+        finally:
+            if slot.acquired:
+                self.release(slot.ok, held_since)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            elapsed = max(1e-9, time.monotonic() - self._created)
+            return {
+                "commands": self._commands,
+                "failures": self._failures,
+                "timeouts": self._timeouts,
+                "preempted": self._preempted,
+                "gap_ms": self._gap_s * 1000.0,
+                "utilisation": self._busy_s / elapsed,
+                "wait_ms": self._wait_s * 1000.0,
+                "waiting": dict(self._waiting),
+            }
+
+
+class _Slot:
+    __slots__ = ("acquired", "ok")
+
+    def __init__(self, acquired: bool):
+        self.acquired = acquired
+        self.ok = True
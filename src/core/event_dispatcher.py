@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional
+
+from .logger import Logger
+
+
+_DEFAULT_MAX_WORKERS = 4
+# Handlers slower than this are counted (and logged) as slow.
+_SLOW_HANDLER_S = 0.25
+
+
+class InboundEvent:
+    """One parsed StreamDock message waiting to be handled."""
+
+    __slots__ = ("event", "context", "data", "received_at", "merged")
+
+    def __init__(self, event: Optional[str], context: Optional[str], data: Dict[str, Any]):
+        self.event = event
+        self.context = context
+        self.data = data
+        self.received_at = time.monotonic()
+        # How many raw messages this event stands for (> 1 after coalescing).
+        self.merged = 1
+
+    @property
+    def payload(self) -> Dict[str, Any]:
+        return self.data.get('payload') or {}
+
+
+def _rotate_ticks(item: InboundEvent) -> Optional[int]:
+    payload = item.payload
+    ticks = payload.get('ticks')
+    if ticks is None:
+        ticks = payload.get('delta')
+    try:
+        return int(ticks)
+    except (TypeError, ValueError):
+        return None
+
+
+def _merge_dial_rotate(first: InboundEvent, nxt: InboundEvent) -> Optional[InboundEvent]:
+    """One ``dialRotate`` with the summed ticks of both, or ``None`` if they must stay apart.
+
+    Only turns in the same direction with the same pressed state are merged:
+    the actions clamp after every turn, so summing +1/-1 at a limit would not
+    land where handling them one by one does.
+    """
+    a = _rotate_ticks(first)
+    b = _rotate_ticks(nxt)
+    if a is None or b is None or (a > 0) != (b > 0) or a == 0 or b == 0:
+        return None
+    if bool(first.payload.get('pressed')) != bool(nxt.payload.get('pressed')):
+        return None
+    payload = dict(nxt.payload)
+    payload.pop('delta', None)
+    payload['ticks'] = a + b
+    data = dict(nxt.data)
+    data['payload'] = payload
+    merged = InboundEvent(first.event, first.context, data)
+    merged.received_at = first.received_at
+    merged.merged = first.merged + nxt.merged
+    return merged
+
+
+# Events whose consecutive queued copies for a context are folded into one
+# before the handler runs. Anything else in between (dialDown, keyUp, ...)
+# ends the run.
+COALESCED_EVENTS: Dict[str, Callable[[InboundEvent, InboundEvent], Optional[InboundEvent]]] = {
+    'dialRotate': _merge_dial_rotate,
+}
+
+
+class _Lane:
+    __slots__ = ("key", "queue", "scheduled")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.queue: Deque[InboundEvent] = deque()
+        self.scheduled = False
+
+
+class EventDispatcher:
+    """Runs inbound events off the WebSocket receive thread.
+
+    Every key (a StreamDock context) has its own serial queue, so events for
+    one key are handled one at a time and in arrival order - lifecycle events
+    included - while different keys run concurrently on a bounded pool. A lane
+    hands its thread back to the pool after each event, so a busy key cannot
+    starve the others. When a key falls behind, consecutive queued events
+    listed in ``COALESCED_EVENTS`` are merged before its handler runs.
+    """
+
+    def __init__(self, handler: Callable[[InboundEvent], Any], max_workers: int = _DEFAULT_MAX_WORKERS):
+        self._handler = handler
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._lanes: Dict[str, _Lane] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(max_workers)), thread_name_prefix="dispatch")
+        self._closed = False
+        self._depth = 0
+        self._max_depth = 0
+        self._max_lane_depth = 0
+        self._submitted = 0
+        self._handled = 0
+        self._errors = 0
+        self._slow = 0
+        self._coalesced = 0
+        self._max_batch = 1
+        self._queue_wait_s = 0.0
+        self._max_queue_wait_s = 0.0
+        self._handler_s = 0.0
+        self._max_handler_s = 0.0
+        self._by_event: Dict[str, Dict[str, float]] = {}
+
+    def submit(self, key: str, item: InboundEvent) -> bool:
+        """Queue ``item`` on ``key``'s lane; ``False`` once the dispatcher is closed."""
+        with self._lock:
+            if self._closed:
+                return False
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = self._lanes[key] = _Lane(key)
+            lane.queue.append(item)
+            self._max_lane_depth = max(self._max_lane_depth, len(lane.queue))
+            self._submitted += 1
+            self._depth += 1
+            self._max_depth = max(self._max_depth, self._depth)
+            if lane.scheduled:
+                return True
+            lane.scheduled = True
+        self._schedule(lane)
+        return True
+
+    def _schedule(self, lane: _Lane) -> None:
+        try:
+            self._executor.submit(self._drain, lane)
+        except RuntimeError:
+            # Executor already shut down (plugin stopping).
+            with self._lock:
+                self._depth -= len(lane.queue)
+                lane.queue.clear()
+                lane.scheduled = False
+                self._idle.notify_all()
+
+    def _drain(self, lane: _Lane) -> None:
+        with self._lock:
+            item = lane.queue.popleft()
+            merge = COALESCED_EVENTS.get(item.event or "")
+            while merge is not None and lane.queue and lane.queue[0].event == item.event:
+                merged = merge(item, lane.queue[0])
+                if merged is None:
+                    break
+                lane.queue.popleft()
+                item = merged
+        started = time.monotonic()
+        ok = True
+        try:
+            self._handler(item)
+        except Exception as e:
+            ok = False
+            Logger.error(f"Handler for {item.event} ({lane.key}) failed: {e}")
+        elapsed = time.monotonic() - started
+        if elapsed >= _SLOW_HANDLER_S:
+            Logger.info(f"Slow handler: {item.event} ({lane.key}) took {elapsed * 1000.0:.0f}ms")
+        with self._lock:
+            self._record(item, started - item.received_at, elapsed, ok)
+            self._depth -= item.merged
+            more = bool(lane.queue)
+            if not more:
+                lane.scheduled = False
+                # Idle lanes are dropped; the next event for the key makes a new one.
+                if self._lanes.get(lane.key) is lane:
+                    del self._lanes[lane.key]
+                self._idle.notify_all()
+        if more:
+            self._schedule(lane)
+
+    def _record(self, item: InboundEvent, waited: float, elapsed: float, ok: bool) -> None:
+        self._handled += 1
+        if item.merged > 1:
+            self._coalesced += item.merged - 1
+            self._max_batch = max(self._max_batch, item.merged)
+        if not ok:
+            self._errors += 1
+        if elapsed >= _SLOW_HANDLER_S:
+            self._slow += 1
+        self._queue_wait_s += waited
+        self._max_queue_wait_s = max(self._max_queue_wait_s, waited)
+        self._handler_s += elapsed
+        self._max_handler_s = max(self._max_handler_s, elapsed)
+        stats = self._by_event.get(item.event or "")
+        if stats is None:
+            stats = self._by_event[item.event or ""] = {"count": 0, "total_s": 0.0, "max_s": 0.0}
+        stats["count"] += 1
+        stats["total_s"] += elapsed
+        stats["max_s"] = max(stats["max_s"], elapsed)
+
+    def wait_idle(self, timeout_s: Optional[float] = None) -> bool:
+        """Wait until every queued event has been handled."""
+        deadline = None if timeout_s is None else time.monotonic() + max(0.0, timeout_s)
+        with self._idle:
+            while self._depth > 0:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+            return True
+
+    def close(self, timeout_s: float = 1.0) -> None:
+        """Stop accepting events, give queued ones up to ``timeout_s``, then drop the rest."""
+        with self._lock:
+            self._closed = True
+        self.wait_idle(timeout_s)
+        self._executor.shutdown(wait=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            handled = self._handled
+            return {
+                "depth": self._depth,
+                "max_depth": self._max_depth,
+                "busy_lanes": len(self._lanes),
+                "max_lane_depth": self._max_lane_depth,
+                "submitted": self._submitted,
+                "handled": handled,
+                "errors": self._errors,
+                "slow": self._slow,
+                "coalesced": self._coalesced,
+                "max_batch": self._max_batch,
+                "mean_queue_ms": (self._queue_wait_s / handled * 1000.0) if handled else 0.0,
+                "max_queue_ms": self._max_queue_wait_s * 1000.0,
+                "mean_handler_ms": (self._handler_s / handled * 1000.0) if handled else 0.0,
+                "max_handler_ms": self._max_handler_s * 1000.0,
+                "by_event": {
+                    name: {
+                        "count": int(s["count"]),
+                        "mean_ms": s["total_s"] / s["count"] * 1000.0,
+                        "max_ms": s["max_s"] * 1000.0,
+                    }
+                    for name, s in self._by_event.items()
+                },
+            }
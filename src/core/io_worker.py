@@ -0,0 +1,372 @@
+from __future__ import annotations
+
+import importlib
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .bus_limiter import BusBusyError
+from .logger import Logger
+from .monitor_control import MonitorBackend, MonitorInfo, MonitorManager
+
+
+# JSON messages framed by the multiprocessing pipe (send_bytes/recv_bytes):
+#   request:  {"id": 1, "op": "get", "monitor_id": "ddcci:0x1:0"}
+#   response: {"id": 1, "ok": true, "result": 42}
+#             {"id": 1, "ok": false, "error": "<message>"}
+#             {"id": 1, "ok": false, "error": "<message>", "busy": true}  (BusBusyError)
+# Ops: scan, get, set (percent), reopen, shutdown. ``scan`` returns
+# [{"id", "name", "backend"}, ...] for every monitor the child now owns.
+_DEFAULT_FACTORY = "src.core.io_worker:default_registry"
+_CHILD_MAX_WORKERS = 8
+
+_SCAN_TIMEOUT_S = 15.0
+_REOPEN_TIMEOUT_S = 8.0
+_IO_TIMEOUT_S = 3.0
+
+IO_WORKER_ENV = "BRIGHTNESS_IO_WORKER"
+IO_WORKER_FACTORY_ENV = "BRIGHTNESS_IO_WORKER_FACTORY"
+
+
+def default_registry() -> MonitorManager:
+    """What the child process owns by default: the configured backends (see ``MonitorBackendRegistry``)."""
+    return MonitorManager(read_cache_ttl_s=0.0)
+
+
+def _load_factory(spec: str) -> Any:
+    module_name, _, attr = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def _worker_main(conn: Any, factory: str) -> None:
+    registry = _load_factory(factory)()
+    monitors: Dict[str, MonitorBackend] = {}
+    send_lock = threading.Lock()
+    pool = ThreadPoolExecutor(max_workers=_CHILD_MAX_WORKERS, thread_name_prefix="io-worker")
+
+    def _describe(found: List[MonitorBackend]) -> List[Dict[str, str]]:
+        monitors.clear()
+        described = []
+        for m in found:
+            info = m.get_info()
+            monitors[m.monitor_id] = m
+            described.append({"id": m.monitor_id, "name": info.name, "backend": info.backend})
+        return described
+
+    def _handle(msg: Dict[str, Any]) -> None:
+        op = msg.get("op")
+        try:
+            if op == "scan":
+                result: Any = _describe(registry.scan())
+            elif op == "get":
+                result = monitors[msg["monitor_id"]].get_brightness_percent()
+            elif op == "set":
+                result = bool(monitors[msg["monitor_id"]].set_brightness_percent(int(msg["percent"])))
+            elif op == "reopen":
+                result = bool(registry.reopen_monitor(msg["monitor_id"]))
+                _describe(registry.get_monitors())
+            else:
+                raise ValueError(f"unknown op {op!r}")
+            resp = {"id": msg.get("id"), "ok": True, "result": result}
+        except BusBusyError as e:
+            resp = {"id": msg.get("id"), "ok": False, "error": f"{type(e).__name__}: {e}", "busy": True}
+        except Exception as e:
+            resp = {"id": msg.get("id"), "ok": False, "error": f"{type(e).__name__}: {e}"}
+        with send_lock:
+            conn.send_bytes(json.dumps(resp).encode("utf-8"))
+
+    while True:
+        try:
+            msg = json.loads(conn.recv_bytes().decode("utf-8"))
+        except (EOFError, OSError):
+            break
+        if msg.get("op") == "shutdown":
+            break
+        pool.submit(_handle, msg)
+    pool.shutdown(wait=False)
+
+
+class _PendingCall:
+    def __init__(self):
+        self.event = threading.Event()
+        self.ok = False
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.busy = False
+
+    def resolve(self, ok: bool, result: Any, error: Optional[str], busy: bool = False) -> None:
+        self.ok = ok
+        self.result = result
+        self.error = error
+        self.busy = busy
+        self.event.set()
+
+
+class _WorkerSession:
+    def __init__(self, proc: Any, conn: Any):
+        self.proc = proc
+        self.conn = conn
+        self.pending: Dict[int, _PendingCall] = {}
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        self.closed = False
+
+    def is_alive(self) -> bool:
+        return not self.closed and self.proc.is_alive()
+
+    def fail_all(self, reason: str) -> None:
+        with self.lock:
+            self.closed = True
+            pending = list(self.pending.values())
+            self.pending.clear()
+        for call in pending:
+            call.resolve(False, None, reason)
+
+
+class IoWorker:
+    """Runs monitor backends in a child process and calls them over a pipe.
+
+    Every call has a deadline; a call that misses it kills the child (a hung
+    driver call cannot be interrupted any other way) and fails everything in
+    flight. The next call spawns a fresh child and replays the monitor
+    registry with a scan before it is used; other calls made during that
+    replay fail at once instead of waiting for it.
+    """
+
+    def __init__(self, factory: str = _DEFAULT_FACTORY):
+        self._factory = factory
+        self._ctx = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._session: Optional[_WorkerSession] = None
+        self._next_id = 1
+        self._known_ids: Optional[Tuple[str, ...]] = None
+        # Set while a new child replays the registry; calls fail fast meanwhile.
+        self._restarting = False
+        self.starts = 0
+        self.timeouts = 0
+
+    def _start_session(self) -> _WorkerSession:
+        parent_conn, child_conn = self._ctx.Pipe()
+        proc = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._factory),
+            name="brightness-io-worker",
+            daemon=True,
+        )
+        proc.start()
+        child_conn.close()
+        session = _WorkerSession(proc, parent_conn)
+        threading.Thread(target=self._read_loop, args=(session,), daemon=True).start()
+        self.starts += 1
+        if self.starts > 1:
+            Logger.info(f"I/O worker restarted (starts={self.starts})")
+        return session
+
+    def _ensure_session(self) -> _WorkerSession:
+        with self._lock:
+            session = self._session
+            if session is not None and session.is_alive():
+                return session
+            if self._restarting:
+                # Callers do not queue behind a replay that can take a whole scan deadline.
+                raise RuntimeError("I/O worker is restarting")
+            if session is not None:
+                self._kill_session(session, "I/O worker exited")
+            session = self._start_session()
+            if self._known_ids is None:
+                self._session = session
+                return session
+            self._restarting = True
+        try:
+            self._replay(session)
+        except Exception:
+            self._kill_session(session, "I/O worker replay failed")
+            raise
+        finally:
+            with self._lock:
+                self._restarting = False
+        with self._lock:
+            if session.is_alive():
+                self._session = session
+        return session
+
+    def _replay(self, session: _WorkerSession) -> None:
+        # The child starts empty; rebuild its registry before anything addresses a monitor by ID.
+        described = self._request(session, {"op": "scan"}, _SCAN_TIMEOUT_S)
+        ids = tuple(d["id"] for d in described)
+        missing = set(self._known_ids or ()) - set(ids)
+        if missing:
+            Logger.error(f"I/O worker replay lost monitors: {sorted(missing)}")
+        self._known_ids = ids
+
+    def _kill_session(self, session: _WorkerSession, reason: str) -> None:
+        if self._session is session:
+            self._session = None
+        try:
+            session.proc.kill()
+        except Exception:
+            pass
+        # The read loop sees EOF once the child is gone and closes the pipe itself:
+        # closing it here could let that thread read from a reused descriptor.
+        session.fail_all(reason)
+
+    @staticmethod
+    def _read_loop(session: _WorkerSession) -> None:
+        try:
+            while True:
+                resp = json.loads(session.conn.recv_bytes().decode("utf-8"))
+                with session.lock:
+                    call = session.pending.pop(int(resp.get("id") or 0), None)
+                if call is not None:
+                    call.resolve(bool(resp.get("ok")), resp.get("result"), resp.get("error"), bool(resp.get("busy")))
+        except Exception:
+            pass
+        session.fail_all("I/O worker exited")
+        with session.send_lock:
+            try:
+                session.conn.close()
+            except Exception:
+                pass
+
+    def _request(self, session: _WorkerSession, msg: Dict[str, Any], timeout_s: float) -> Any:
+        call = _PendingCall()
+        with session.lock:
+            call_id = self._next_id
+            self._next_id += 1
+            if session.closed:
+                call.resolve(False, None, "I/O worker exited")
+            else:
+                session.pending[call_id] = call
+        try:
+            with session.send_lock:
+                if not session.closed:
+                    session.conn.send_bytes(json.dumps({"id": call_id, **msg}).encode("utf-8"))
+        except (OSError, ValueError) as e:
+            self._kill_session(session, f"I/O worker write failed: {e}")
+        if not call.event.wait(timeout_s):
+            self.timeouts += 1
+            Logger.error(f"I/O worker call {msg.get('op')} timed out after {timeout_s}s; killing worker")
+            self._kill_session(session, "I/O worker timed out")
+            raise TimeoutError(f"I/O worker call timed out after {timeout_s}s")
+        if call.busy:
+            raise BusBusyError(call.error or "bus busy")
+        if not call.ok:
+            raise RuntimeError(call.error or "I/O worker call failed")
+        return call.result
+
+    def call(self, op: str, timeout_s: float = _IO_TIMEOUT_S, **params: Any) -> Any:
+        session = self._ensure_session()
+        return self._request(session, {"op": op, **params}, timeout_s)
+
+    def scan(self) -> List[Dict[str, str]]:
+        described = self.call("scan", timeout_s=_SCAN_TIMEOUT_S)
+        self._known_ids = tuple(d["id"] for d in described)
+        return described
+
+    def close(self) -> None:
+        with self._lock:
+            session = self._session
+            self._session = None
+        if session is None:
+            return
+        try:
+            with session.send_lock:
+                if not session.closed:
+                    session.conn.send_bytes(json.dumps({"op": "shutdown"}).encode("utf-8"))
+            session.proc.join(timeout=1.0)
+        except Exception:
+            pass
+        self._kill_session(session, "I/O worker closed")
+
+
+class WorkerMonitor(MonitorBackend):
+    """Parent-side proxy for a monitor owned by the I/O worker."""
+
+    def __init__(self, worker: IoWorker, monitor_id: str, name: str, backend: str):
+        self._worker = worker
+        self._monitor_id = monitor_id
+        self._info = MonitorInfo(name=name, backend=backend)
+
+    @property
+    def monitor_id(self) -> str:
+        return self._monitor_id
+
+    def get_info(self) -> MonitorInfo:
+        return self._info
+
+    def get_brightness_percent(self) -> Optional[int]:
+        try:
+            value = self._worker.call("get", monitor_id=self._monitor_id)
+        except BusBusyError:
+            raise
+        except Exception as e:
+            Logger.error(f"Get brightness via I/O worker failed on {self._monitor_id}: {e}")
+            return None
+        return None if value is None else int(value)
+
+    def set_brightness_percent(self, percent: int) -> bool:
+        try:
+            return bool(self._worker.call("set", monitor_id=self._monitor_id, percent=int(percent)))
+        except Exception as e:
+            Logger.error(f"Set brightness via I/O worker failed on {self._monitor_id}: {e}")
+            return False
+
+
+class WorkerMonitorManager(MonitorManager):
+    """``MonitorManager`` whose backends live in an ``IoWorker`` child process.
+
+    Caching, writers and health tracking stay in the plugin process; only the
+    hardware calls cross the pipe, so a hung driver call can cost at most one
+    call deadline and a worker restart.
+    """
+
+    def __init__(self, read_cache_ttl_s: float = 1.0, worker: Optional[IoWorker] = None):
+        super().__init__(read_cache_ttl_s=read_cache_ttl_s)
+        self._worker = worker or IoWorker()
+
+    def _scan_backends(self, current: Dict[str, MonitorBackend]) -> List[MonitorBackend]:
+        try:
+            described = self._worker.scan()
+        except Exception as e:
+            Logger.error(f"I/O worker scan failed: {e}")
+            return list(current.values())
+        monitors: List[MonitorBackend] = []
+        for d in described:
+            existing = current.get(d["id"])
+            monitors.append(existing or WorkerMonitor(self._worker, d["id"], d["name"], d["backend"]))
+        return monitors
+
+    def reopen_monitor(self, monitor_id: str) -> bool:
+        try:
+            ok = bool(self._worker.call("reopen", timeout_s=_REOPEN_TIMEOUT_S, monitor_id=monitor_id))
+        except Exception as e:
+            Logger.error(f"I/O worker reopen failed on {monitor_id}: {e}")
+            return False
+        if ok:
+            self._read_cache.invalidate(monitor_id)
+        return ok
+
+    def close(self) -> None:
+        super().close()
+        self._worker.close()
+
+
+def io_worker_enabled() -> bool:
+    return os.environ.get(IO_WORKER_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def create_monitor_manager(read_cache_ttl_s: float = 1.0) -> MonitorManager:
+    """In-process manager by default; set ``BRIGHTNESS_IO_WORKER=1`` to isolate hardware I/O.
+
+    The child inherits the environment, so ``BRIGHTNESS_BACKENDS`` (e.g.
+    ``sim``) applies there too; ``BRIGHTNESS_IO_WORKER_FACTORY``
+    (``module:callable``) replaces what the child owns altogether.
+    """
+    if not io_worker_enabled():
+        return MonitorManager(read_cache_ttl_s=read_cache_ttl_s)
+    factory = os.environ.get(IO_WORKER_FACTORY_ENV) or _DEFAULT_FACTORY
+    Logger.info(f"Monitor I/O runs in a worker process ({factory})")
+    return WorkerMonitorManager(read_cache_ttl_s=read_cache_ttl_s, worker=IoWorker(factory))
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class KnownBrightnessModel:
+    """Last-confirmed brightness per monitor, used to skip redundant writes.
+
+    A value is confirmed by a successful write or a hardware read and stays
+    trusted for ``confidence_s``. A read that disagrees with the model counts
+    as an external change (e.g. the monitor's own OSD) and replaces it.
+    """
+
+    def __init__(self, confidence_s: float = 30.0):
+        self._lock = threading.Lock()
+        self._confidence_s = max(0.0, float(confidence_s))
+        # monitor_id -> (percent, monotonic confirmation time)
+        self._values: Dict[str, Tuple[int, float]] = {}
+        self._checked = 0
+        self._skipped = 0
+        self._external_changes = 0
+
+    def confirm(self, monitor_id: str, percent: int) -> None:
+        with self._lock:
+            self._values[monitor_id] = (int(percent), time.monotonic())
+
+    def observe(self, monitor_id: str, percent: int) -> None:
+        """Record a hardware read; a mismatch with the model is an external change."""
+        with self._lock:
+            known = self._values.get(monitor_id)
+            if known is not None and known[0] != int(percent):
+                self._external_changes += 1
+            self._values[monitor_id] = (int(percent), time.monotonic())
+
+    def should_skip(self, monitor_id: Optional[str], percent: int, force: bool = False) -> bool:
+        """Whether writing ``percent`` would not change the monitor; counts skips."""
+        if monitor_id is None:
+            return False
+        with self._lock:
+            self._checked += 1
+            if force:
+                return False
+            known = self._values.get(monitor_id)
+            if known is None or known[0] != int(percent) or time.monotonic() - known[1] >= self._confidence_s:
+                return False
+            self._skipped += 1
+            return True
+
+    def invalidate(self, monitor_id: Optional[str] = None) -> None:
+        with self._lock:
+            if monitor_id is None:
+                self._values.clear()
+            else:
+                self._values.pop(monitor_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._values),
+                "checked": self._checked,
+                "skipped": self._skipped,
+                "external_changes": self._external_changes,
+            }
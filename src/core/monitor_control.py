@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 import ctypes
-import json
-import subprocess
 import threading
-from dataclasses import dataclass
-from typing import Any, List, Optional, Sequence, Tuple
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Container, Dict, List, Optional, Sequence, Tuple
 
+from .brightness_cache import BrightnessReadCache
+from .bus_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, BusBusyError, BusLimiter
 from .logger import Logger
-
-
-_user32 = ctypes.WinDLL("user32", use_last_error=True)
-_dxva2 = ctypes.WinDLL("dxva2", use_last_error=True)
+from .monitor_health import MonitorHealth
+from .monitor_registry import MonitorBackendRegistry
+from .monitor_writer import WRITE_CANCELLED, WRITE_FAILED, WRITE_OK, WRITE_SUPERSEDED, MonitorWriter, WriteTicket
+from .powershell_worker import get_powershell_worker
 
 
 class _RECT(ctypes.Structure):
@@ -30,58 +32,123 @@ class _PHYSICAL_MONITOR(ctypes.Structure):
     ]
 
 
-_MonitorEnumProc = ctypes.WINFUNCTYPE(
-    ctypes.c_int,
-    ctypes.c_void_p,
-    ctypes.c_void_p,
-    ctypes.POINTER(_RECT),
-    ctypes.c_void_p,
-)
-
-
-_user32.EnumDisplayMonitors.argtypes = [
-    ctypes.c_void_p,
-    ctypes.c_void_p,
-    _MonitorEnumProc,
-    ctypes.c_void_p,
-]
-_user32.EnumDisplayMonitors.restype = ctypes.c_int
-
-_dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
-_dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR.restype = ctypes.c_int
-
-_dxva2.GetPhysicalMonitorsFromHMONITOR.argtypes = [
-    ctypes.c_void_p,
-    ctypes.c_uint32,
-    ctypes.POINTER(_PHYSICAL_MONITOR),
-]
-_dxva2.GetPhysicalMonitorsFromHMONITOR.restype = ctypes.c_int
-
-_dxva2.DestroyPhysicalMonitors.argtypes = [ctypes.c_uint32, ctypes.POINTER(_PHYSICAL_MONITOR)]
-_dxva2.DestroyPhysicalMonitors.restype = ctypes.c_int
-
-_dxva2.GetMonitorBrightness.argtypes = [
-    ctypes.c_void_p,
-    ctypes.POINTER(ctypes.c_uint32),
-    ctypes.POINTER(ctypes.c_uint32),
-    ctypes.POINTER(ctypes.c_uint32),
-]
-_dxva2.GetMonitorBrightness.restype = ctypes.c_int
-
-_dxva2.SetMonitorBrightness.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
-_dxva2.SetMonitorBrightness.restype = ctypes.c_int
-
-_dxva2.GetVCPFeatureAndVCPFeatureReply.argtypes = [
-    ctypes.c_void_p,
-    ctypes.c_ubyte,
-    ctypes.c_void_p,
-    ctypes.POINTER(ctypes.c_uint32),
-    ctypes.POINTER(ctypes.c_uint32),
-]
-_dxva2.GetVCPFeatureAndVCPFeatureReply.restype = ctypes.c_int
-
-_dxva2.SetVCPFeature.argtypes = [ctypes.c_void_p, ctypes.c_ubyte, ctypes.c_uint32]
-_dxva2.SetVCPFeature.restype = ctypes.c_int
+class _MONITORINFOEXW(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", ctypes.c_uint32),
+        ("rcMonitor", _RECT),
+        ("rcWork", _RECT),
+        ("dwFlags", ctypes.c_uint32),
+        ("szDevice", ctypes.c_wchar * 32),
+    ]
+
+
+class _DISPLAY_DEVICEW(ctypes.Structure):
+    _fields_ = [
+        ("cb", ctypes.c_uint32),
+        ("DeviceName", ctypes.c_wchar * 32),
+        ("DeviceString", ctypes.c_wchar * 128),
+        ("StateFlags", ctypes.c_uint32),
+        ("DeviceID", ctypes.c_wchar * 128),
+        ("DeviceKey", ctypes.c_wchar * 128),
+    ]
+
+
+_EDD_GET_DEVICE_INTERFACE_NAME = 0x00000001
+_DISPLAY_DEVICE_ACTIVE = 0x00000001
+
+
+class _NativeApi:
+    """user32/dxva2 entry points with their ctypes signatures.
+
+    Bound on first use (see ``_native``) so importing this module works on any
+    platform and costs nothing until a DDC/CI monitor is actually touched.
+    """
+
+    def __init__(self):
+        self.user32 = ctypes.WinDLL("user32", use_last_error=True)
+        self.dxva2 = ctypes.WinDLL("dxva2", use_last_error=True)
+        self.MonitorEnumProc = ctypes.WINFUNCTYPE(
+            ctypes.c_int,
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            ctypes.POINTER(_RECT),
+            ctypes.c_void_p,
+        )
+        user32 = self.user32
+        dxva2 = self.dxva2
+
+        user32.EnumDisplayMonitors.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,
+            self.MonitorEnumProc,
+            ctypes.c_void_p,
+        ]
+        user32.EnumDisplayMonitors.restype = ctypes.c_int
+
+        user32.GetMonitorInfoW.argtypes = [ctypes.c_void_p, ctypes.POINTER(_MONITORINFOEXW)]
+        user32.GetMonitorInfoW.restype = ctypes.c_int
+
+        user32.EnumDisplayDevicesW.argtypes = [
+            ctypes.c_wchar_p,
+            ctypes.c_uint32,
+            ctypes.POINTER(_DISPLAY_DEVICEW),
+            ctypes.c_uint32,
+        ]
+        user32.EnumDisplayDevicesW.restype = ctypes.c_int
+
+        dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint32)]
+        dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR.restype = ctypes.c_int
+
+        dxva2.GetPhysicalMonitorsFromHMONITOR.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_uint32,
+            ctypes.POINTER(_PHYSICAL_MONITOR),
+        ]
+        dxva2.GetPhysicalMonitorsFromHMONITOR.restype = ctypes.c_int
+
+        dxva2.DestroyPhysicalMonitors.argtypes = [ctypes.c_uint32, ctypes.POINTER(_PHYSICAL_MONITOR)]
+        dxva2.DestroyPhysicalMonitors.restype = ctypes.c_int
+
+        dxva2.DestroyPhysicalMonitor.argtypes = [ctypes.c_void_p]
+        dxva2.DestroyPhysicalMonitor.restype = ctypes.c_int
+
+        dxva2.GetMonitorBrightness.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_uint32),
+            ctypes.POINTER(ctypes.c_uint32),
+            ctypes.POINTER(ctypes.c_uint32),
+        ]
+        dxva2.GetMonitorBrightness.restype = ctypes.c_int
+
+        dxva2.SetMonitorBrightness.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+        dxva2.SetMonitorBrightness.restype = ctypes.c_int
+
+        dxva2.GetVCPFeatureAndVCPFeatureReply.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_ubyte,
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.c_uint32),
+            ctypes.POINTER(ctypes.c_uint32),
+        ]
+        dxva2.GetVCPFeatureAndVCPFeatureReply.restype = ctypes.c_int
+
+        dxva2.SetVCPFeature.argtypes = [ctypes.c_void_p, ctypes.c_ubyte, ctypes.c_uint32]
+        dxva2.SetVCPFeature.restype = ctypes.c_int
+
+
+_native_lock = threading.Lock()
+_native_api: Optional[_NativeApi] = None
+
+
+def _native() -> _NativeApi:
+    global _native_api
+    api = _native_api
+    if api is None:
+        with _native_lock:
+            if _native_api is None:
+                _native_api = _NativeApi()
+            api = _native_api
+    return api
 
 
 def _clamp_int(value: int, lo: int, hi: int) -> int:
@@ -112,25 +179,76 @@ def _ps_single_quote(s: str) -> str:
 
 
 def _run_powershell_json(script: str, timeout_s: float = 2.5) -> Any:
-    completed = subprocess.run(
-        [
-            "powershell",
-            "-NoProfile",
-            "-ExecutionPolicy",
-            "Bypass",
-            "-Command",
-            script,
-        ],
-        capture_output=True,
-        text=True,
-        timeout=timeout_s,
+    return get_powershell_worker().call_json(script, timeout_s=timeout_s)
+
+
+_WMI_BATCH_MAX_AGE_S = 0.5
+_APPLY_MAX_WORKERS = 8
+_APPLY_BARRIER_TIMEOUT_S = 0.25
+_READ_MAX_WORKERS = 4
+
+
+def _query_wmi_brightness(timeout_s: float = 2.5) -> Dict[str, Optional[int]]:
+    script = (
+        "Get-CimInstance -Namespace root\\wmi -ClassName WmiMonitorBrightness "
+        "| Select-Object -Property InstanceName,CurrentBrightness "
+        "| ConvertTo-Json -Compress"
     )
-    stdout = (completed.stdout or "").strip()
-    if completed.returncode != 0:
-        raise RuntimeError((completed.stderr or "").strip() or "PowerShell execution failed")
-    if not stdout:
-        return None
-    return json.loads(stdout)
+    value = _run_powershell_json(script, timeout_s=timeout_s)
+    instances: Sequence[Any]
+    if value is None:
+        instances = []
+    elif isinstance(value, list):
+        instances = value
+    else:
+        instances = [value]
+
+    result: Dict[str, Optional[int]] = {}
+    for item in instances:
+        item = item or {}
+        name = item.get("InstanceName")
+        if not isinstance(name, str) or not name.strip():
+            continue
+        current = item.get("CurrentBrightness")
+        if isinstance(current, (int, float)):
+            result[name.strip()] = _clamp_int(int(current), 0, 100)
+        else:
+            result[name.strip()] = None
+    return result
+
+
+class _WmiBrightnessBatch:
+    """Shares one WmiMonitorBrightness query between every WMI monitor.
+
+    A read refreshes the values of all instances at once; other monitors read
+    within ``_WMI_BATCH_MAX_AGE_S`` reuse that result instead of querying again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: Dict[str, Optional[int]] = {}
+        self._ts = 0.0
+
+    def fill(self, values: Dict[str, Optional[int]]) -> None:
+        with self._lock:
+            self._values = dict(values)
+            self._ts = time.monotonic()
+
+    def update(self, instance_name: str, percent: int) -> None:
+        with self._lock:
+            if instance_name in self._values:
+                self._values[instance_name] = percent
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._ts = 0.0
+
+    def read(self, instance_name: str) -> Optional[int]:
+        with self._lock:
+            if time.monotonic() - self._ts > _WMI_BATCH_MAX_AGE_S:
+                self._values = _query_wmi_brightness()
+                self._ts = time.monotonic()
+            return self._values.get(instance_name)
 
 
 @dataclass
@@ -139,7 +257,108 @@ class MonitorInfo:
     backend: str
 
 
+@dataclass
+class MonitorApplyResult:
+    index: int
+    monitor_id: str
+    name: str
+    backend: str
+    ok: bool
+    latency_ms: float = 0.0
+    start_offset_ms: float = 0.0
+    timed_out: bool = False
+    skipped: bool = False
+    quarantined: bool = False
+
+
+@dataclass
+class ApplyResult:
+    percent: int
+    monitors: List[MonitorApplyResult] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+    @property
+    def ok_count(self) -> int:
+        return sum(1 for r in self.monitors if r.ok)
+
+    @property
+    def quarantined_count(self) -> int:
+        return sum(1 for r in self.monitors if r.quarantined)
+
+    @property
+    def skipped_count(self) -> int:
+        return sum(1 for r in self.monitors if r.skipped)
+
+    @property
+    def start_skew_ms(self) -> float:
+        offsets = [r.start_offset_ms for r in self.monitors if not (r.timed_out or r.skipped or r.quarantined)]
+        if len(offsets) < 2:
+            return 0.0
+        return max(offsets) - min(offsets)
+
+
+RESULT_OK = "ok"
+RESULT_STALE = "stale"
+RESULT_TIMEOUT = "timeout"
+RESULT_FAILED = "failed"
+RESULT_SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class ReadResult:
+    """Outcome of a deadline-bounded brightness read.
+
+    ``stale`` carries the last known value (``age_s`` old) because the
+    hardware did not answer in time; ``timeout`` is the same with nothing
+    known yet. ``failed`` means the read failed or the monitor is unknown or
+    quarantined.
+    """
+
+    monitor_id: Optional[str]
+    value: Optional[int]
+    status: str
+    age_s: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == RESULT_OK
+
+    @property
+    def stale(self) -> bool:
+        return self.status == RESULT_STALE
+
+
+@dataclass(frozen=True)
+class WriteResult:
+    """Outcome of a deadline-bounded brightness write.
+
+    ``status`` is the settled ticket status (``ok``/``failed``/``superseded``/
+    ``cancelled``), ``timeout`` when the deadline passed first (a write still
+    waiting in the mailbox is then cancelled), ``failed`` when nothing was
+    submitted, or ``skipped`` when the monitor was already at ``percent``.
+    """
+
+    monitor_id: Optional[str]
+    percent: int
+    status: str
+    ticket: Optional[WriteTicket] = None
+
+    @property
+    def ok(self) -> bool:
+        # A superseded target was replaced by a newer one that is driving the monitor instead.
+        return self.status in (WRITE_OK, WRITE_SUPERSEDED, RESULT_SKIPPED)
+
+    @property
+    def timed_out(self) -> bool:
+        return self.status == RESULT_TIMEOUT
+
+
 class MonitorBackend:
+    @property
+    def monitor_id(self) -> str:
+        info = self.get_info()
+        return f"{info.backend}:{info.name}"
+
     def get_info(self) -> MonitorInfo:
         raise NotImplementedError
 
@@ -149,30 +368,162 @@ class MonitorBackend:
     def set_brightness_percent(self, percent: int) -> bool:
         raise NotImplementedError
 
+    def reopen(self) -> bool:
+        """Re-acquire the monitor in place after a failure; ``False`` if this backend cannot."""
+        return False
+
     def close(self) -> None:
         return None
 
 
+class _PhysicalMonitorHandle:
+    """Reference-counted dxva2 physical monitor handle.
+
+    ``retire`` marks the handle as gone from the registry; it is destroyed once
+    the last in-flight user releases it.
+    """
+
+    def __init__(self, value: int):
+        self.value = int(value)
+        self._lock = threading.Lock()
+        self._refs = 0
+        self._retired = False
+        self._destroyed = False
+
+    def acquire(self) -> bool:
+        with self._lock:
+            if self._retired:
+                return False
+            self._refs += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._refs -= 1
+            destroy = self._retired and self._refs <= 0 and not self._destroyed
+            if destroy:
+                self._destroyed = True
+        if destroy:
+            self._destroy()
+
+    def retire(self) -> None:
+        with self._lock:
+            self._retired = True
+            destroy = self._refs <= 0 and not self._destroyed
+            if destroy:
+                self._destroyed = True
+        if destroy:
+            self._destroy()
+
+    def _destroy(self) -> None:
+        try:
+            _native().dxva2.DestroyPhysicalMonitor(ctypes.c_void_p(self.value))
+        except Exception:
+            pass
+
+
+def _ddc_monitor_id(hmonitor: int, index: int, device_path: Optional[str] = None) -> str:
+    """Stable ID for a physical monitor.
+
+    ``device_path`` is the monitor's device interface name; with its prefix
+    and interface GUID dropped it reads like ``DISPLAY#DEL40F5#5&2b8ee5b1&0&UID4353``
+    (EDID model plus connector instance), which survives the sleep/wake and
+    dock changes that hand out new HMONITOR values. Without it the ID falls
+    back to the HMONITOR and is only stable until the display topology changes.
+    """
+    if device_path:
+        path = device_path
+        if path.startswith("\\\\?\\"):
+            path = path[4:]
+        path = path.split("#{", 1)[0]
+        return f"ddcci:{path}"
+    return f"ddcci:{hmonitor:#x}:{index}"
+
+
+def _wmi_monitor_id(instance_name: str) -> str:
+    return f"wmi:{instance_name}"
+
+
+_DDC_PATH_HIGH_LEVEL = "high_level"
+_DDC_PATH_VCP = "vcp"
+_DDC_PATHS = (_DDC_PATH_HIGH_LEVEL, _DDC_PATH_VCP)
+
+
+# DDC/CI needs a pause between commands on the same bus; reads give up rather
+# than queue forever behind a monitor that has stopped answering.
+_DDC_MIN_GAP_S = 0.05
+_DDC_MAX_GAP_S = 2.0
+_DDC_READ_BUS_TIMEOUT_S = 2.0
+
+
+def _ddc_path_order(preferred: Optional[str]) -> Tuple[str, ...]:
+    if preferred is None:
+        return _DDC_PATHS
+    return (preferred, *[p for p in _DDC_PATHS if p != preferred])
+
+
 class DdcCiMonitor(MonitorBackend):
-    def __init__(self, handle: int, description: str):
-        self._handle = ctypes.c_void_p(handle)
+    def __init__(
+        self,
+        handle: _PhysicalMonitorHandle,
+        description: str,
+        monitor_id: str,
+        hmonitor: int = 0,
+        physical_index: int = 0,
+    ):
+        self._handle_ref = handle
+        # Where the handle came from, so it can be re-opened on its own.
+        self.hmonitor = hmonitor
+        self.physical_index = physical_index
+        self._handle = ctypes.c_void_p(handle.value)
         self._description = description.strip() or "DDC/CI"
-        self._lock = threading.RLock()
+        self._monitor_id = monitor_id
+        # Serialises commands on this monitor's bus; reads and writes share it.
+        self._bus = BusLimiter(min_gap_s=_DDC_MIN_GAP_S, max_gap_s=_DDC_MAX_GAP_S)
+        # VCP 0x10 range and the API path known to work; learned on the first
+        # read and dropped again only when a write fails.
+        self._range: Optional[Tuple[int, int]] = None
+        self._read_path: Optional[str] = None
+        self._write_path: Optional[str] = None
+
+    @property
+    def monitor_id(self) -> str:
+        return self._monitor_id
 
     def get_info(self) -> MonitorInfo:
         return MonitorInfo(name=self._description, backend="ddcci")
 
-    def _get_brightness_raw(self) -> Optional[Tuple[int, int, int]]:
+    @property
+    def bus(self) -> BusLimiter:
+        return self._bus
+
+    def _bus_command(self, priority: int, command: Callable[[], Any]) -> Any:
+        timeout_s = _DDC_READ_BUS_TIMEOUT_S if priority == PRIORITY_BACKGROUND else None
+        with self._bus.slot(priority, timeout_s=timeout_s) as slot:
+            if not slot.acquired:
+                raise BusBusyError(f"{self._monitor_id}: bus still busy after {timeout_s}s")
+            result = command()
+            slot.ok = bool(result)
+            return result
+
+    def _read_high_level(self) -> Optional[Tuple[int, int, int]]:
         min_v = ctypes.c_uint32()
         cur_v = ctypes.c_uint32()
         max_v = ctypes.c_uint32()
-        ok = _dxva2.GetMonitorBrightness(self._handle, ctypes.byref(min_v), ctypes.byref(cur_v), ctypes.byref(max_v))
+        ok = _native().dxva2.GetMonitorBrightness(
+            self._handle,
+            ctypes.byref(min_v),
+            ctypes.byref(cur_v),
+            ctypes.byref(max_v),
+        )
         if ok:
             return int(min_v.value), int(cur_v.value), int(max_v.value)
+        return None
 
+    def _read_vcp(self) -> Optional[Tuple[int, int, int]]:
         cur = ctypes.c_uint32()
         maxv = ctypes.c_uint32()
-        ok = _dxva2.GetVCPFeatureAndVCPFeatureReply(
+        ok = _native().dxva2.GetVCPFeatureAndVCPFeatureReply(
             self._handle,
             ctypes.c_ubyte(0x10),
             None,
@@ -183,54 +534,97 @@ class DdcCiMonitor(MonitorBackend):
             return 0, int(cur.value), int(maxv.value)
         return None
 
+    def _get_brightness_raw(self, priority: int) -> Optional[Tuple[int, int, int]]:
+        for path in _ddc_path_order(self._read_path):
+            if path == _DDC_PATH_HIGH_LEVEL:
+                raw = self._bus_command(priority, self._read_high_level)
+            else:
+                raw = self._bus_command(priority, self._read_vcp)
+            if raw:
+                self._read_path = path
+                self._range = (raw[0], raw[2])
+                return raw
+        self._read_path = None
+        return None
+
+    def _write_high_level(self, percent: int) -> bool:
+        if self._range is None:
+            return False
+        min_v, max_v = self._range
+        new_raw = _raw_from_percent(percent, min_v, max_v)
+        return bool(_native().dxva2.SetMonitorBrightness(self._handle, ctypes.c_uint32(new_raw)))
+
+    def _write_vcp(self, percent: int) -> bool:
+        new_raw = percent
+        if self._range is not None:
+            # Same raw value the high-level path would write for this percent.
+            new_raw = _raw_from_percent(percent, self._range[0], self._range[1])
+        return bool(_native().dxva2.SetVCPFeature(self._handle, ctypes.c_ubyte(0x10), ctypes.c_uint32(new_raw)))
+
     def get_brightness_percent(self) -> Optional[int]:
-        with self._lock:
-            raw = self._get_brightness_raw()
+        if not self._handle_ref.acquire():
+            return None
+        try:
+            raw = self._get_brightness_raw(PRIORITY_BACKGROUND)
             if not raw:
                 return None
             min_v, cur_v, max_v = raw
             return _safe_percent_from_raw(cur_v, min_v, max_v)
+        finally:
+            self._handle_ref.release()
 
     def set_brightness_percent(self, percent: int) -> bool:
-        with self._lock:
-            raw = self._get_brightness_raw()
-            if raw:
-                min_v, _cur_v, max_v = raw
-                new_raw = _raw_from_percent(percent, min_v, max_v)
-                ok = _dxva2.SetMonitorBrightness(self._handle, ctypes.c_uint32(new_raw))
+        if not self._handle_ref.acquire():
+            return False
+        try:
+            percent = _clamp_int(int(percent), 0, 100)
+            if self._range is None:
+                self._get_brightness_raw(PRIORITY_INTERACTIVE)
+
+            for path in _ddc_path_order(self._write_path):
+                if path == _DDC_PATH_HIGH_LEVEL:
+                    if self._range is None:
+                        # Cannot scale without the range; skip it before taking a bus
+                        # slot so nothing counts as a failed command on the bus.
+                        continue
+                    ok = self._bus_command(PRIORITY_INTERACTIVE, lambda: self._write_high_level(percent))
+                else:
+                    ok = self._bus_command(PRIORITY_INTERACTIVE, lambda: self._write_vcp(percent))
                 if ok:
+                    self._write_path = path
                     return True
 
-            percent = _clamp_int(int(percent), 0, 100)
-            ok = _dxva2.SetVCPFeature(self._handle, ctypes.c_ubyte(0x10), ctypes.c_uint32(percent))
-            return bool(ok)
+            self._range = None
+            self._write_path = None
+            return False
+        finally:
+            self._handle_ref.release()
 
     def close(self) -> None:
-        return None
+        self._handle_ref.retire()
 
 
 class WmiMonitor(MonitorBackend):
-    def __init__(self, instance_name: str):
+    def __init__(self, instance_name: str, batch: Optional[_WmiBrightnessBatch] = None):
         self._instance_name = instance_name
+        self._batch = batch or _WmiBrightnessBatch()
         self._lock = threading.RLock()
 
+    @property
+    def monitor_id(self) -> str:
+        return _wmi_monitor_id(self._instance_name)
+
+    @property
+    def instance_name(self) -> str:
+        return self._instance_name
+
     def get_info(self) -> MonitorInfo:
         return MonitorInfo(name=self._instance_name, backend="wmi")
 
     def get_brightness_percent(self) -> Optional[int]:
         with self._lock:
-            escaped = _ps_single_quote(self._instance_name)
-            script = (
-                "$b = Get-CimInstance -Namespace root\\wmi -ClassName WmiMonitorBrightness "
-                f"| Where-Object {{$_.InstanceName -eq '{escaped}'}} "
-                "| Select-Object -First 1 -Property CurrentBrightness; "
-                "if ($null -eq $b) { $null } else { $b.CurrentBrightness } | ConvertTo-Json -Compress"
-            )
             try:
-                value = _run_powershell_json(script)
-                if value is None:
-                    return None
-                return _clamp_int(int(value), 0, 100)
+                return self._batch.read(self._instance_name)
             except Exception as e:
                 Logger.error(f"WMI get brightness failed: {e}")
                 return None
@@ -248,117 +642,592 @@ class WmiMonitor(MonitorBackend):
             )
             try:
                 value = _run_powershell_json(script, timeout_s=3.5)
+                if value:
+                    self._batch.update(self._instance_name, percent)
+                else:
+                    self._batch.invalidate()
                 return bool(value)
             except Exception as e:
                 Logger.error(f"WMI set brightness failed: {e}")
                 return False
 
 
+@dataclass(frozen=True)
+class MonitorSnapshot:
+    monitors: Tuple[MonitorBackend, ...] = ()
+    generation: int = 0
+    scanned_at: float = 0.0
+
+    @property
+    def ids(self) -> Tuple[str, ...]:
+        return tuple(m.monitor_id for m in self.monitors)
+
+    def get(self, index: int) -> Optional[MonitorBackend]:
+        if index < 0 or index >= len(self.monitors):
+            return None
+        return self.monitors[index]
+
+    def index_of(self, monitor_id: Optional[str]) -> int:
+        if not monitor_id:
+            return -1
+        for i, m in enumerate(self.monitors):
+            if m.monitor_id == monitor_id:
+                return i
+        return -1
+
+
 class MonitorManager:
-    def __init__(self):
+    def __init__(self, read_cache_ttl_s: float = 1.0, backends: Optional[Sequence[str]] = None):
+        # Provider names scanned in order; see ``MonitorBackendRegistry.configured``.
+        self._backends = tuple(backends) if backends is not None else MonitorBackendRegistry.configured()
+        # Serialises scans only; readers load the published snapshot without locking.
         self._lock = threading.RLock()
-        self._ddc_handles: List[_PHYSICAL_MONITOR] = []
-        self._monitors: List[MonitorBackend] = []
+        self._snapshot = MonitorSnapshot()
+        self._wmi_batch = _WmiBrightnessBatch()
+        self._apply_pool = ThreadPoolExecutor(max_workers=_APPLY_MAX_WORKERS, thread_name_prefix="brightness-apply")
+        self._read_cache = BrightnessReadCache(ttl_s=read_cache_ttl_s)
+        # Hardware reads for callers with a deadline; a read that outlives it keeps running here.
+        self._read_pool = ThreadPoolExecutor(max_workers=_READ_MAX_WORKERS, thread_name_prefix="brightness-read")
+        # monitor_id -> writer; replaced together with the backend object on rescan.
+        self._writers_lock = threading.Lock()
+        self._writers: Dict[str, Tuple[MonitorBackend, MonitorWriter]] = {}
+        self._write_listeners: List[Callable[[WriteTicket], None]] = []
+        self._health = MonitorHealth()
 
     def close(self) -> None:
         with self._lock:
-            self._destroy_ddc_handles()
-            self._monitors = []
-
-    def _destroy_ddc_handles(self) -> None:
-        if not self._ddc_handles:
-            return
+            snapshot = self._snapshot
+            self._snapshot = MonitorSnapshot(generation=snapshot.generation + 1, scanned_at=time.time())
+            self._close_writers(None)
+            for m in snapshot.monitors:
+                try:
+                    m.close()
+                except Exception:
+                    pass
+
+    @staticmethod
+    def _enum_hmonitors() -> List[int]:
+        hmonitors: List[int] = []
+        api = _native()
+
+        @api.MonitorEnumProc
+        def _cb(hmonitor, _hdc, _rect, _lparam):
+            hmonitors.append(int(ctypes.cast(hmonitor, ctypes.c_void_p).value or 0))
+            return 1
+
+        ok = api.user32.EnumDisplayMonitors(None, None, _cb, None)
+        if not ok:
+            Logger.error(f"EnumDisplayMonitors failed: {ctypes.get_last_error()}")
+        return hmonitors
+
+    @staticmethod
+    def _monitor_device_paths(hmonitor: int) -> List[str]:
+        """Device interface names of the active monitors behind ``hmonitor``, in adapter order."""
+        api = _native()
+        info = _MONITORINFOEXW()
+        info.cbSize = ctypes.sizeof(info)
+        if not api.user32.GetMonitorInfoW(ctypes.c_void_p(hmonitor), ctypes.byref(info)):
+            return []
+        paths: List[str] = []
+        i = 0
+        while True:
+            device = _DISPLAY_DEVICEW()
+            device.cb = ctypes.sizeof(device)
+            found = api.user32.EnumDisplayDevicesW(
+                info.szDevice, i, ctypes.byref(device), _EDD_GET_DEVICE_INTERFACE_NAME
+            )
+            if not found:
+                break
+            if device.StateFlags & _DISPLAY_DEVICE_ACTIVE and device.DeviceID:
+                paths.append(str(device.DeviceID))
+            i += 1
+        return paths
+
+    def _scan_ddc(self, current: Dict[str, MonitorBackend]) -> List[MonitorBackend]:
+        ddc_list: List[MonitorBackend] = []
+        for hmon in self._enum_hmonitors():
+            count = ctypes.c_uint32()
+            ok = _native().dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR(ctypes.c_void_p(hmon), ctypes.byref(count))
+            if not ok or not count.value:
+                continue
+            n = int(count.value)
+            # Physical monitors are listed in the same order as the adapter's monitor
+            # devices; if the counts disagree the pairing is unknown, so use the HMONITOR.
+            paths = self._monitor_device_paths(hmon)
+            ids = [_ddc_monitor_id(hmon, i, paths[i] if len(paths) == n else None) for i in range(n)]
+            # An object is only reusable if its handle came from this HMONITOR: after a
+            # topology change the same monitor (same ID) needs a fresh handle.
+            reusable = [
+                m if isinstance(m, DdcCiMonitor) and m.hmonitor == hmon and m.physical_index == i else None
+                for i, m in enumerate(current.get(monitor_id) for monitor_id in ids)
+            ]
+            if all(m is not None for m in reusable):
+                ddc_list.extend(reusable)
+                continue
+
+            arr_type = _PHYSICAL_MONITOR * n
+            arr = arr_type()
+            ok = _native().dxva2.GetPhysicalMonitorsFromHMONITOR(ctypes.c_void_p(hmon), count, arr)
+            if not ok:
+                continue
+
+            for i, monitor_id in enumerate(ids):
+                pm = arr[i]
+                handle = _PhysicalMonitorHandle(int(pm.hPhysicalMonitor or 0))
+                existing = reusable[i]
+                if existing is not None:
+                    handle.retire()
+                    ddc_list.append(existing)
+                    continue
+                desc = str(pm.szPhysicalMonitorDescription)
+                ddc_list.append(DdcCiMonitor(handle, desc, monitor_id, hmon, i))
+        return ddc_list
+
+    @staticmethod
+    def _open_physical_monitor(hmon: int, index: int) -> Optional[Tuple[_PhysicalMonitorHandle, str]]:
+        count = ctypes.c_uint32()
+        ok = _native().dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR(ctypes.c_void_p(hmon), ctypes.byref(count))
+        if not ok or index >= int(count.value):
+            return None
+        arr = (_PHYSICAL_MONITOR * int(count.value))()
+        if not _native().dxva2.GetPhysicalMonitorsFromHMONITOR(ctypes.c_void_p(hmon), count, arr):
+            return None
+        opened: Optional[Tuple[_PhysicalMonitorHandle, str]] = None
+        for i in range(int(count.value)):
+            handle = _PhysicalMonitorHandle(int(arr[i].hPhysicalMonitor or 0))
+            if i == index:
+                opened = (handle, str(arr[i].szPhysicalMonitorDescription))
+            else:
+                handle.retire()
+        return opened
+
+    def _scan_wmi(self, current: Dict[str, MonitorBackend]) -> List[MonitorBackend]:
         try:
-            arr_type = _PHYSICAL_MONITOR * len(self._ddc_handles)
-            arr = arr_type(*self._ddc_handles)
-            _dxva2.DestroyPhysicalMonitors(ctypes.c_uint32(len(self._ddc_handles)), arr)
-        except Exception:
-            pass
-        finally:
-            self._ddc_handles = []
+            values = _query_wmi_brightness(timeout_s=2.5)
+        except Exception as e:
+            Logger.error(f"WMI scan failed: {e}")
+            return [m for m in current.values() if isinstance(m, WmiMonitor)]
+
+        self._wmi_batch.fill(values)
+        wmi_list: List[MonitorBackend] = []
+        for name in values:
+            existing = current.get(_wmi_monitor_id(name))
+            wmi_list.append(existing if existing is not None else WmiMonitor(name, self._wmi_batch))
+        return wmi_list
+
+    def _scan_backends(self, current: Dict[str, MonitorBackend]) -> List[MonitorBackend]:
+        """Enumerate monitors, reusing objects from ``current`` whose ID is still present."""
+        return MonitorBackendRegistry.scan(self._backends, self, current)
 
     def scan(self) -> List[MonitorBackend]:
         with self._lock:
-            self._destroy_ddc_handles()
-            ddc_list: List[MonitorBackend] = []
+            previous = self._snapshot
+            current = {m.monitor_id: m for m in previous.monitors}
+            monitors = self._scan_backends(current)
+
+            kept = {m.monitor_id: m for m in monitors}
+            for monitor_id, m in current.items():
+                if monitor_id not in kept:
+                    Logger.info(f"Monitor removed: {monitor_id}")
+                    self._close_writers(monitor_id)
+                    self._health.forget(monitor_id)
+                    self._read_cache.forget(monitor_id)
+                elif kept[monitor_id] is not m:
+                    # Same monitor under a new handle (e.g. new HMONITOR after wake);
+                    # its writer is replaced on the next write.
+                    Logger.info(f"Monitor re-opened: {monitor_id}")
+                else:
+                    continue
+                try:
+                    m.close()
+                except Exception:
+                    pass
+            for m in monitors:
+                if m.monitor_id not in current:
+                    Logger.info(f"Monitor added: {m.monitor_id}")
+
+            self._snapshot = MonitorSnapshot(
+                monitors=tuple(monitors),
+                generation=previous.generation + 1,
+                scanned_at=time.time(),
+            )
+            self._read_cache.invalidate()
+            return list(monitors)
 
-            hmonitors: List[int] = []
+    def reopen_monitor(self, monitor_id: str) -> bool:
+        """Re-open one monitor in place without rescanning the others.
 
-            @_MonitorEnumProc
-            def _cb(hmonitor, _hdc, _rect, _lparam):
-                hmonitors.append(int(ctypes.cast(hmonitor, ctypes.c_void_p).value or 0))
-                return 1
+        DDC/CI monitors get a fresh physical monitor handle from their HMONITOR;
+        WMI monitors are looked up again by instance name; other backends use
+        ``MonitorBackend.reopen``. Returns ``False`` when the monitor can no
+        longer be resolved.
+        """
+        with self._lock:
+            previous = self._snapshot
+            index = previous.index_of(monitor_id)
+            old = previous.get(index)
+            if isinstance(old, DdcCiMonitor):
+                opened = self._open_physical_monitor(old.hmonitor, old.physical_index)
+                if opened is None:
+                    return False
+                handle, desc = opened
+                fresh: MonitorBackend = DdcCiMonitor(handle, desc, monitor_id, old.hmonitor, old.physical_index)
+            elif isinstance(old, WmiMonitor):
+                try:
+                    values = _query_wmi_brightness(timeout_s=2.5)
+                except Exception as e:
+                    Logger.error(f"WMI lookup failed: {e}")
+                    return False
+                if old.instance_name not in values:
+                    return False
+                self._wmi_batch.fill(values)
+                fresh = old
+            elif old is not None and old.reopen():
+                fresh = old
+            else:
+                return False
 
-            ok = _user32.EnumDisplayMonitors(None, None, _cb, None)
-            if not ok:
-                Logger.error(f"EnumDisplayMonitors failed: {ctypes.get_last_error()}")
+            if fresh is not old:
+                monitors = list(previous.monitors)
+                monitors[index] = fresh
+                self._snapshot = MonitorSnapshot(
+                    monitors=tuple(monitors),
+                    generation=previous.generation + 1,
+                    scanned_at=time.time(),
+                )
+                try:
+                    old.close()
+                except Exception:
+                    pass
+            self._read_cache.invalidate(monitor_id)
+            return True
 
-            for hmon in hmonitors:
-                count = ctypes.c_uint32()
-                ok = _dxva2.GetNumberOfPhysicalMonitorsFromHMONITOR(ctypes.c_void_p(hmon), ctypes.byref(count))
-                if not ok or not count.value:
-                    continue
-                arr_type = _PHYSICAL_MONITOR * int(count.value)
-                arr = arr_type()
-                ok = _dxva2.GetPhysicalMonitorsFromHMONITOR(ctypes.c_void_p(hmon), count, arr)
-                if not ok:
-                    continue
+    def snapshot(self) -> MonitorSnapshot:
+        return self._snapshot
 
-                for i in range(int(count.value)):
-                    pm = arr[i]
-                    self._ddc_handles.append(pm)
-                    desc = str(pm.szPhysicalMonitorDescription)
-                    ddc_list.append(DdcCiMonitor(int(pm.hPhysicalMonitor), desc))
+    def get_monitors(self) -> List[MonitorBackend]:
+        return list(self._snapshot.monitors)
 
-            wmi_list: List[MonitorBackend] = []
-            try:
-                script = (
-                    "Get-CimInstance -Namespace root\\wmi -ClassName WmiMonitorBrightness "
-                    "| Select-Object -Property InstanceName "
-                    "| ConvertTo-Json -Compress"
-                )
-                value = _run_powershell_json(script, timeout_s=2.5)
-                instances: Sequence[Any]
-                if value is None:
-                    instances = []
-                elif isinstance(value, list):
-                    instances = value
-                else:
-                    instances = [value]
-                for item in instances:
-                    name = (item or {}).get("InstanceName")
-                    if isinstance(name, str) and name.strip():
-                        wmi_list.append(WmiMonitor(name.strip()))
-            except Exception:
-                wmi_list = []
+    def get_monitor_ids(self) -> List[str]:
+        return list(self._snapshot.ids)
 
-            self._monitors = [*ddc_list, *wmi_list]
-            return list(self._monitors)
+    def get_monitor_id(self, index: int) -> Optional[str]:
+        monitor = self._snapshot.get(index)
+        return monitor.monitor_id if monitor is not None else None
 
-    def get_monitors(self) -> List[MonitorBackend]:
-        with self._lock:
-            return list(self._monitors)
+    def index_of(self, monitor_id: Optional[str]) -> int:
+        return self._snapshot.index_of(monitor_id)
 
-    def get_brightness_percent(self, index: int) -> Optional[int]:
-        with self._lock:
-            if index < 0 or index >= len(self._monitors):
-                return None
-            return self._monitors[index].get_brightness_percent()
+    @property
+    def read_cache(self) -> BrightnessReadCache:
+        return self._read_cache
 
-    def set_brightness_percent(self, index: int, percent: int) -> bool:
-        with self._lock:
-            if index < 0 or index >= len(self._monitors):
-                return False
-            return self._monitors[index].set_brightness_percent(percent)
+    def invalidate_cache(self) -> None:
+        self._read_cache.invalidate()
+        self._wmi_batch.invalidate()
 
-    def set_all_brightness_percent(self, percent: int) -> int:
-        with self._lock:
-            ok_count = 0
-            for m in self._monitors:
+    def is_quarantined(self, monitor_id: Optional[str]) -> bool:
+        return bool(monitor_id) and self._health.is_quarantined(monitor_id)
+
+    def get_health_stats(self) -> Dict[str, Any]:
+        return self._health.stats()
+
+    def _read_hardware(self, monitor: MonitorBackend) -> Optional[int]:
+        try:
+            value = monitor.get_brightness_percent()
+        except BusBusyError as e:
+            # Other commands held the bus; the monitor did not fail, so its health is untouched.
+            Logger.info(f"Get brightness skipped on {monitor.monitor_id}: {e}")
+            self._health.record_skipped(monitor.monitor_id)
+            return None
+        except Exception as e:
+            Logger.error(f"Get brightness failed on {monitor.monitor_id}: {e}")
+            value = None
+        if value is None:
+            self._health.record_failure(monitor.monitor_id)
+        else:
+            self._health.record_success(monitor.monitor_id)
+        return value
+
+    def probe_quarantined(self) -> List[str]:
+        """Run due half-open probes: re-open the monitor and try one read.
+
+        Returns the IDs of monitors that recovered.
+        """
+        recovered: List[str] = []
+        for monitor_id in self._health.due_probes():
+            started = time.monotonic()
+            if not self.reopen_monitor(monitor_id):
+                self._health.record_failure(monitor_id)
+                continue
+            monitor = self._snapshot.get(self._snapshot.index_of(monitor_id))
+            value = self._read_hardware(monitor) if monitor is not None else None
+            if value is None:
+                continue
+            self._read_cache.put(monitor_id, value)
+            recovered.append(monitor_id)
+            Logger.info(f"Probe of {monitor_id} succeeded in {(time.monotonic() - started) * 1000.0:.0f}ms")
+        return recovered
+
+    def get_brightness_percent(self, index: int) -> Optional[int]:
+        monitor = self._snapshot.get(index)
+        if monitor is None or self._health.is_quarantined(monitor.monitor_id):
+            return None
+        return self._read_cache.get(monitor.monitor_id, lambda: self._read_hardware(monitor))
+
+    def read_brightness(self, index: int, timeout_s: Optional[float] = None) -> ReadResult:
+        """Read one monitor, waiting at most ``timeout_s`` for the hardware.
+
+        On a timeout the last known value is returned as ``stale`` when there is
+        one. The hardware read itself is not abandoned: it finishes on the read
+        pool and refreshes the cache for the next caller.
+        """
+        monitor = self._snapshot.get(index)
+        if monitor is None:
+            return ReadResult(None, None, RESULT_FAILED)
+        monitor_id = monitor.monitor_id
+        if self._health.is_quarantined(monitor_id):
+            return ReadResult(monitor_id, None, RESULT_FAILED)
+        value, completed = self._read_cache.get_within(
+            monitor_id,
+            lambda: self._read_hardware(monitor),
+            self._read_pool.submit,
+            timeout_s,
+        )
+        if value is not None:
+            return ReadResult(monitor_id, int(value), RESULT_OK)
+        if completed:
+            return ReadResult(monitor_id, None, RESULT_FAILED)
+        last = self._read_cache.last_known(monitor_id)
+        if last is None:
+            return ReadResult(monitor_id, None, RESULT_TIMEOUT)
+        return ReadResult(monitor_id, last[0], RESULT_STALE, age_s=time.monotonic() - last[1])
+
+    def get_all_brightness_percent(self) -> List[Optional[int]]:
+        monitors = self._snapshot.monitors
+        if any(isinstance(m, WmiMonitor) for m in monitors):
+            self._wmi_batch.invalidate()
+        result: List[Optional[int]] = []
+        for m in monitors:
+            value = None if self._health.is_quarantined(m.monitor_id) else self._read_hardware(m)
+            if value is not None:
+                self._read_cache.put(m.monitor_id, value)
+            result.append(value)
+        return result
+
+    def _writer_for(self, monitor: MonitorBackend) -> MonitorWriter:
+        monitor_id = monitor.monitor_id
+        with self._writers_lock:
+            entry = self._writers.get(monitor_id)
+            if entry is not None and entry[0] is monitor:
+                return entry[1]
+            if entry is not None:
+                entry[1].close()
+            writer = MonitorWriter(
+                monitor_id,
+                monitor.set_brightness_percent,
+                self._apply_pool,
+                on_complete=self._on_write_complete,
+            )
+            self._writers[monitor_id] = (monitor, writer)
+            return writer
+
+    def _close_writers(self, monitor_id: Optional[str]) -> None:
+        with self._writers_lock:
+            if monitor_id is None:
+                entries = list(self._writers.values())
+                self._writers.clear()
+            else:
+                entry = self._writers.pop(monitor_id, None)
+                entries = [entry] if entry is not None else []
+        for _monitor, writer in entries:
+            writer.close()
+
+    def add_write_listener(self, callback: Callable[[WriteTicket], None]) -> None:
+        """Call ``callback`` with every settled write ticket, on the writer's thread."""
+        self._write_listeners.append(callback)
+
+    def _on_write_complete(self, ticket: WriteTicket) -> None:
+        if ticket.ok:
+            self._read_cache.put(ticket.monitor_id, ticket.percent)
+            self._health.record_success(ticket.monitor_id)
+        elif ticket.status == WRITE_FAILED:
+            self._read_cache.invalidate(ticket.monitor_id)
+            self._health.record_failure(ticket.monitor_id)
+        for listener in self._write_listeners:
+            try:
+                listener(ticket)
+            except Exception as e:
+                Logger.error(f"Brightness write listener failed: {e}")
+
+    def submit_brightness_percent(
+        self,
+        index: int,
+        percent: int,
+        on_complete: Optional[Callable[[WriteTicket], None]] = None,
+    ) -> Optional[WriteTicket]:
+        """Hand ``percent`` to the monitor's writer without waiting for the hardware.
+
+        Returns ``None`` for an unknown index or a quarantined monitor.
+        """
+        monitor = self._snapshot.get(index)
+        if monitor is None or self._health.is_quarantined(monitor.monitor_id):
+            return None
+        percent = _clamp_int(int(percent), 0, 100)
+        return self._writer_for(monitor).submit(percent, on_complete=on_complete)
+
+    def cancel_pending_writes(self, monitor_id: Optional[str] = None) -> int:
+        with self._writers_lock:
+            writers = [w for mid, (_m, w) in self._writers.items() if monitor_id is None or mid == monitor_id]
+        return sum(1 for w in writers if w.cancel_pending())
+
+    def is_writing(self, monitor_id: Optional[str]) -> bool:
+        """Whether the monitor's writer has a write in flight or waiting."""
+        with self._writers_lock:
+            entry = self._writers.get(monitor_id) if monitor_id else None
+        return entry is not None and entry[1].busy
+
+    def get_write_latency_ms(self, monitor_id: Optional[str] = None) -> Optional[float]:
+        """Slowest measured write latency across writers (or for one monitor)."""
+        with self._writers_lock:
+            writers = [w for mid, (_m, w) in self._writers.items() if monitor_id is None or mid == monitor_id]
+        samples = [w.latency_ema_ms for w in writers if w.latency_ema_ms is not None]
+        return max(samples) if samples else None
+
+    def get_bus_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {m.monitor_id: m.bus.stats() for m in self._snapshot.monitors if isinstance(m, DdcCiMonitor)}
+
+    def get_writer_stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._writers_lock:
+            writers = [(mid, w) for mid, (_m, w) in self._writers.items()]
+        return {mid: w.stats() for mid, w in writers}
+
+    def write_brightness(self, index: int, percent: int, timeout_s: Optional[float] = None) -> WriteResult:
+        """Write one monitor, waiting at most ``timeout_s`` for the hardware.
+
+        A write still waiting in the mailbox when the deadline passes is
+        cancelled; one already running is left to finish.
+        """
+        percent = _clamp_int(int(percent), 0, 100)
+        monitor_id = self.get_monitor_id(index)
+        ticket = self.submit_brightness_percent(index, percent)
+        if ticket is None:
+            return WriteResult(monitor_id, percent, RESULT_FAILED)
+        if not ticket.wait(timeout_s) and (ticket.cancel() or not ticket.done()):
+            return WriteResult(monitor_id, percent, RESULT_TIMEOUT, ticket)
+        return WriteResult(monitor_id, percent, ticket.status, ticket)
+
+    def set_brightness_percent(self, index: int, percent: int, timeout_s: Optional[float] = None) -> bool:
+        return self.write_brightness(index, percent, timeout_s).ok
+
+    def apply_all_brightness_percent(
+        self,
+        percent: int,
+        deadline_s: float = 5.0,
+        barrier: bool = True,
+        skip_ids: Container[str] = (),
+    ) -> ApplyResult:
+        """Write ``percent`` to every monitor except ``skip_ids`` and quarantined ones.
+
+        Both are reported in the result (``skipped`` / ``quarantined``) without
+        touching the hardware.
+        """
+        monitors = self._snapshot.monitors
+        percent = _clamp_int(int(percent), 0, 100)
+        result = ApplyResult(percent=percent)
+        if not monitors:
+            return result
+
+        t0 = time.monotonic()
+        quarantined = {m.monitor_id for m in monitors if self._health.is_quarantined(m.monitor_id)}
+        writing = [m for m in monitors if m.monitor_id not in skip_ids and m.monitor_id not in quarantined]
+        writers = {m.monitor_id: self._writer_for(m) for m in writing}
+        # Only idle writers line up at the start gate: a busy one reaches it only after
+        # its current write, and would hold every other monitor until the barrier timed out.
+        gated = [mid for mid, w in writers.items() if not w.busy]
+        gate: Optional[Callable[[], None]] = None
+        release: Optional[Callable[[WriteTicket], None]] = None
+        if barrier and 1 < len(gated) <= _APPLY_MAX_WORKERS:
+            sync = threading.Barrier(len(gated), timeout=_APPLY_BARRIER_TIMEOUT_S)
+
+            def _gate() -> None:
                 try:
-                    if m.set_brightness_percent(percent):
-                        ok_count += 1
-                except Exception:
-                    continue
-            return ok_count
+                    sync.wait()
+                except threading.BrokenBarrierError:
+                    pass
+
+            def _release(ticket: WriteTicket) -> None:
+                # A gated ticket that never runs never reaches the gate; let the others go.
+                if ticket.status in (WRITE_SUPERSEDED, WRITE_CANCELLED):
+                    sync.abort()
+
+            gate = _gate
+            release = _release
+
+        tickets = {
+            mid: w.submit(percent, gate=gate, on_complete=release) if mid in gated else w.submit(percent)
+            for mid, w in writers.items()
+        }
+        deadline = t0 + max(0.0, float(deadline_s))
+        for ticket in tickets.values():
+            ticket.wait(max(0.0, deadline - time.monotonic()))
+
+        for index, m in enumerate(monitors):
+            info = m.get_info()
+            ticket = tickets.get(m.monitor_id)
+            if m.monitor_id in quarantined:
+                result.monitors.append(
+                    MonitorApplyResult(
+                        index=index,
+                        monitor_id=m.monitor_id,
+                        name=info.name,
+                        backend=info.backend,
+                        ok=False,
+                        quarantined=True,
+                    )
+                )
+            elif ticket is None:
+                result.monitors.append(
+                    MonitorApplyResult(
+                        index=index,
+                        monitor_id=m.monitor_id,
+                        name=info.name,
+                        backend=info.backend,
+                        ok=True,
+                        skipped=True,
+                    )
+                )
+            elif ticket.done():
+                result.monitors.append(
+                    MonitorApplyResult(
+                        index=index,
+                        monitor_id=m.monitor_id,
+                        name=info.name,
+                        backend=info.backend,
+                        ok=ticket.ok or ticket.status == WRITE_SUPERSEDED,
+                        latency_ms=ticket.latency_ms,
+                        start_offset_ms=((ticket.started_at or t0) - t0) * 1000.0,
+                    )
+                )
+            else:
+                ticket.cancel()
+                result.monitors.append(
+                    MonitorApplyResult(
+                        index=index,
+                        monitor_id=m.monitor_id,
+                        name=info.name,
+                        backend=info.backend,
+                        ok=False,
+                        latency_ms=(time.monotonic() - t0) * 1000.0,
+                        timed_out=True,
+                    )
+                )
+        result.elapsed_ms = (time.monotonic() - t0) * 1000.0
+        return result
+
+    def set_all_brightness_percent(self, percent: int) -> int:
+        return self.apply_all_brightness_percent(percent).ok_count
+
 
+MonitorBackendRegistry.register("ddcci", lambda manager, current: manager._scan_ddc(current))
+MonitorBackendRegistry.register("wmi", lambda manager, current: manager._scan_wmi(current))
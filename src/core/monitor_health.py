@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from .logger import Logger
+
+
+HEALTH_HEALTHY = "healthy"
+HEALTH_DEGRADED = "degraded"
+HEALTH_QUARANTINED = "quarantined"
+
+
+@dataclass
+class _Health:
+    state: str = HEALTH_HEALTHY
+    failures: int = 0
+    quarantined_at: float = 0.0
+    probe_interval_s: float = 0.0
+    next_probe_at: float = 0.0
+    probing: bool = False
+    trips: int = 0
+
+
+class MonitorHealth:
+    """Per-monitor circuit breaker: healthy -> degraded -> quarantined.
+
+    The first failure marks a monitor degraded; ``quarantine_after``
+    consecutive failures quarantine it. Quarantined monitors are skipped until
+    a probe is due (half-open), then one probe decides: success closes the
+    breaker, failure keeps it open and doubles the probe interval.
+    """
+
+    def __init__(
+        self,
+        quarantine_after: int = 3,
+        probe_interval_s: float = 10.0,
+        max_probe_interval_s: float = 120.0,
+    ):
+        self._lock = threading.Lock()
+        self._quarantine_after = max(1, int(quarantine_after))
+        self._probe_interval_s = float(probe_interval_s)
+        self._max_probe_interval_s = max(float(max_probe_interval_s), self._probe_interval_s)
+        self._entries: Dict[str, _Health] = {}
+
+    def state(self, monitor_id: str) -> str:
+        with self._lock:
+            entry = self._entries.get(monitor_id)
+            return entry.state if entry is not None else HEALTH_HEALTHY
+
+    def is_quarantined(self, monitor_id: str) -> bool:
+        return self.state(monitor_id) == HEALTH_QUARANTINED
+
+    def record_success(self, monitor_id: str) -> None:
+        with self._lock:
+            entry = self._entries.get(monitor_id)
+            if entry is None or entry.state == HEALTH_HEALTHY:
+                return
+            previous = entry.state
+            entry.state = HEALTH_HEALTHY
+            entry.failures = 0
+            entry.probing = False
+            down_s = time.monotonic() - entry.quarantined_at
+        if previous == HEALTH_QUARANTINED:
+            Logger.info(f"Monitor {monitor_id} recovered after {down_s:.1f}s in quarantine")
+
+    def record_failure(self, monitor_id: str) -> str:
+        now = time.monotonic()
+        tripped = False
+        with self._lock:
+            entry = self._entries.setdefault(monitor_id, _Health())
+            entry.failures += 1
+            entry.probing = False
+            if entry.state == HEALTH_QUARANTINED:
+                # A failed probe: keep the breaker open and back off.
+                entry.probe_interval_s = min(self._max_probe_interval_s, entry.probe_interval_s * 2)
+                entry.next_probe_at = now + entry.probe_interval_s
+            elif entry.failures >= self._quarantine_after:
+                entry.state = HEALTH_QUARANTINED
+                entry.quarantined_at = now
+                entry.probe_interval_s = self._probe_interval_s
+                entry.next_probe_at = now + entry.probe_interval_s
+                entry.trips += 1
+                tripped = True
+            else:
+                entry.state = HEALTH_DEGRADED
+            state = entry.state
+            failures = entry.failures
+        if tripped:
+            Logger.error(f"Monitor {monitor_id} quarantined after {failures} consecutive failures")
+        return state
+
+    def record_skipped(self, monitor_id: str) -> None:
+        """A read that never reached the monitor (e.g. the bus was busy): no verdict either way.
+
+        A probe in flight is released so it runs again at the next check.
+        """
+        with self._lock:
+            entry = self._entries.get(monitor_id)
+            if entry is not None:
+                entry.probing = False
+
+    def due_probes(self) -> List[str]:
+        """Quarantined monitors whose probe is due; each is marked as probing."""
+        now = time.monotonic()
+        due: List[str] = []
+        with self._lock:
+            for monitor_id, entry in self._entries.items():
+                if entry.state == HEALTH_QUARANTINED and not entry.probing and now >= entry.next_probe_at:
+                    entry.probing = True
+                    due.append(monitor_id)
+        return due
+
+    def forget(self, monitor_id: str) -> None:
+        with self._lock:
+            self._entries.pop(monitor_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                monitor_id: {
+                    "state": entry.state,
+                    "failures": entry.failures,
+                    "trips": entry.trips,
+                    "next_probe_s": max(0.0, entry.next_probe_at - now) if entry.state == HEALTH_QUARANTINED else None,
+                }
+                for monitor_id, entry in self._entries.items()
+            }
+
+    def quarantined_ids(self) -> List[str]:
+        with self._lock:
+            return [mid for mid, e in self._entries.items() if e.state == HEALTH_QUARANTINED]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .logger import Logger
+
+if TYPE_CHECKING:
+    from .monitor_control import MonitorBackend, MonitorManager
+
+
+# (manager, monitors from the previous scan by ID) -> monitors now present.
+# Providers reuse objects from the previous scan whose ID is still present.
+MonitorProvider = Callable[['MonitorManager', Dict[str, 'MonitorBackend']], List['MonitorBackend']]
+
+BACKENDS_ENV = "BRIGHTNESS_BACKENDS"
+
+# Where the built-in providers register themselves; imported on first lookup.
+_BUILTIN_MODULES = {
+    "ddcci": "src.core.monitor_control",
+    "wmi": "src.core.monitor_control",
+    "sim": "src.core.simulated_monitor",
+}
+_DEFAULT_WINDOWS_BACKENDS = ("ddcci", "wmi")
+
+
+class MonitorBackendRegistry:
+    """Named monitor providers that ``MonitorManager.scan`` enumerates, in order.
+
+    A provider's name is also the prefix of the IDs of the monitors it returns
+    (``ddcci:...``, ``wmi:...``, ``sim:...``). Built-in providers live in their
+    own modules and are imported only when a manager first asks for them.
+    """
+
+    _providers: Dict[str, MonitorProvider] = {}
+
+    @classmethod
+    def register(cls, name: str, provider: MonitorProvider) -> None:
+        cls._providers[name] = provider
+
+    @classmethod
+    def get(cls, name: str) -> Optional[MonitorProvider]:
+        provider = cls._providers.get(name)
+        if provider is None and name in _BUILTIN_MODULES:
+            importlib.import_module(_BUILTIN_MODULES[name])
+            provider = cls._providers.get(name)
+        return provider
+
+    @classmethod
+    def configured(cls) -> Tuple[str, ...]:
+        """Backends named in ``BRIGHTNESS_BACKENDS`` (comma separated), else the platform default.
+
+        Only Windows has real providers, so other platforms default to none;
+        set ``BRIGHTNESS_BACKENDS=sim`` there to get simulated monitors.
+        """
+        raw = os.environ.get(BACKENDS_ENV, "")
+        names = tuple(n.strip().lower() for n in raw.split(",") if n.strip())
+        if names:
+            return names
+        return _DEFAULT_WINDOWS_BACKENDS if sys.platform == "win32" else ()
+
+    @classmethod
+    def scan(
+        cls,
+        names: Tuple[str, ...],
+        manager: 'MonitorManager',
+        current: Dict[str, 'MonitorBackend'],
+    ) -> List['MonitorBackend']:
+        monitors: List['MonitorBackend'] = []
+        for name in names:
+            try:
+                provider = cls.get(name)
+            except Exception as e:
+                Logger.error(f"Monitor backend {name} failed to load: {e}")
+                provider = None
+            if provider is None:
+                Logger.error(f"Unknown monitor backend: {name}")
+                continue
+            try:
+                monitors.extend(provider(manager, current))
+            except Exception as e:
+                # Keep what this backend found last time rather than dropping its monitors.
+                Logger.error(f"Monitor backend {name} scan failed: {e}")
+                monitors.extend(m for mid, m in current.items() if mid.startswith(f"{name}:"))
+        return monitors
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from .logger import Logger
+
+
+class BackgroundScanner:
+    """Runs monitor scans on a dedicated thread.
+
+    Requests never block: they return a ticket that is satisfied once a scan
+    that started after the request has finished. Requests arriving while a scan
+    is pending collapse into that one scan.
+    """
+
+    def __init__(self, scan_fn: Callable[[], Any], min_interval_s: float = 3.0):
+        self._scan_fn = scan_fn
+        self._min_interval_s = float(min_interval_s)
+        self._cond = threading.Condition()
+        self._pending = False
+        self._in_flight = False
+        self._started = 0
+        self._finished = 0
+        self._last_scan_ts = 0.0
+        self._thread = threading.Thread(target=self._run, name="monitor-scanner", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                self._pending = False
+                self._in_flight = True
+                self._started += 1
+                ticket = self._started
+            try:
+                self._scan_fn()
+            except Exception as e:
+                Logger.error(f"Monitor scan failed: {e}")
+            with self._cond:
+                self._in_flight = False
+                self._finished = ticket
+                self._last_scan_ts = time.monotonic()
+                self._cond.notify_all()
+
+    def request(self, force: bool = False) -> int:
+        with self._cond:
+            if not force:
+                if self._in_flight or self._pending:
+                    return self._started + (1 if self._pending else 0)
+                if time.monotonic() - self._last_scan_ts < self._min_interval_s:
+                    return self._finished
+            self._pending = True
+            self._cond.notify_all()
+            return self._started + 1
+
+    def wait(self, ticket: int, timeout_s: Optional[float] = None) -> bool:
+        deadline = None if timeout_s is None else time.monotonic() + max(0.0, float(timeout_s))
+        with self._cond:
+            while self._finished < ticket:
+                if deadline is None:
+                    self._cond.wait()
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def is_scanning(self) -> bool:
+        with self._cond:
+            return self._in_flight or self._pending
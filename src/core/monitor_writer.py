@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, List, Optional
+
+from .logger import Logger
+
+
+WRITE_PENDING = "pending"
+WRITE_RUNNING = "running"
+WRITE_OK = "ok"
+WRITE_FAILED = "failed"
+WRITE_SUPERSEDED = "superseded"
+WRITE_CANCELLED = "cancelled"
+
+# Weight of the newest sample in the write latency moving average.
+_LATENCY_EMA_ALPHA = 0.3
+
+
+class WriteTicket:
+    """Handle for one brightness target handed to a ``MonitorWriter``.
+
+    A ticket ends ``ok``/``failed`` once the hardware write ran, ``superseded``
+    when a newer target replaced it in the mailbox, or ``cancelled``.
+    """
+
+    def __init__(self, writer: 'MonitorWriter', percent: int, gate: Optional[Callable[[], None]] = None):
+        self._writer = writer
+        self.monitor_id = writer.monitor_id
+        self.percent = int(percent)
+        self.gate = gate
+        self.status = WRITE_PENDING
+        self.submitted_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._event = threading.Event()
+        self._callbacks: List[Callable[['WriteTicket'], None]] = []
+
+    @property
+    def ok(self) -> bool:
+        return self.status == WRITE_OK
+
+    @property
+    def latency_ms(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return (self.finished_at - self.started_at) * 1000.0
+
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def wait(self, timeout_s: Optional[float] = None) -> bool:
+        return self._event.wait(timeout_s)
+
+    def cancel(self) -> bool:
+        """Cancel the write if it has not started yet."""
+        return self._writer._cancel_ticket(self)
+
+    def add_done_callback(self, callback: Callable[['WriteTicket'], None]) -> None:
+        with self._writer._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+
+class MonitorWriter:
+    """Serial writer for one monitor with a one-slot, latest-value-wins mailbox.
+
+    Submitting a new target replaces the one still waiting, so after a burst of
+    targets the monitor receives at most the write in flight plus the newest
+    value. Writes for different monitors drain independently on the shared
+    executor; at most one drain runs per writer, which keeps them ordered.
+    """
+
+    def __init__(
+        self,
+        monitor_id: str,
+        write_fn: Callable[[int], bool],
+        executor: Executor,
+        on_complete: Optional[Callable[[WriteTicket], None]] = None,
+    ):
+        self.monitor_id = monitor_id
+        self._write_fn = write_fn
+        self._executor = executor
+        self._on_complete = on_complete
+        self._lock = threading.Lock()
+        self._pending: Optional[WriteTicket] = None
+        self._draining = False
+        self._closed = False
+        self._submitted = 0
+        self._written = 0
+        self._failed = 0
+        self._superseded = 0
+        self._cancelled = 0
+        self._latency_ema_ms: Optional[float] = None
+
+    @property
+    def latency_ema_ms(self) -> Optional[float]:
+        """Moving average of completed hardware write latency, ``None`` before the first write."""
+        return self._latency_ema_ms
+
+    @property
+    def busy(self) -> bool:
+        return self._draining
+
+    def submit(
+        self,
+        percent: int,
+        on_complete: Optional[Callable[[WriteTicket], None]] = None,
+        gate: Optional[Callable[[], None]] = None,
+    ) -> WriteTicket:
+        """Queue ``percent`` as the newest target; ``gate`` runs right before the write."""
+        ticket = WriteTicket(self, percent, gate=gate)
+        if on_complete is not None:
+            ticket._callbacks.append(on_complete)
+        start = False
+        with self._lock:
+            if self._closed:
+                ticket.status = WRITE_CANCELLED
+                self._cancelled += 1
+                replaced = None
+            else:
+                self._submitted += 1
+                replaced = self._pending
+                if replaced is not None:
+                    replaced.status = WRITE_SUPERSEDED
+                    self._superseded += 1
+                self._pending = ticket
+                if not self._draining:
+                    self._draining = True
+                    start = True
+        if replaced is not None:
+            self._finish(replaced)
+        if ticket.status == WRITE_CANCELLED:
+            self._finish(ticket)
+        if start:
+            try:
+                self._executor.submit(self._drain)
+            except RuntimeError:
+                # Executor shut down: nothing will ever drain this mailbox.
+                self.close()
+        return ticket
+
+    def cancel_pending(self) -> bool:
+        with self._lock:
+            ticket = self._pending
+        return ticket.cancel() if ticket is not None else False
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        self.cancel_pending()
+
+    def _cancel_ticket(self, ticket: WriteTicket) -> bool:
+        with self._lock:
+            if self._pending is not ticket:
+                return False
+            self._pending = None
+            ticket.status = WRITE_CANCELLED
+            self._cancelled += 1
+        self._finish(ticket)
+        return True
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                ticket = self._pending
+                self._pending = None
+                if ticket is None:
+                    self._draining = False
+                    return
+                ticket.status = WRITE_RUNNING
+
+            if ticket.gate is not None:
+                try:
+                    ticket.gate()
+                except Exception:
+                    pass
+            ticket.started_at = time.monotonic()
+            try:
+                ok = bool(self._write_fn(ticket.percent))
+            except Exception as e:
+                Logger.error(f"Set brightness failed on {self.monitor_id}: {e}")
+                ok = False
+            ticket.finished_at = time.monotonic()
+
+            with self._lock:
+                ticket.status = WRITE_OK if ok else WRITE_FAILED
+                if ok:
+                    self._written += 1
+                else:
+                    self._failed += 1
+                ema = self._latency_ema_ms
+                sample = ticket.latency_ms
+                self._latency_ema_ms = sample if ema is None else ema + _LATENCY_EMA_ALPHA * (sample - ema)
+            self._finish(ticket)
+
+    def _finish(self, ticket: WriteTicket) -> None:
+        with self._lock:
+            callbacks = ticket._callbacks
+            ticket._callbacks = []
+            ticket._event.set()
+        if self._on_complete is not None:
+            callbacks = [self._on_complete, *callbacks]
+        for cb in callbacks:
+            try:
+                cb(ticket)
+            except Exception as e:
+                Logger.error(f"Brightness write callback failed: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "submitted": self._submitted,
+                "written": self._written,
+                "failed": self._failed,
+                "superseded": self._superseded,
+                "cancelled": self._cancelled,
+                "busy": self._draining,
+                "latency_ema_ms": self._latency_ema_ms,
+            }
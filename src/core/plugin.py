@@ -1,10 +1,12 @@
 import json
 import threading
 import websocket
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 from .timer import Timer
 from .action import Action
 from .logger import Logger
+from .ws_writer import WebSocketWriter
+from .event_dispatcher import EventDispatcher, InboundEvent
 
 _TRANSLATIONS: Dict[str, Dict[str, str]] = {
     "zh_CN": {
@@ -25,6 +27,30 @@ _TRANSLATIONS: Dict[str, Dict[str, str]] = {
     },
 }
 
+# Input events for one context -> Action handler.
+_CONTEXT_EVENTS = {
+    'keyDown': 'on_key_down',
+    'keyUp': 'on_key_up',
+    'dialDown': 'on_dial_down',
+    'dialUp': 'on_dial_up',
+    'dialRotate': 'on_dial_rotate',
+}
+
+# Plugin-wide events; delivered to every action through its own context queue.
+_GLOBAL_EVENTS = {
+    'didReceiveGlobalSettings': None,
+    'deviceDidConnect': 'on_device_did_connect',
+    'deviceDidDisconnect': 'on_device_did_disconnect',
+    'applicationDidLaunch': 'on_application_did_launch',
+    'applicationDidTerminate': 'on_application_did_terminate',
+    'systemDidWakeUp': 'on_system_did_wake_up',
+}
+
+_INSPECTOR_EVENTS = {
+    'propertyInspectorDidAppear': 'on_property_inspector_did_appear',
+    'propertyInspectorDidDisappear': 'on_property_inspector_did_disappear',
+}
+
 
 class Plugin:
     """Stream Dock插件的核心类，负责管理WebSocket连接和处理Stream Dock事件。
@@ -56,6 +82,14 @@ class Plugin:
             on_message=self._on_message,
             on_error=lambda ws, error: Logger.error(f"WebSocket error: {error}")
         )
+        # Every outbound message goes through this queue; only its thread touches the socket.
+        self.writer = WebSocketWriter(self.ws.send)
+        # Handlers run here, one serial queue per context, never on the receive thread.
+        self.dispatcher = EventDispatcher(self._handle_event)
+        # Contexts seen in willAppear and not yet in willDisappear (receive thread only).
+        self._contexts: Set[str] = set()
+        # Run by stop() before anything is torn down (e.g. flushing unsaved settings).
+        self._shutdown_hooks: List[Callable[[], Any]] = []
         
         # Start WebSocket connection in a separate thread
         threading.Thread(target=self.ws.run_forever, daemon=True).start()
@@ -99,16 +133,15 @@ class Plugin:
         """        
         Logger.info("WebSocket connected")
         
-        ws.send(json.dumps({'event': event, 'uuid': plugin_uuid}))
+        self.writer.send_first({'event': event, 'uuid': plugin_uuid})
+        self.writer.set_connected(True)
     
     def _on_message(self, ws, message):
         """处理从Stream Dock接收到的WebSocket消息
         
-        根据接收到的事件类型执行相应的操作，包括：
-        - 处理全局settings更新
-        - 处理按钮出现/消失事件
-        - 处理按钮settings更改
-        - 处理标题参数更改
+        接收线程只负责解析和分发：事件按context放入各自的串行队列，
+        由事件分发线程池执行（同一context内按到达顺序，包括willAppear/willDisappear；
+        不同context之间并发）。全局事件会分发到每个已出现的context的队列。
         
         Args:
             ws: WebSocket连接实例
@@ -119,97 +152,93 @@ class Plugin:
         Logger.info(event)
         if event == 'didReceiveGlobalSettings':
             self.global_settings = data.get('payload', {}).get('settings')
-            for action in self.actions.values():
-                if hasattr(action, 'on_did_receive_global_settings'):
-                    action.on_did_receive_global_settings(self.global_settings)
-        elif event == 'willAppear':
-            context = data.get('context')
+        context = data.get('context')
+        if event in _GLOBAL_EVENTS:
+            for target in list(self._contexts):
+                self.dispatcher.submit(target, InboundEvent(event, target, data))
+            return
+        if event == 'willAppear':
+            self._contexts.add(context)
+        elif event == 'willDisappear':
+            self._contexts.discard(context)
+        key = context if isinstance(context, str) else self.plugin_uuid
+        self.dispatcher.submit(key, InboundEvent(event, context, data))
+    
+    def _handle_event(self, item: InboundEvent):
+        """在分发线程上处理一个事件（同一context的事件不会并发执行）
+        
+        Args:
+            item: 已解析的事件
+        """
+        event = item.event
+        context = item.context
+        data = item.data
+        if event == 'willAppear':
             if context not in self.actions:
                 from .action_factory import ActionFactory
                 action = ActionFactory.create_action(
                     data.get('action'),
                     context,
-                    data.get('payload', {}).get('settings', {}),
+                    item.payload.get('settings', {}),
                     self
                 )
                 if action:
                     self.actions[context] = action
                 else:
                     Logger.error(f"Failed to create action for context: {context}")
-        elif event == 'willDisappear':
-            context = data.get('context')
-            if context in self.actions:
-                action = self.actions[context]
-                if hasattr(action, 'on_will_disappear'):
-                    action.on_will_disappear()
-                del self.actions[context]
+            return
+        action = self.actions.get(context)
+        if action is None:
+            return
+        if event == 'willDisappear':
+            if hasattr(action, 'on_will_disappear'):
+                action.on_will_disappear()
+            action.dispose()
+            del self.actions[context]
+        elif event == 'didReceiveGlobalSettings':
+            if hasattr(action, 'on_did_receive_global_settings'):
+                action.on_did_receive_global_settings(item.payload.get('settings'))
         elif event == 'didReceiveSettings':
-            context = data.get('context')
-            if context in self.actions:
-                action = self.actions[context]
-                settings = data.get('payload', {}).get('settings', {})
-                if hasattr(action, 'on_did_receive_settings'):
-                    action.on_did_receive_settings(settings)
-                else:
-                    action.settings = settings
+            settings = item.payload.get('settings', {})
+            if hasattr(action, 'on_did_receive_settings'):
+                action.on_did_receive_settings(settings)
+            else:
+                action.settings = settings
         elif event == 'titleParametersDidChange':
-            context = data.get('context')
-            if context in self.actions:
-                action = self.actions[context]
-                payload = data.get('payload', {})
-                if hasattr(action, 'on_title_parameters_did_change'):
-                    action.on_title_parameters_did_change(payload)
-                else:
-                    action.title = payload.get('title', '')
-                    action.title_parameters = payload.get('titleParameters', {})
-        # Handle context-specific events
-        context_events = {
-            'keyDown': 'on_key_down',
-            'keyUp': 'on_key_up',
-            'dialDown': 'on_dial_down',
-            'dialUp': 'on_dial_up',
-            'dialRotate': 'on_dial_rotate'
-        }
+            payload = item.payload
+            if hasattr(action, 'on_title_parameters_did_change'):
+                action.on_title_parameters_did_change(payload)
+            else:
+                action.title = payload.get('title', '')
+                action.title_parameters = payload.get('titleParameters', {})
+        elif event in _CONTEXT_EVENTS:
+            handler = _CONTEXT_EVENTS[event]
+            if hasattr(action, handler):
+                getattr(action, handler)(item.payload)
+        elif event in _GLOBAL_EVENTS:
+            handler = _GLOBAL_EVENTS[event]
+            if handler and hasattr(action, handler):
+                getattr(action, handler)(data)
+        elif event in _INSPECTOR_EVENTS:
+            handler = _INSPECTOR_EVENTS[event]
+            if hasattr(action, handler):
+                getattr(action, handler)(data)
+        elif event == 'sendToPlugin':
+            if hasattr(action, 'on_send_to_plugin'):
+                action.on_send_to_plugin(item.payload)
+    
+    def send(self, message: Dict[str, Any]) -> bool:
+        """把消息放入发送队列，由发送线程写入WebSocket（调用方不会阻塞在socket上）
         
-        if event in context_events:
-            context = data.get('context')
-            if context in self.actions:
-                action = self.actions[context]
-                handler = context_events[event]
-                if hasattr(action, handler):
-                    getattr(action, handler)(data.get('payload', {}))
-        # Handle global events
-        global_events = {
-            'deviceDidConnect': 'on_device_did_connect',
-            'deviceDidDisconnect': 'on_device_did_disconnect',
-            'applicationDidLaunch': 'on_application_did_launch',
-            'applicationDidTerminate': 'on_application_did_terminate',
-            'systemDidWakeUp': 'on_system_did_wake_up'
-        }
+        同一context尚未发出的setTitle/setImage会被新消息替换。
         
-        if event in global_events:
-            handler = global_events[event]
-            for action in self.actions.values():
-                if hasattr(action, handler):
-                    getattr(action, handler)(data)
-        elif event == 'propertyInspectorDidAppear':
-            context = data.get('context')
-            if context in self.actions:
-                action = self.actions[context]
-                if hasattr(action, 'on_property_inspector_did_appear'):
-                    action.on_property_inspector_did_appear(data)
-        elif event == 'propertyInspectorDidDisappear':
-            context = data.get('context')
-            if context in self.actions:
-                action = self.actions[context]
-                if hasattr(action, 'on_property_inspector_did_disappear'):
-                    action.on_property_inspector_did_disappear(data)
-        elif event == 'sendToPlugin':
-            context = data.get('context')
-            if context in self.actions:
-                action = self.actions[context]
-                if hasattr(action, 'on_send_to_plugin'):
-                    action.on_send_to_plugin(data.get('payload', {}))
+        Args:
+            message: 要发送的消息（dict，发送时序列化为JSON）
+            
+        Returns:
+            队列已满且等待超时被丢弃时返回False
+        """
+        return self.writer.send(message)
     
     def set_global_settings(self, payload: Any):
         """更新插件的全局设置
@@ -217,11 +246,11 @@ class Plugin:
         Args:
             payload: 新的全局设置值
         """        
-        self.ws.send(json.dumps({
+        self.send({
             'event': 'setGlobalSettings',
             'context': self.plugin_uuid,
             'payload': payload
-        }))
+        })
         self.global_settings = payload
     
     def get_global_settings(self):
@@ -229,10 +258,10 @@ class Plugin:
         
         发送请求后，设置值将通过WebSocket消息返回
         """        
-        self.ws.send(json.dumps({
+        self.send({
             'event': 'getGlobalSettings',
             'context': self.plugin_uuid
-        }))
+        })
     
     def get_action(self, context: str) -> Optional[Action]:
         """获取指定上下文的Action实例
@@ -254,9 +283,40 @@ class Plugin:
         Returns:
             符合指定类型的Action实例列表
         """        
-        return [a for a in self.actions.values() if a.action == action]
+        return [a for a in list(self.actions.values()) if a.action == action]
+    
+    def get_send_stats(self) -> Dict[str, Any]:
+        return self.writer.stats()
     
-    def stop(self):
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        return self.dispatcher.stats()
+    
+    def add_shutdown_hook(self, hook: Callable[[], Any]):
+        """注册插件停止时执行的回调（在发送队列关闭之前执行，回调里仍可发送消息）
+        
+        Args:
+            hook: 无参数的回调函数
+        """
+        self._shutdown_hooks.append(hook)
+    
+    def stop(self, connection_lost: bool = False):
+        """停止插件：等待事件处理完成，执行停止回调，发完发送队列后关闭连接
+        
+        Args:
+            connection_lost: WebSocket已被对方关闭（on_close）时为True；此时不再尝试发送，
+                停止回调里发出的消息会被丢弃（全局设置依靠本地镜像保存）
+        """
+        if connection_lost and hasattr(self, "writer"):
+            self.writer.set_connected(False)
+        if hasattr(self, "dispatcher"):
+            self.dispatcher.close()
+        for hook in list(getattr(self, "_shutdown_hooks", [])):
+            try:
+                hook()
+            except Exception as e:
+                Logger.error(f"Shutdown hook failed: {e}")
+        if hasattr(self, "writer"):
+            self.writer.close()
         if hasattr(self, "ws") and self.ws:
             try:
                 self.ws.close()
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import base64
+import json
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from .logger import Logger
+
+
+# Line-delimited protocol spoken over the worker's stdin/stdout:
+#   request:  {"id": 1, "script": "<PowerShell source>"}
+#   response: {"id": 1, "ok": true, "json": "<script output>"}
+#             {"id": 1, "ok": false, "error": "<message>"}
+# The script output is expected to be JSON text (scripts end with ConvertTo-Json),
+# so the caller decodes it exactly like the output of a one-shot powershell.exe.
+_WORKER_SCRIPT = r"""
+$ErrorActionPreference = 'Stop'
+[Console]::InputEncoding = [System.Text.Encoding]::UTF8
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($null -eq $line) { break }
+    if ($line.Trim().Length -eq 0) { continue }
+    $id = $null
+    try {
+        $req = $line | ConvertFrom-Json
+        $id = $req.id
+        $out = (Invoke-Expression $req.script | Out-String).Trim()
+        $resp = @{ id = $id; ok = $true; json = $out }
+    } catch {
+        $resp = @{ id = $id; ok = $false; error = "$_" }
+    }
+    [Console]::Out.WriteLine(($resp | ConvertTo-Json -Compress))
+    [Console]::Out.Flush()
+}
+"""
+
+
+def default_worker_argv() -> List[str]:
+    # -EncodedCommand (base64 of UTF-16LE) sidesteps Windows argv quoting of the
+    # script's quotes and newlines.
+    encoded = base64.b64encode(_WORKER_SCRIPT.encode("utf-16-le")).decode("ascii")
+    return [
+        "powershell",
+        "-NoProfile",
+        "-NoLogo",
+        "-ExecutionPolicy",
+        "Bypass",
+        "-EncodedCommand",
+        encoded,
+    ]
+
+
+class _PendingCall:
+    def __init__(self):
+        self.event = threading.Event()
+        self.text: Optional[str] = None
+        self.error: Optional[str] = None
+
+    def resolve(self, text: Optional[str], error: Optional[str]) -> None:
+        self.text = text
+        self.error = error
+        self.event.set()
+
+
+class _WorkerSession:
+    def __init__(self, proc: subprocess.Popen):
+        self.proc = proc
+        self.started_at = time.monotonic()
+        self.pending: Dict[int, _PendingCall] = {}
+        self.lock = threading.Lock()
+        self.closed = False
+
+    def is_alive(self) -> bool:
+        return not self.closed and self.proc.poll() is None
+
+    def fail_all(self, reason: str) -> None:
+        with self.lock:
+            self.closed = True
+            pending = list(self.pending.values())
+            self.pending.clear()
+        for call in pending:
+            call.resolve(None, reason)
+
+
+class PowerShellWorker:
+    """A long-lived PowerShell process that executes scripts sent line by line.
+
+    The process is started lazily on the first call and restarted automatically
+    when it exits or a call exceeds its timeout. The worker runs one script at
+    a time, so calls take turns and a call's timeout starts when its request is
+    written: time spent waiting for an earlier call is not charged to it, and
+    a timeout only fails the call that was running. Any executable speaking
+    the same line protocol can be used through ``argv``.
+    """
+
+    def __init__(self, argv: Optional[Sequence[str]] = None, startup_grace_s: float = 8.0):
+        self._argv = list(argv) if argv else default_worker_argv()
+        self._startup_grace_s = float(startup_grace_s)
+        self._lock = threading.Lock()
+        # Held from writing a request until its reply (or timeout): one call in flight at a time.
+        self._turn = threading.Lock()
+        self._session: Optional[_WorkerSession] = None
+        self._next_id = 1
+        self.starts = 0
+
+    def _start_session(self) -> _WorkerSession:
+        proc = subprocess.Popen(
+            self._argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        session = _WorkerSession(proc)
+        reader = threading.Thread(target=self._read_loop, args=(session,), daemon=True)
+        reader.start()
+        self.starts += 1
+        if self.starts > 1:
+            Logger.info(f"PowerShell worker restarted (starts={self.starts})")
+        return session
+
+    def _ensure_session(self) -> _WorkerSession:
+        session = self._session
+        if session is not None and session.is_alive():
+            return session
+        if session is not None:
+            self._kill_session(session, "PowerShell worker exited")
+        self._session = self._start_session()
+        return self._session
+
+    def _kill_session(self, session: _WorkerSession, reason: str) -> None:
+        if self._session is session:
+            self._session = None
+        try:
+            session.proc.kill()
+        except Exception:
+            pass
+        session.fail_all(reason)
+
+    @staticmethod
+    def _read_loop(session: _WorkerSession) -> None:
+        stdout = session.proc.stdout
+        try:
+            for line in stdout:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    resp = json.loads(line)
+                    call_id = int(resp.get("id"))
+                except Exception:
+                    continue
+                with session.lock:
+                    call = session.pending.pop(call_id, None)
+                if call is None:
+                    continue
+                if resp.get("ok"):
+                    call.resolve(str(resp.get("json") or ""), None)
+                else:
+                    call.resolve(None, str(resp.get("error") or "PowerShell execution failed"))
+        except Exception:
+            pass
+        session.fail_all("PowerShell worker exited")
+
+    def call_json(self, script: str, timeout_s: float = 2.5) -> Any:
+        call = _PendingCall()
+        with self._turn:
+            with self._lock:
+                session = self._ensure_session()
+                call_id = self._next_id
+                self._next_id += 1
+                with session.lock:
+                    session.pending[call_id] = call
+                try:
+                    session.proc.stdin.write(json.dumps({"id": call_id, "script": script}) + "\n")
+                    session.proc.stdin.flush()
+                except (OSError, ValueError) as e:
+                    self._kill_session(session, f"PowerShell worker write failed: {e}")
+                grace = max(0.0, session.started_at + self._startup_grace_s - time.monotonic())
+
+            if not call.event.wait(timeout_s + grace):
+                with self._lock:
+                    self._kill_session(session, "PowerShell worker timed out")
+                raise TimeoutError(f"PowerShell worker call timed out after {timeout_s}s")
+        if call.error is not None:
+            raise RuntimeError(call.error)
+        text = (call.text or "").strip()
+        if not text:
+            return None
+        return json.loads(text)
+
+    def close(self) -> None:
+        with self._lock:
+            session = self._session
+            self._session = None
+        if session is None:
+            return
+        try:
+            session.proc.stdin.close()
+            session.proc.wait(timeout=1.0)
+        except Exception:
+            pass
+        try:
+            session.proc.kill()
+        except Exception:
+            pass
+        session.fail_all("PowerShell worker closed")
+
+
+_worker: Optional[PowerShellWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_powershell_worker() -> PowerShellWorker:
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = PowerShellWorker()
+        return _worker
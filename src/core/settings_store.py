@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from .logger import Logger
+
+
+# Flush once no field has changed for this long...
+_DEFAULT_QUIET_MS = 500
+# ...but never hold a change back longer than this.
+_DEFAULT_MAX_DELAY_MS = 3000
+_FLUSH_TIMER_KEY = "settings_store.flush"
+MIRROR_PATH_ENV = "BRIGHTNESS_SETTINGS_MIRROR"
+
+
+def default_mirror_path() -> str:
+    """``global_settings.json`` next to the executable (or the repo root in development)."""
+    override = os.environ.get(MIRROR_PATH_ENV)
+    if override:
+        return override
+    if getattr(sys, 'frozen', False):
+        base = os.path.dirname(sys.executable)
+    else:
+        base = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    return os.path.join(base, 'global_settings.json')
+
+
+class GlobalSettingsStore:
+    """Write-behind copy of the plugin's global settings.
+
+    ``update`` only records the fields that differ from what was last
+    flushed. A flush sends the whole settings dict (StreamDock replaces it
+    wholesale) once no field has changed for ``quiet_ms``, or ``max_delay_ms``
+    after the first unflushed change, and writes the same dict to a local
+    mirror file. Nothing is sent when no field is dirty.
+    """
+
+    def __init__(
+        self,
+        timer,
+        send_fn: Callable[[Dict[str, Any]], Any],
+        mirror_path: Optional[str] = None,
+        quiet_ms: int = _DEFAULT_QUIET_MS,
+        max_delay_ms: int = _DEFAULT_MAX_DELAY_MS,
+    ):
+        self._timer = timer
+        self._send_fn = send_fn
+        self._mirror_path = mirror_path
+        self._quiet_ms = max(0, int(quiet_ms))
+        self._max_delay_ms = max(self._quiet_ms, int(max_delay_ms))
+        self._lock = threading.Lock()
+        # Serialises flushes so an older dict never overwrites a newer one.
+        self._flush_lock = threading.Lock()
+        self._flushed: Dict[str, Any] = {}
+        self._current: Dict[str, Any] = {}
+        self._dirty: set = set()
+        self._dirty_since: Optional[float] = None
+        self._updates = 0
+        self._flushes = 0
+        self._skipped = 0
+        self._mirror_errors = 0
+
+    def load_mirror(self) -> Optional[Dict[str, Any]]:
+        """Settings from the mirror file, or ``None`` if there is none (or it is unreadable)."""
+        if not self._mirror_path:
+            return None
+        try:
+            with open(self._mirror_path, 'r', encoding='utf-8') as f:
+                settings = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            Logger.error(f"Failed to read settings mirror {self._mirror_path}: {e}")
+            return None
+        return settings if isinstance(settings, dict) else None
+
+    def note_persisted(self, settings: Dict[str, Any]) -> None:
+        """Record ``settings`` as already stored by the host (e.g. ``didReceiveGlobalSettings``)."""
+        with self._lock:
+            self._flushed = dict(settings)
+            for k, v in settings.items():
+                self._current.setdefault(k, v)
+            self._dirty = {k for k in self._current if self._current.get(k) != self._flushed.get(k)}
+            clean = not self._dirty
+            if clean:
+                self._dirty_since = None
+        if clean:
+            self._timer.clear_interval(_FLUSH_TIMER_KEY)
+
+    def update(self, fields: Dict[str, Any]) -> None:
+        """Merge ``fields`` into the settings and schedule a flush if anything is now unflushed."""
+        with self._lock:
+            self._updates += 1
+            for k, v in fields.items():
+                self._current[k] = v
+                if k not in self._flushed or self._flushed[k] != v:
+                    self._dirty.add(k)
+                else:
+                    self._dirty.discard(k)
+            if not self._dirty:
+                # Changed back to what is stored; the pending flush has nothing to do.
+                self._dirty_since = None
+                delay_ms = None
+            else:
+                now = time.monotonic()
+                if self._dirty_since is None:
+                    self._dirty_since = now
+                waited_ms = (now - self._dirty_since) * 1000.0
+                delay_ms = max(0.0, min(float(self._quiet_ms), self._max_delay_ms - waited_ms))
+        if delay_ms is None:
+            self._timer.clear_interval(_FLUSH_TIMER_KEY)
+        else:
+            self._timer.call_later(delay_ms, self.flush, key=_FLUSH_TIMER_KEY)
+
+    def flush(self) -> bool:
+        """Send and mirror the settings now if any field is dirty; ``True`` if it did."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._dirty:
+                    self._skipped += 1
+                    return False
+                payload = dict(self._current)
+                self._dirty.clear()
+                self._dirty_since = None
+                self._flushes += 1
+            try:
+                self._send_fn(payload)
+            except Exception as e:
+                Logger.error(f"Failed to send global settings: {e}")
+            with self._lock:
+                self._flushed = payload
+            self._write_mirror(payload)
+            return True
+
+    def _write_mirror(self, payload: Dict[str, Any]) -> None:
+        if not self._mirror_path:
+            return
+        tmp = f"{self._mirror_path}.tmp"
+        try:
+            directory = os.path.dirname(self._mirror_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp, self._mirror_path)
+        except Exception as e:
+            with self._lock:
+                self._mirror_errors += 1
+            Logger.error(f"Failed to write settings mirror {self._mirror_path}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "updates": self._updates,
+                "flushes": self._flushes,
+                "skipped": self._skipped,
+                "dirty": sorted(self._dirty),
+                "mirror_errors": self._mirror_errors,
+            }
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from .monitor_control import MonitorBackend, MonitorInfo, MonitorManager
+from .monitor_registry import MonitorBackendRegistry
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class SimulatedMonitorConfig:
+    monitors: int = 2
+    read_latency_ms: float = 30.0
+    write_latency_ms: float = 60.0
+    # Each call's latency varies uniformly by +/- this much.
+    jitter_ms: float = 10.0
+    # Probability in [0, 1] that a read or write fails.
+    failure_rate: float = 0.0
+    brightness: int = 50
+
+    @classmethod
+    def from_env(cls) -> 'SimulatedMonitorConfig':
+        """Read ``BRIGHTNESS_SIM_*`` overrides (MONITORS, READ_MS, WRITE_MS, JITTER_MS, FAILURE_RATE, BRIGHTNESS)."""
+        d = cls()
+        return cls(
+            monitors=max(0, int(_env_float("BRIGHTNESS_SIM_MONITORS", d.monitors))),
+            read_latency_ms=max(0.0, _env_float("BRIGHTNESS_SIM_READ_MS", d.read_latency_ms)),
+            write_latency_ms=max(0.0, _env_float("BRIGHTNESS_SIM_WRITE_MS", d.write_latency_ms)),
+            jitter_ms=max(0.0, _env_float("BRIGHTNESS_SIM_JITTER_MS", d.jitter_ms)),
+            failure_rate=min(1.0, max(0.0, _env_float("BRIGHTNESS_SIM_FAILURE_RATE", d.failure_rate))),
+            brightness=min(100, max(0, int(_env_float("BRIGHTNESS_SIM_BRIGHTNESS", d.brightness)))),
+        )
+
+
+class SimulatedMonitor(MonitorBackend):
+    """In-memory monitor with configurable latency, jitter and failure rate.
+
+    Lets the plugin run, be profiled and benchmarked without any real display.
+    Calls sleep like a slow DDC/CI bus does and are serialised per monitor.
+    """
+
+    def __init__(self, index: int, config: SimulatedMonitorConfig, seed: Optional[int] = None):
+        self._index = int(index)
+        self._config = config
+        self._lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._value = int(config.brightness)
+        self._reads = 0
+        self._writes = 0
+        self._failures = 0
+
+    @property
+    def monitor_id(self) -> str:
+        return f"sim:{self._index}"
+
+    @property
+    def value(self) -> int:
+        """Brightness the simulated panel is at, without the simulated latency."""
+        return self._value
+
+    def get_info(self) -> MonitorInfo:
+        return MonitorInfo(name=f"Simulated {self._index + 1}", backend="sim")
+
+    def _io(self, latency_ms: float) -> bool:
+        """Sleep for one call's latency; ``False`` if the call should fail."""
+        jitter = self._config.jitter_ms
+        delay_ms = max(0.0, latency_ms + (self._rng.uniform(-jitter, jitter) if jitter else 0.0))
+        time.sleep(delay_ms / 1000.0)
+        if self._rng.random() < self._config.failure_rate:
+            self._failures += 1
+            return False
+        return True
+
+    def get_brightness_percent(self) -> Optional[int]:
+        with self._lock:
+            self._reads += 1
+            if not self._io(self._config.read_latency_ms):
+                return None
+            return self._value
+
+    def set_brightness_percent(self, percent: int) -> bool:
+        with self._lock:
+            self._writes += 1
+            if not self._io(self._config.write_latency_ms):
+                return False
+            self._value = min(100, max(0, int(percent)))
+            return True
+
+    def reopen(self) -> bool:
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"value": self._value, "reads": self._reads, "writes": self._writes, "failures": self._failures}
+
+
+def _scan_simulated(manager: MonitorManager, current: Dict[str, MonitorBackend]) -> List[MonitorBackend]:
+    config = SimulatedMonitorConfig.from_env()
+    monitors: List[MonitorBackend] = []
+    for index in range(config.monitors):
+        existing = current.get(f"sim:{index}")
+        monitors.append(existing if existing is not None else SimulatedMonitor(index, config))
+    return monitors
+
+
+MonitorBackendRegistry.register("sim", _scan_simulated)
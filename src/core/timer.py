@@ -1,29 +1,141 @@
+import heapq
+import itertools
 import threading
 import time
-from typing import Dict, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .logger import Logger
+
+
+class TimerHandle:
+    def __init__(self, timer: 'Timer', key: Optional[str], callback: Callable, interval: Optional[float]):
+        self._timer = timer
+        self.key = key
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+        self.running = False
+        self.runs = 0
+        self.overruns = 0
+
+    def cancel(self):
+        self._timer._cancel(self)
+
 
 class Timer:
-    def __init__(self):
-        self._intervals: Dict[str, Dict] = {}
-        self._thread = threading.Thread(target=self._run, daemon=True)
+    """Heap-based scheduler for one-shot and repeating callbacks.
+
+    The scheduler thread sleeps until the next deadline and hands due callbacks
+    to a small executor, so a slow callback only delays itself. A repeating
+    task that is still running when it comes due again is skipped and counted
+    as an overrun.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[float, int, TimerHandle]] = []
+        self._seq = itertools.count()
+        self._keyed: Dict[str, TimerHandle] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="timer")
+        self._overruns = 0
+        self._late = 0
+        self._thread = threading.Thread(target=self._run, name="timer", daemon=True)
         self._thread.start()
-    
+
+    def _push(self, due: float, handle: TimerHandle):
+        heapq.heappush(self._heap, (due, next(self._seq), handle))
+        self._cond.notify()
+
     def _run(self):
         while True:
-            current_time = time.time()
-            for uuid, data in list(self._intervals.items()):
-                if current_time - data['last_run'] >= data['delay']:
-                    data['callback']()
-                    data['last_run'] = current_time
-            time.sleep(0.1)
-    
-    def set_interval(self, uuid: str, delay: float, callback: Callable):
-        self._intervals[uuid] = {
-            'delay': delay / 1000,  # Convert ms to seconds
-            'callback': callback,
-            'last_run': time.time()
-        }
-    
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    due, _, handle = self._heap[0]
+                    if handle.cancelled:
+                        heapq.heappop(self._heap)
+                        continue
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        self._cond.wait(delay)
+                        continue
+                    heapq.heappop(self._heap)
+                    break
+
+                now = time.monotonic()
+                if handle.interval is None:
+                    if handle.key is not None and self._keyed.get(handle.key) is handle:
+                        del self._keyed[handle.key]
+                else:
+                    next_due = due + handle.interval
+                    if next_due <= now:
+                        # Fell behind by a whole period: skip the missed runs instead of bursting.
+                        self._late += 1
+                        next_due = now + handle.interval
+                    self._push(next_due, handle)
+
+                if handle.running:
+                    handle.overruns += 1
+                    self._overruns += 1
+                    continue
+                handle.running = True
+
+            self._executor.submit(self._invoke, handle)
+
+    def _invoke(self, handle: TimerHandle):
+        try:
+            if not handle.cancelled:
+                handle.callback()
+        except Exception as e:
+            Logger.error(f"Timer callback failed ({handle.key}): {e}")
+        finally:
+            with self._cond:
+                handle.running = False
+                handle.runs += 1
+
+    def _schedule(self, key: Optional[str], delay: float, callback: Callable, interval: Optional[float]) -> TimerHandle:
+        handle = TimerHandle(self, key, callback, interval)
+        with self._cond:
+            if key is not None:
+                previous = self._keyed.get(key)
+                if previous is not None:
+                    previous.cancelled = True
+                self._keyed[key] = handle
+            self._push(time.monotonic() + max(0.0, delay), handle)
+        return handle
+
+    def _cancel(self, handle: TimerHandle):
+        with self._cond:
+            handle.cancelled = True
+            if handle.key is not None and self._keyed.get(handle.key) is handle:
+                del self._keyed[handle.key]
+            self._cond.notify()
+
+    def call_later(self, delay: float, callback: Callable, key: Optional[str] = None) -> TimerHandle:
+        """Run ``callback`` once after ``delay`` milliseconds.
+
+        Scheduling with a ``key`` that is already pending replaces that task.
+        """
+        return self._schedule(key, delay / 1000, callback, None)
+
+    def set_interval(self, uuid: str, delay: float, callback: Callable) -> TimerHandle:
+        interval = max(0.001, delay / 1000)  # Convert ms to seconds
+        return self._schedule(uuid, interval, callback, interval)
+
     def clear_interval(self, uuid: str):
-        if uuid in self._intervals:
-            del self._intervals[uuid]
\ No newline at end of file
+        with self._cond:
+            handle = self._keyed.get(uuid)
+        if handle is not None:
+            handle.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                'scheduled': len(self._keyed),
+                'queued': len(self._heap),
+                'overruns': self._overruns,
+                'late': self._late,
+            }
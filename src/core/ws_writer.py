@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from .logger import Logger
+
+
+# Events where only the newest message per context matters; an older one still
+# waiting in the queue is replaced in place by the newer one, unless another
+# message for that context has been queued behind it since.
+COALESCED_EVENTS = frozenset({"setTitle", "setImage"})
+
+_DEFAULT_MAX_PENDING = 256
+_DEFAULT_PUT_TIMEOUT_S = 1.0
+
+
+class _Outgoing:
+    __slots__ = ("key", "text", "enqueued_at")
+
+    def __init__(self, key: Optional[Tuple[str, str]], text: str):
+        self.key = key
+        self.text = text
+        self.enqueued_at = time.monotonic()
+
+
+class WebSocketWriter:
+    """The only thread that writes to the plugin's WebSocket.
+
+    Callers enqueue messages and return; one writer thread drains the queue in
+    order. A ``setTitle``/``setImage`` message for a context that is still
+    queued is replaced by the newer one (latest wins), so the newer one takes
+    the older one's place in the queue. Once any other message for that
+    context is queued, the older frame is no longer replaced and the next one
+    queues behind that message, so a context's messages never overtake each
+    other. Everything else is sent exactly in submission order. The queue is
+    bounded: when it is full a caller waits up to ``put_timeout_s`` for room
+    and the message is dropped after that. Nothing is sent until
+    ``set_connected(True)``.
+    """
+
+    def __init__(
+        self,
+        send_fn: Callable[[str], Any],
+        max_pending: int = _DEFAULT_MAX_PENDING,
+        put_timeout_s: float = _DEFAULT_PUT_TIMEOUT_S,
+    ):
+        self._send_fn = send_fn
+        self._max_pending = max(1, int(max_pending))
+        self._put_timeout_s = max(0.0, float(put_timeout_s))
+        self._cond = threading.Condition()
+        self._queue: Deque[_Outgoing] = deque()
+        self._coalescable: Dict[Tuple[str, str], _Outgoing] = {}
+        self._connected = False
+        self._closed = False
+        self._in_flight = False
+        self._enqueued = 0
+        self._sent = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._errors = 0
+        self._waits = 0
+        self._max_depth = 0
+        self._queue_wait_s = 0.0
+        self._thread = threading.Thread(target=self._run, name="ws-writer", daemon=True)
+        self._thread.start()
+
+    def send(self, message: Dict[str, Any]) -> bool:
+        """Queue ``message`` for sending; ``False`` if it was dropped."""
+        return self._put(message, front=False)
+
+    def send_first(self, message: Dict[str, Any]) -> bool:
+        """Queue ``message`` ahead of everything else (e.g. the registration event)."""
+        return self._put(message, front=True)
+
+    def _put(self, message: Dict[str, Any], front: bool) -> bool:
+        event = message.get("event")
+        context = message.get("context")
+        key = (event, context) if event in COALESCED_EVENTS and isinstance(context, str) else None
+        text = json.dumps(message)
+        with self._cond:
+            if self._closed:
+                self._dropped += 1
+                return False
+            self._enqueued += 1
+            queued = self._coalescable.get(key) if key is not None else None
+            if queued is not None:
+                queued.text = text
+                self._coalesced += 1
+                return True
+            if len(self._queue) >= self._max_pending and not front:
+                self._waits += 1
+                deadline = time.monotonic() + self._put_timeout_s
+                while len(self._queue) >= self._max_pending and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._dropped += 1
+                        Logger.error(f"Outbound queue full; dropped {event}")
+                        return False
+                    self._cond.wait(remaining)
+                if self._closed:
+                    self._dropped += 1
+                    return False
+                queued = self._coalescable.get(key) if key is not None else None
+                if queued is not None:
+                    queued.text = text
+                    self._coalesced += 1
+                    return True
+            if key is None and isinstance(context, str):
+                self._seal_context(context)
+            item = _Outgoing(key, text)
+            if front:
+                self._queue.appendleft(item)
+            else:
+                self._queue.append(item)
+            if key is not None:
+                self._coalescable[key] = item
+            self._max_depth = max(self._max_depth, len(self._queue))
+            self._cond.notify_all()
+            return True
+
+    def _seal_context(self, context: str) -> None:
+        """Stop replacing ``context``'s queued frames; later ones go to the back of the queue."""
+        for event in COALESCED_EVENTS:
+            self._coalescable.pop((event, context), None)
+
+    def set_connected(self, connected: bool) -> None:
+        with self._cond:
+            self._connected = bool(connected)
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and not (self._connected and self._queue):
+                    self._cond.wait()
+                if not self._queue or not self._connected:
+                    return
+                item = self._queue.popleft()
+                if item.key is not None and self._coalescable.get(item.key) is item:
+                    del self._coalescable[item.key]
+                self._queue_wait_s += time.monotonic() - item.enqueued_at
+                self._in_flight = True
+                # Room freed up for callers waiting on a full queue.
+                self._cond.notify_all()
+            try:
+                self._send_fn(item.text)
+                ok = True
+            except Exception as e:
+                Logger.error(f"WebSocket send failed: {e}")
+                ok = False
+            with self._cond:
+                self._in_flight = False
+                if ok:
+                    self._sent += 1
+                else:
+                    self._errors += 1
+                self._cond.notify_all()
+
+    def flush(self, timeout_s: Optional[float] = None) -> bool:
+        """Wait until everything queued so far has been handed to the socket."""
+        deadline = None if timeout_s is None else time.monotonic() + max(0.0, timeout_s)
+        with self._cond:
+            while (self._queue and self._connected) or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return not self._queue
+
+    def close(self, timeout_s: float = 1.0) -> None:
+        """Send what is queued (up to ``timeout_s``), then stop the writer thread."""
+        self.flush(timeout_s)
+        with self._cond:
+            self._closed = True
+            self._dropped += len(self._queue)
+            self._queue.clear()
+            self._coalescable.clear()
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            handled = self._sent + self._errors
+            return {
+                "depth": len(self._queue),
+                "max_depth": self._max_depth,
+                "enqueued": self._enqueued,
+                "sent": self._sent,
+                "coalesced": self._coalesced,
+                "dropped": self._dropped,
+                "errors": self._errors,
+                "full_waits": self._waits,
+                "mean_queue_ms": (self._queue_wait_s / handled * 1000.0) if handled else 0.0,
+            }
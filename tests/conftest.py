@@ -0,0 +1,118 @@
+import os
+import sys
+import threading
+import time
+from typing import List, Optional
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.bus_limiter import BusBusyError  # noqa: E402
+from src.core.monitor_control import MonitorBackend, MonitorInfo, MonitorManager  # noqa: E402
+from src.core.monitor_registry import MonitorBackendRegistry  # noqa: E402
+from src.core.settings_store import GlobalSettingsStore  # noqa: E402
+from src.core.timer import Timer  # noqa: E402
+
+
+class FakeMonitor(MonitorBackend):
+    """Scriptable monitor: per-call latency and queued write/read outcomes (failed or bus-busy)."""
+
+    def __init__(self, index: int, value: int = 50, write_s: float = 0.0, read_s: float = 0.0):
+        self.index = index
+        self.value = value
+        self.write_s = write_s
+        self.read_s = read_s
+        self.fail_writes = 0
+        self.fail_reads = 0
+        self.busy_reads = 0
+        # When set, writes block until the event is set (a monitor stuck mid-write).
+        self.write_gate: Optional[threading.Event] = None
+        self.writes: List[int] = []
+        self.write_threads: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def monitor_id(self) -> str:
+        return f"fake:{self.index}"
+
+    def get_info(self) -> MonitorInfo:
+        return MonitorInfo(name=f"Fake {self.index}", backend="fake")
+
+    def get_brightness_percent(self) -> Optional[int]:
+        time.sleep(self.read_s)
+        with self._lock:
+            if self.busy_reads:
+                self.busy_reads -= 1
+                raise BusBusyError(f"{self.monitor_id}: bus busy")
+            if self.fail_reads:
+                self.fail_reads -= 1
+                return None
+            return self.value
+
+    def set_brightness_percent(self, percent: int) -> bool:
+        if self.write_gate is not None:
+            self.write_gate.wait(5)
+        time.sleep(self.write_s)
+        with self._lock:
+            self.write_threads.append(threading.current_thread().name)
+            if self.fail_writes:
+                self.fail_writes -= 1
+                return False
+            self.value = int(percent)
+            self.writes.append(int(percent))
+            return True
+
+    def reopen(self) -> bool:
+        return True
+
+
+class StubPlugin:
+    def __init__(self):
+        self.actions: dict = {}
+        self.timer = Timer()
+        self.sent_settings: List[dict] = []
+        self.sent: List[dict] = []
+
+    def send(self, message: dict) -> None:
+        self.sent.append(message)
+
+    def get_global_settings(self) -> None:
+        return None
+
+    def set_global_settings(self, payload) -> None:
+        self.sent_settings.append(payload)
+
+    def add_shutdown_hook(self, hook) -> None:
+        return None
+
+
+@pytest.fixture
+def fake_monitors():
+    """Monitors served by the ``fake`` backend; append/remove to change what a scan finds."""
+    monitors: List[FakeMonitor] = []
+    MonitorBackendRegistry.register("fake", lambda manager, current: list(monitors))
+    yield monitors
+
+
+@pytest.fixture
+def fake_manager(fake_monitors):
+    manager = MonitorManager(read_cache_ttl_s=0.0, backends=("fake",))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def stub_plugin():
+    return StubPlugin()
+
+
+@pytest.fixture
+def make_hub(stub_plugin, fake_manager):
+    from src.core.brightness_hub import BrightnessHub
+
+    def _make():
+        store = GlobalSettingsStore(stub_plugin.timer, stub_plugin.set_global_settings)
+        return BrightnessHub(stub_plugin, manager=fake_manager, settings_store=store)
+
+    return _make
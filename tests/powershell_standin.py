@@ -0,0 +1,46 @@
+"""Stand-in for the PowerShell worker: speaks the same line-JSON protocol.
+
+The request's ``script`` is a tiny command language instead of PowerShell:
+
+    echo <json>        reply ok with <json> as the script output
+    sleep <s> <json>   wait <s> seconds, then reply like echo
+    fail <message>     reply ok=false with <message>
+    garbage <json>     write a non-JSON line first, then reply like echo
+    badjson            reply ok with output that is not valid JSON
+    pid                reply with this process's PID
+    exit               exit without replying
+"""
+import json
+import os
+import sys
+import time
+
+
+def main() -> None:
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        req = json.loads(line)
+        cmd, _, arg = str(req.get("script", "")).partition(" ")
+        resp = {"id": req.get("id"), "ok": True, "json": arg}
+        if cmd == "sleep":
+            seconds, _, arg = arg.partition(" ")
+            time.sleep(float(seconds))
+            resp["json"] = arg
+        elif cmd == "fail":
+            resp = {"id": req.get("id"), "ok": False, "error": arg}
+        elif cmd == "garbage":
+            sys.stdout.write("this is not json\n")
+        elif cmd == "badjson":
+            resp["json"] = "{not json"
+        elif cmd == "pid":
+            resp["json"] = str(os.getpid())
+        elif cmd == "exit":
+            return
+        sys.stdout.write(json.dumps(resp) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import time
+
+from src.core.action import _DEFAULT_MAX_FPS, Action
+
+
+def _titles(plugin):
+    return [m["payload"]["title"] for m in plugin.sent if m["event"] == "setTitle"]
+
+
+def _wait_for(predicate, timeout_s=1.0):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_max_fps_comes_from_settings_then_constructor(stub_plugin):
+    assert Action("a", "ctx", {}, stub_plugin).max_fps == _DEFAULT_MAX_FPS
+    assert Action("a", "ctx", {}, stub_plugin, max_fps=5).max_fps == 5
+    action = Action("a", "ctx", {"maxFps": 2}, stub_plugin, max_fps=5)
+    assert action.max_fps == 2
+    action.settings = {"maxFps": "bogus"}
+    assert action.max_fps == 5
+
+
+def test_burst_collapses_to_the_last_frame_within_the_interval(stub_plugin):
+    action = Action("a", "ctx", {"maxFps": 10}, stub_plugin)
+    for i in range(10):
+        action.set_title(str(i))
+    # The first frame goes out at once; the rest wait for the 100ms interval.
+    assert _titles(stub_plugin) == ["0"]
+    time.sleep(0.05)
+    assert _titles(stub_plugin) == ["0"]
+    assert _wait_for(lambda: len(_titles(stub_plugin)) == 2)
+    time.sleep(0.15)
+    assert _titles(stub_plugin) == ["0", "9"]
+    stats = action.get_render_stats()
+    assert stats["deferred"] == 9
+    assert stats["suppressed"] == 8
+
+
+def test_identical_frames_are_not_resent(stub_plugin):
+    action = Action("a", "ctx", {"maxFps": 0}, stub_plugin)
+    action.set_title("50%")
+    action.set_title("50%")
+    action.set_title("60%")
+    action.set_title("60%")
+    assert _titles(stub_plugin) == ["50%", "60%"]
+    assert action.get_render_stats()["suppressed"] == 2
+    action.invalidate_render()
+    action.set_title("60%")
+    assert _titles(stub_plugin) == ["50%", "60%", "60%"]
+
+
+def test_frame_returning_to_the_sent_value_cancels_the_pending_one(stub_plugin):
+    action = Action("a", "ctx", {"maxFps": 10}, stub_plugin)
+    action.set_title("1")
+    action.set_title("2")
+    action.set_title("1")
+    time.sleep(0.2)
+    assert _titles(stub_plugin) == ["1"]
@@ -0,0 +1,82 @@
+import threading
+import time
+
+from conftest import FakeMonitor
+from src.core.monitor_control import _APPLY_MAX_WORKERS
+
+
+def _scan(manager, monitors, fake_monitors):
+    fake_monitors.extend(monitors)
+    manager.scan()
+
+
+def test_apply_all_writes_every_monitor(fake_manager, fake_monitors):
+    monitors = [FakeMonitor(i, value=10) for i in range(3)]
+    _scan(fake_manager, monitors, fake_monitors)
+    result = fake_manager.apply_all_brightness_percent(70, deadline_s=2.0)
+    assert result.ok_count == 3
+    assert [m.value for m in monitors] == [70, 70, 70]
+
+
+def test_busy_monitor_does_not_stall_the_others(fake_manager, fake_monitors):
+    slow = FakeMonitor(0, write_s=0.6)
+    fast = [FakeMonitor(i) for i in (1, 2)]
+    _scan(fake_manager, [slow, *fast], fake_monitors)
+    # Keep monitor 0's writer busy with an earlier write.
+    busy = fake_manager.submit_brightness_percent(0, 20)
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    done = threading.Event()
+    threading.Thread(target=lambda: (fake_manager.apply_all_brightness_percent(80, deadline_s=3.0), done.set())).start()
+    deadline = time.monotonic() + 1.0
+    while time.monotonic() < deadline and not all(m.value == 80 for m in fast):
+        time.sleep(0.005)
+    # The idle monitors start right away instead of waiting out the barrier timeout.
+    assert all(m.value == 80 for m in fast)
+    assert time.monotonic() - started < 0.2
+    assert busy.wait(2)
+    assert done.wait(3)
+    assert slow.value == 80
+
+
+def test_superseded_gated_ticket_releases_the_barrier(fake_manager, fake_monitors):
+    # Monitors 1..N hold every apply-pool thread in a blocked write, so the
+    # apply-all tickets of the idle monitors 0 and N+1 stay queued in their mailboxes.
+    blocked = threading.Event()
+    occupiers = [FakeMonitor(i) for i in range(1, _APPLY_MAX_WORKERS + 1)]
+    for m in occupiers:
+        m.write_gate = blocked
+    first, last = FakeMonitor(0), FakeMonitor(_APPLY_MAX_WORKERS + 1)
+    _scan(fake_manager, [first, *occupiers, last], fake_monitors)
+    try:
+        for i in range(1, _APPLY_MAX_WORKERS + 1):
+            fake_manager.submit_brightness_percent(i, 5)
+        deadline = time.monotonic() + 1.0
+        while not all(fake_manager.is_writing(m.monitor_id) for m in occupiers) and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+        result = {}
+        t = threading.Thread(
+            target=lambda: result.update(r=fake_manager.apply_all_brightness_percent(60, deadline_s=3.0))
+        )
+        t.start()
+        deadline = time.monotonic() + 1.0
+        while not fake_manager.is_writing(last.monitor_id) and time.monotonic() < deadline:
+            time.sleep(0.002)
+        time.sleep(0.05)
+        # A newer target replaces monitor 0's gated apply-all ticket before it ever runs.
+        superseding = fake_manager.submit_brightness_percent(0, 61)
+    finally:
+        blocked.set()
+    started = time.monotonic()
+    deadline = started + 1.0
+    while last.value != 60 and time.monotonic() < deadline:
+        time.sleep(0.002)
+    # Monitor N+1 goes as soon as a pool thread frees up instead of waiting out the barrier.
+    assert last.value == 60
+    assert time.monotonic() - started < 0.2
+    assert superseding.wait(1)
+    assert first.value == 61
+    t.join(3)
+    assert result["r"].ok_count >= _APPLY_MAX_WORKERS
@@ -0,0 +1,19 @@
+from types import SimpleNamespace
+
+from src.core.brightness_action_base import BrightnessAction
+from src.core.brightness_poller import REFRESH_MODE_ADAPTIVE, REFRESH_MODE_FIXED
+
+
+def _refresh_mode(settings):
+    return BrightnessAction._get_refresh_mode(SimpleNamespace(settings=settings))
+
+
+def test_saved_refresh_mode_is_used():
+    assert _refresh_mode({"refreshMode": "adaptive"}) == REFRESH_MODE_ADAPTIVE
+    assert _refresh_mode({"refreshMode": "fixed"}) == REFRESH_MODE_FIXED
+
+
+def test_settings_without_refresh_mode_keep_fixed_polling():
+    assert _refresh_mode({"refreshMs": 3000}) == REFRESH_MODE_FIXED
+    assert _refresh_mode(None) == REFRESH_MODE_FIXED
+    assert _refresh_mode({"refreshMode": "bogus"}) == REFRESH_MODE_FIXED
@@ -0,0 +1,92 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.brightness_cache import BrightnessReadCache
+
+
+def test_hit_within_ttl_skips_loader():
+    cache = BrightnessReadCache(ttl_s=10.0)
+    calls = []
+    loader = lambda: calls.append(1) or 40
+    assert cache.get("m", loader) == 40
+    assert cache.get("m", loader) == 40
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_failed_read_is_not_cached():
+    cache = BrightnessReadCache(ttl_s=10.0)
+    assert cache.get("m", lambda: None) is None
+    assert cache.peek("m") is None
+    assert cache.get("m", lambda: 55) == 55
+
+
+def test_concurrent_gets_share_one_load():
+    cache = BrightnessReadCache(ttl_s=10.0)
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        release.wait(2)
+        return 70
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get("m", loader))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(2)
+    assert results == [70] * 5
+    assert len(calls) == 1
+    assert cache.stats()["shared"] == 4
+
+
+def test_invalidate_drops_value_but_keeps_last_known():
+    cache = BrightnessReadCache(ttl_s=10.0)
+    cache.get("m", lambda: 20)
+    cache.invalidate("m")
+    assert cache.peek("m") is None
+    assert cache.last_known("m")[0] == 20
+
+
+def test_read_started_before_put_does_not_overwrite_it():
+    cache = BrightnessReadCache(ttl_s=10.0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_read():
+        started.set()
+        release.wait(2)
+        return 30
+
+    result = []
+    reader = threading.Thread(target=lambda: result.append(cache.get("m", slow_read)))
+    reader.start()
+    assert started.wait(2)
+    cache.put("m", 80)
+    release.set()
+    reader.join(2)
+
+    assert result == [80]
+    assert cache.peek("m")[0] == 80
+    assert cache.last_known("m")[0] == 80
+    assert cache.stats()["stale_loads"] == 1
+
+
+def test_get_within_times_out_and_result_still_lands():
+    cache = BrightnessReadCache(ttl_s=10.0)
+    release = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        value, completed = cache.get_within("m", lambda: release.wait(2) and 65, pool.submit, 0.05)
+        assert (value, completed) == (None, False)
+        release.set()
+        pool.shutdown(wait=True)
+        assert cache.peek("m")[0] == 65
+        assert cache.stats()["timeouts"] == 1
+    finally:
+        pool.shutdown(wait=False)
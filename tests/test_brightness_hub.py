@@ -0,0 +1,52 @@
+import threading
+import time
+
+from conftest import FakeMonitor
+from src.core.monitor_writer import WRITE_FAILED
+
+
+def test_write_callbacks_do_not_block_the_writer(fake_monitors, make_hub):
+    monitor = FakeMonitor(0)
+    monitor.fail_writes = 1
+    fake_monitors.append(monitor)
+    hub = make_hub()
+
+    recovering = threading.Event()
+
+    def slow_recover(monitor_id):
+        recovering.set()
+        time.sleep(1.0)
+        return False
+
+    hub._recover_monitor = slow_recover
+    settled = []
+    first = hub.submit_monitor_brightness(
+        0, 40, on_complete=lambda t: settled.append((t.status, threading.current_thread().name))
+    )
+    assert first.wait(2)
+    assert recovering.wait(2)
+
+    # The failed write's recovery is still running; the next write must not wait for it.
+    started = time.monotonic()
+    second = hub.submit_monitor_brightness(0, 60)
+    assert second.wait(0.5)
+    assert time.monotonic() - started < 0.5
+    assert monitor.value == 60
+
+    deadline = time.monotonic() + 3
+    while not settled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert settled[0][0] == WRITE_FAILED
+    assert settled[0][1].startswith("timer")
+
+
+def test_save_global_settings_is_write_behind(stub_plugin, fake_monitors, make_hub):
+    fake_monitors.append(FakeMonitor(0))
+    hub = make_hub()
+    for value in (10, 20, 30):
+        hub.set_all_brightness_preview(value)
+        hub.save_global_settings()
+    assert stub_plugin.sent_settings == []
+    assert hub.flush_global_settings() is True
+    assert stub_plugin.sent_settings[-1]["allBrightness"] == 30
+    assert hub.flush_global_settings() is False
@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import Counter
+
+from src.core.brightness_poller import BrightnessPoller
+from src.core.timer import Timer
+
+
+class _Reader:
+    def __init__(self, value=50):
+        self.value = value
+        self.reads = Counter()
+        self._lock = threading.Lock()
+
+    def __call__(self, monitor_id):
+        with self._lock:
+            self.reads[monitor_id] += 1
+        return self.value
+
+
+def _wait_for(predicate, timeout_s=1.0):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_subscribers_of_one_monitor_share_a_loop():
+    reader = _Reader()
+    poller = BrightnessPoller(Timer(), reader)
+    seen = [[] for _ in range(3)]
+    tokens = [poller.subscribe("m", 100, lambda mid, v, out=out: out.append(v)) for out in seen]
+    assert _wait_for(lambda: all(seen))
+    time.sleep(0.35)
+
+    stats = poller.stats()
+    assert list(stats["loops"]) == ["m"]
+    assert stats["subscriptions"] == 3
+    # One read per tick for all three subscribers, not one each.
+    assert reader.reads["m"] == stats["loops"]["m"]["polls"]
+    assert 3 <= reader.reads["m"] <= 6
+    # Unchanged value: each subscriber heard about it once.
+    assert seen == [[50], [50], [50]]
+    for token in tokens:
+        poller.unsubscribe(token)
+
+
+def test_loop_runs_at_the_fastest_subscriber_interval():
+    poller = BrightnessPoller(Timer(), _Reader())
+    slow = poller.subscribe("m", 1000, lambda mid, v: None)
+    assert poller.stats()["loops"]["m"]["interval_ms"] == 1000
+    fast = poller.subscribe("m", 200, lambda mid, v: None)
+    assert poller.stats()["loops"]["m"]["interval_ms"] == 200
+    poller.unsubscribe(fast)
+    assert poller.stats()["loops"]["m"]["interval_ms"] == 1000
+    poller.unsubscribe(slow)
+
+
+def test_loop_stops_when_the_last_subscriber_leaves():
+    reader = _Reader()
+    timer = Timer()
+    poller = BrightnessPoller(timer, reader)
+    first = poller.subscribe("m", 50, lambda mid, v: None)
+    second = poller.subscribe("m", 50, lambda mid, v: None)
+    other = poller.subscribe("n", 50, lambda mid, v: None)
+    assert _wait_for(lambda: reader.reads["m"] >= 2)
+
+    poller.unsubscribe(first)
+    count = reader.reads["m"]
+    assert _wait_for(lambda: reader.reads["m"] > count)
+    assert "m" in poller.stats()["loops"]
+
+    poller.unsubscribe(second)
+    assert list(poller.stats()["loops"]) == ["n"]
+    time.sleep(0.06)
+    count = reader.reads["m"]
+    time.sleep(0.2)
+    assert reader.reads["m"] == count
+    # The other monitor's loop is untouched.
+    count = reader.reads["n"]
+    assert _wait_for(lambda: reader.reads["n"] > count)
+    poller.unsubscribe(other)
+    assert poller.stats()["loops"] == {}
+
+
+def test_unknown_or_repeated_unsubscribe_is_ignored():
+    poller = BrightnessPoller(Timer(), _Reader())
+    token = poller.subscribe("m", 1000, lambda mid, v: None)
+    poller.unsubscribe(token)
+    poller.unsubscribe(token)
+    poller.unsubscribe(None)
+    assert poller.stats()["subscriptions"] == 0
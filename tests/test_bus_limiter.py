@@ -0,0 +1,110 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import FakeMonitor
+from src.core.bus_limiter import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, BusBusyError, BusLimiter
+from src.core.monitor_control import DdcCiMonitor
+from src.core.monitor_health import HEALTH_HEALTHY, HEALTH_QUARANTINED
+
+
+def test_commands_keep_the_minimum_gap():
+    bus = BusLimiter(min_gap_s=0.05)
+    started = []
+    for _ in range(3):
+        with bus.slot(PRIORITY_INTERACTIVE):
+            started.append(time.monotonic())
+    assert started[1] - started[0] >= 0.045
+    assert started[2] - started[1] >= 0.045
+    assert bus.stats()["commands"] == 3
+
+
+def test_failures_back_off_and_successes_decay():
+    bus = BusLimiter(min_gap_s=0.01, max_gap_s=0.04, backoff=2.0, decay=0.5)
+    for _ in range(4):
+        with bus.slot() as slot:
+            slot.ok = False
+    assert bus.stats()["gap_ms"] == pytest.approx(40.0)
+    assert bus.stats()["failures"] == 4
+    for _ in range(4):
+        with bus.slot():
+            pass
+    assert bus.stats()["gap_ms"] == pytest.approx(10.0)
+
+
+def test_background_caller_gives_up_after_timeout():
+    bus = BusLimiter(min_gap_s=0.0)
+    assert bus.acquire(PRIORITY_INTERACTIVE)
+    started = time.monotonic()
+    with bus.slot(PRIORITY_BACKGROUND, timeout_s=0.05) as slot:
+        assert not slot.acquired
+    assert time.monotonic() - started >= 0.045
+    bus.release(True, started)
+    assert bus.stats()["timeouts"] == 1
+
+
+def test_interactive_caller_goes_ahead_of_waiting_background():
+    bus = BusLimiter(min_gap_s=0.0)
+    assert bus.acquire(PRIORITY_BACKGROUND)
+    order = []
+
+    def run(priority, name):
+        with bus.slot(priority):
+            order.append(name)
+
+    background = threading.Thread(target=run, args=(PRIORITY_BACKGROUND, "read"))
+    background.start()
+    time.sleep(0.05)
+    interactive = threading.Thread(target=run, args=(PRIORITY_INTERACTIVE, "write"))
+    interactive.start()
+    time.sleep(0.05)
+    bus.release(True, time.monotonic())
+    background.join(1)
+    interactive.join(1)
+    assert order == ["write", "read"]
+    assert bus.stats()["preempted"] == 1
+
+
+def test_ddc_background_command_raises_bus_busy(monkeypatch):
+    monkeypatch.setattr("src.core.monitor_control._DDC_READ_BUS_TIMEOUT_S", 0.02)
+    monitor = DdcCiMonitor(SimpleNamespace(value=0), "Test", "ddcci:test")
+    assert monitor.bus.acquire(PRIORITY_INTERACTIVE)
+    try:
+        with pytest.raises(BusBusyError):
+            monitor._bus_command(PRIORITY_BACKGROUND, lambda: (0, 50, 100))
+    finally:
+        monitor.bus.release(True, time.monotonic())
+    time.sleep(0.06)
+    assert monitor._bus_command(PRIORITY_BACKGROUND, lambda: (0, 50, 100)) == (0, 50, 100)
+
+
+def test_bus_busy_reads_do_not_quarantine(fake_manager, fake_monitors):
+    monitor = FakeMonitor(0, value=40)
+    fake_monitors.append(monitor)
+    fake_manager.scan()
+    monitor.busy_reads = 5
+    for _ in range(5):
+        assert fake_manager.get_brightness_percent(0) is None
+    assert fake_manager.get_health_stats().get(monitor.monitor_id) is None
+    assert not fake_manager.is_quarantined(monitor.monitor_id)
+    assert fake_manager.get_brightness_percent(0) == 40
+
+
+def test_bus_busy_probe_is_retried(fake_manager, fake_monitors):
+    monitor = FakeMonitor(0, value=40)
+    fake_monitors.append(monitor)
+    fake_manager.scan()
+    health = fake_manager._health
+    for _ in range(3):
+        health.record_failure(monitor.monitor_id)
+    assert health.state(monitor.monitor_id) == HEALTH_QUARANTINED
+    health._entries[monitor.monitor_id].next_probe_at = 0.0
+
+    monitor.busy_reads = 1
+    assert fake_manager.probe_quarantined() == []
+    assert health.state(monitor.monitor_id) == HEALTH_QUARANTINED
+    # No verdict from the busy probe: it is due again straight away.
+    assert fake_manager.probe_quarantined() == [monitor.monitor_id]
+    assert health.state(monitor.monitor_id) == HEALTH_HEALTHY
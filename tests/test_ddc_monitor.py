@@ -0,0 +1,189 @@
+from types import SimpleNamespace
+
+import pytest
+
+import src.core.monitor_control as monitor_control
+from src.core.monitor_control import DdcCiMonitor, _PhysicalMonitorHandle
+
+
+class FakeDxva2:
+    """dxva2 stand-in for one physical monitor with a raw brightness range."""
+
+    def __init__(self, min_v=0, max_v=100, cur=50, high_level=True, vcp=True):
+        self.min_v = min_v
+        self.max_v = max_v
+        self.cur = cur
+        self.high_level = high_level
+        self.vcp = vcp
+        self.calls = []
+
+    def GetMonitorBrightness(self, handle, p_min, p_cur, p_max):
+        self.calls.append("GetMonitorBrightness")
+        if not self.high_level:
+            return 0
+        p_min._obj.value, p_cur._obj.value, p_max._obj.value = self.min_v, self.cur, self.max_v
+        return 1
+
+    def GetVCPFeatureAndVCPFeatureReply(self, handle, code, kind, p_cur, p_max):
+        self.calls.append("GetVCPFeatureAndVCPFeatureReply")
+        if not self.vcp:
+            return 0
+        p_cur._obj.value, p_max._obj.value = self.cur, self.max_v
+        return 1
+
+    def SetMonitorBrightness(self, handle, raw):
+        self.calls.append(("SetMonitorBrightness", raw.value))
+        if not self.high_level:
+            return 0
+        self.cur = raw.value
+        return 1
+
+    def SetVCPFeature(self, handle, code, raw):
+        self.calls.append(("SetVCPFeature", raw.value))
+        if not self.vcp:
+            return 0
+        self.cur = raw.value
+        return 1
+
+    def DestroyPhysicalMonitor(self, handle):
+        return 1
+
+
+@pytest.fixture
+def dxva2(monkeypatch):
+    fake = FakeDxva2()
+    monkeypatch.setattr(monitor_control, "_native", lambda: SimpleNamespace(dxva2=fake))
+    monkeypatch.setattr(monitor_control, "_DDC_MIN_GAP_S", 0.0)
+    return fake
+
+
+def _monitor():
+    return DdcCiMonitor(_PhysicalMonitorHandle(1), "Test", "ddcci:test")
+
+
+def test_write_without_range_does_not_back_off_the_bus(dxva2):
+    monitor = _monitor()
+    monitor._write_path = monitor_control._DDC_PATH_HIGH_LEVEL
+    # The range read comes back empty, so only the VCP write can run.
+    monitor._get_brightness_raw = lambda priority: None
+    gap_ms = monitor.bus.stats()["gap_ms"]
+    assert monitor.set_brightness_percent(30)
+    assert dxva2.calls == [("SetVCPFeature", 30)]
+    assert monitor.bus.stats()["failures"] == 0
+    assert monitor.bus.stats()["gap_ms"] <= gap_ms
+
+
+def test_both_paths_write_the_same_raw_value(dxva2):
+    dxva2.min_v, dxva2.max_v, dxva2.cur = 20, 220, 120
+    high = _monitor()
+    assert high.get_brightness_percent() == 50
+    assert high.set_brightness_percent(75)
+    assert dxva2.calls[-1] == ("SetMonitorBrightness", 170)
+
+    dxva2.cur = 120
+    vcp = _monitor()
+    assert vcp.get_brightness_percent() == 50
+    vcp._write_path = monitor_control._DDC_PATH_VCP
+    assert vcp.set_brightness_percent(75)
+    assert dxva2.calls[-1] == ("SetVCPFeature", 170)
+
+
+class FakeDisplays:
+    """dxva2 enumeration stand-in: HMONITOR -> [(device path, description)]."""
+
+    def __init__(self, layout):
+        self.layout = layout
+        self.opened = 0
+        self.destroyed = []
+        self._next_handle = 0x100
+
+    def GetNumberOfPhysicalMonitorsFromHMONITOR(self, hmon, p_count):
+        p_count._obj.value = len(self.layout.get(hmon.value, ()))
+        return 1
+
+    def GetPhysicalMonitorsFromHMONITOR(self, hmon, count, arr):
+        for i, (_path, desc) in enumerate(self.layout[hmon.value]):
+            self._next_handle += 1
+            self.opened += 1
+            arr[i].hPhysicalMonitor = self._next_handle
+            arr[i].szPhysicalMonitorDescription = desc
+        return 1
+
+    def DestroyPhysicalMonitor(self, handle):
+        self.destroyed.append(handle.value)
+        return 1
+
+
+@pytest.fixture
+def displays(monkeypatch):
+    fake = FakeDisplays({})
+    monkeypatch.setattr(monitor_control, "_native", lambda: SimpleNamespace(dxva2=fake))
+    monkeypatch.setattr(monitor_control.MonitorManager, "_enum_hmonitors", staticmethod(lambda: list(fake.layout)))
+    monkeypatch.setattr(
+        monitor_control.MonitorManager,
+        "_monitor_device_paths",
+        staticmethod(lambda hmon: [path for path, _desc in fake.layout.get(hmon, ()) if path]),
+    )
+    manager = monitor_control.MonitorManager(read_cache_ttl_s=0.0, backends=("ddcci",))
+    yield fake, manager
+    manager.close()
+
+
+_DELL = "\\\\?\\DISPLAY#DEL40F5#5&2b8ee5b1&0&UID4353#{e6f07b5f-ee97-4a90-b076-33f57bf4eaa7}"
+_LG = "\\\\?\\DISPLAY#GSM5B7F#5&2b8ee5b1&0&UID4354#{e6f07b5f-ee97-4a90-b076-33f57bf4eaa7}"
+
+
+def _handles(manager):
+    return {m.monitor_id: m._handle_ref.value for m in manager.snapshot().monitors}
+
+
+def test_ids_come_from_the_device_path(displays):
+    fake, manager = displays
+    fake.layout = {0x10001: [(_DELL, "Dell")], 0x10002: [(_LG, "LG")]}
+    manager.scan()
+    assert manager.get_monitor_ids() == [
+        "ddcci:DISPLAY#DEL40F5#5&2b8ee5b1&0&UID4353",
+        "ddcci:DISPLAY#GSM5B7F#5&2b8ee5b1&0&UID4354",
+    ]
+
+
+def test_reordered_enumeration_keeps_ids_and_handles(displays):
+    fake, manager = displays
+    fake.layout = {0x10001: [(_DELL, "Dell")], 0x10002: [(_LG, "LG")]}
+    manager.scan()
+    before = _handles(manager)
+    objects = {m.monitor_id: m for m in manager.snapshot().monitors}
+
+    fake.layout = {0x10002: [(_LG, "LG")], 0x10001: [(_DELL, "Dell")]}
+    manager.scan()
+    assert _handles(manager) == before
+    assert all(objects[m.monitor_id] is m for m in manager.snapshot().monitors)
+    assert fake.opened == 2
+    assert fake.destroyed == []
+
+
+def test_new_hmonitor_values_keep_ids_and_reopen_handles(displays):
+    fake, manager = displays
+    fake.layout = {0x10001: [(_DELL, "Dell")], 0x10002: [(_LG, "LG")]}
+    manager.scan()
+    before = _handles(manager)
+
+    # Sleep/wake or a dock change: same monitors, new HMONITORs, different order.
+    fake.layout = {0x20002: [(_LG, "LG")], 0x20001: [(_DELL, "Dell")]}
+    manager.scan()
+    after = _handles(manager)
+    assert sorted(after) == sorted(before)
+    assert set(after.values()).isdisjoint(before.values())
+    # The stale handles are closed; the monitors now point at the new HMONITORs.
+    assert sorted(fake.destroyed) == sorted(before.values())
+    assert {m.monitor_id: m.hmonitor for m in manager.snapshot().monitors} == {
+        "ddcci:DISPLAY#GSM5B7F#5&2b8ee5b1&0&UID4354": 0x20002,
+        "ddcci:DISPLAY#DEL40F5#5&2b8ee5b1&0&UID4353": 0x20001,
+    }
+
+
+def test_without_device_paths_ids_fall_back_to_the_hmonitor(displays):
+    fake, manager = displays
+    fake.layout = {0x10001: [(None, "Generic PnP")]}
+    manager.scan()
+    assert manager.get_monitor_ids() == ["ddcci:0x10001:0"]
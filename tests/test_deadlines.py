@@ -0,0 +1,102 @@
+import threading
+import time
+
+from conftest import FakeMonitor
+from src.core.monitor_control import RESULT_FAILED, RESULT_OK, RESULT_STALE, RESULT_TIMEOUT
+from src.core.monitor_writer import WRITE_CANCELLED, WRITE_OK
+
+
+def _scan(manager, fake_monitors, *monitors):
+    fake_monitors.extend(monitors)
+    manager.scan()
+
+
+def test_fast_read_is_ok_with_typed_fields(fake_manager, fake_monitors):
+    monitor = FakeMonitor(0, value=42)
+    _scan(fake_manager, fake_monitors, monitor)
+    result = fake_manager.read_brightness(0, timeout_s=1.0)
+    assert result.status == RESULT_OK
+    assert result.ok and not result.stale
+    assert result.monitor_id == monitor.monitor_id
+    assert result.value == 42
+    assert result.age_s == 0.0
+
+
+def test_slow_read_times_out_instead_of_blocking(fake_manager, fake_monitors):
+    monitor = FakeMonitor(0, value=42, read_s=0.5)
+    _scan(fake_manager, fake_monitors, monitor)
+    started = time.monotonic()
+    result = fake_manager.read_brightness(0, timeout_s=0.05)
+    assert time.monotonic() - started < 0.2
+    assert result.status == RESULT_TIMEOUT
+    assert result.value is None
+    assert result.monitor_id == monitor.monitor_id
+
+
+def test_slow_read_returns_the_last_known_value_as_stale(fake_manager, fake_monitors):
+    monitor = FakeMonitor(0, value=42, read_s=0.3)
+    _scan(fake_manager, fake_monitors, monitor)
+    assert fake_manager.read_brightness(0, timeout_s=1.0).value == 42
+    monitor.value = 55
+    result = fake_manager.read_brightness(0, timeout_s=0.05)
+    assert result.status == RESULT_STALE
+    assert result.stale and not result.ok
+    assert result.value == 42
+    assert result.age_s > 0.0
+    # The abandoned read keeps going and refreshes the value for the next caller.
+    time.sleep(0.4)
+    assert fake_manager.read_cache.last_known(monitor.monitor_id)[0] == 55
+
+
+def test_unknown_monitor_read_fails(fake_manager, fake_monitors):
+    _scan(fake_manager, fake_monitors, FakeMonitor(0))
+    result = fake_manager.read_brightness(5, timeout_s=0.1)
+    assert result.status == RESULT_FAILED
+    assert result.monitor_id is None and result.value is None
+
+
+def test_slow_write_times_out_and_finishes_later(fake_manager, fake_monitors):
+    monitor = FakeMonitor(0, value=10, write_s=0.3)
+    _scan(fake_manager, fake_monitors, monitor)
+    started = time.monotonic()
+    result = fake_manager.write_brightness(0, 70, timeout_s=0.05)
+    assert time.monotonic() - started < 0.2
+    assert result.timed_out and not result.ok
+    assert result.status == RESULT_TIMEOUT
+    assert result.monitor_id == monitor.monitor_id
+    assert result.percent == 70
+    # The write was already running, so it is left to land.
+    assert result.ticket.wait(1)
+    assert result.ticket.status == WRITE_OK
+    assert monitor.value == 70
+
+
+def test_write_still_queued_at_the_deadline_is_cancelled(fake_manager, fake_monitors):
+    monitor = FakeMonitor(0, value=10, write_s=0.3)
+    _scan(fake_manager, fake_monitors, monitor)
+    busy = fake_manager.submit_brightness_percent(0, 20)
+    time.sleep(0.05)
+    result = fake_manager.write_brightness(0, 70, timeout_s=0.05)
+    assert result.timed_out
+    assert result.ticket.status == WRITE_CANCELLED
+    assert busy.wait(1)
+    time.sleep(0.05)
+    assert monitor.writes == [20]
+
+
+def test_slow_monitor_does_not_hold_up_the_others(fake_manager, fake_monitors):
+    slow = FakeMonitor(0, value=10, read_s=0.5, write_s=0.5)
+    fast = FakeMonitor(1, value=30)
+    _scan(fake_manager, fake_monitors, slow, fast)
+    stuck = threading.Thread(target=lambda: fake_manager.read_brightness(0, timeout_s=2.0))
+    stuck.start()
+    fake_manager.submit_brightness_percent(0, 50)
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    read = fake_manager.read_brightness(1, timeout_s=1.0)
+    write = fake_manager.write_brightness(1, 60, timeout_s=1.0)
+    assert time.monotonic() - started < 0.2
+    assert read.ok and read.value == 30
+    assert write.ok and write.status == WRITE_OK
+    stuck.join(2)
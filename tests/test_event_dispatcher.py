@@ -0,0 +1,147 @@
+import threading
+import time
+
+import pytest
+
+from src.core.event_dispatcher import EventDispatcher, InboundEvent
+
+
+def _event(event, context="ctx", **payload):
+    return InboundEvent(event, context, {"event": event, "context": context, "payload": payload})
+
+
+class _Recorder:
+    """Handler that can hold the first call until released."""
+
+    def __init__(self, hold_first: bool = False):
+        self.handled = []
+        self.threads = set()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        if not hold_first:
+            self.release.set()
+
+    def __call__(self, item):
+        self.threads.add(threading.current_thread().name)
+        self.entered.set()
+        assert self.release.wait(5)
+        self.handled.append((item.event, item.context, item.payload.get("ticks"), item.merged))
+
+
+@pytest.fixture
+def make_dispatcher():
+    created = []
+
+    def _make(handler, **kwargs):
+        dispatcher = EventDispatcher(handler, **kwargs)
+        created.append(dispatcher)
+        return dispatcher
+
+    yield _make
+    for dispatcher in created:
+        dispatcher.close(timeout_s=1.0)
+
+
+def test_events_for_a_context_run_in_order_off_the_caller_thread(make_dispatcher):
+    rec = _Recorder()
+    dispatcher = make_dispatcher(rec)
+    for event in ("willAppear", "keyDown", "keyUp", "willDisappear"):
+        assert dispatcher.submit("ctx", _event(event))
+    assert dispatcher.wait_idle(1)
+    assert [h[0] for h in rec.handled] == ["willAppear", "keyDown", "keyUp", "willDisappear"]
+    assert threading.current_thread().name not in rec.threads
+
+
+def test_slow_context_does_not_block_others(make_dispatcher):
+    slow_release = threading.Event()
+    fast_done = threading.Event()
+
+    def handler(item):
+        if item.context == "slow":
+            slow_release.wait(5)
+        else:
+            fast_done.set()
+
+    dispatcher = make_dispatcher(handler, max_workers=2)
+    dispatcher.submit("slow", _event("keyDown", "slow"))
+    dispatcher.submit("fast", _event("keyDown", "fast"))
+    assert fast_done.wait(1)
+    slow_release.set()
+    assert dispatcher.wait_idle(1)
+
+
+def test_queued_rotations_coalesce_into_one_event(make_dispatcher):
+    rec = _Recorder(hold_first=True)
+    dispatcher = make_dispatcher(rec)
+    dispatcher.submit("ctx", _event("dialRotate", ticks=1))
+    assert rec.entered.wait(1)
+    for _ in range(4):
+        dispatcher.submit("ctx", _event("dialRotate", ticks=2))
+    rec.release.set()
+    assert dispatcher.wait_idle(1)
+    assert rec.handled == [("dialRotate", "ctx", 1, 1), ("dialRotate", "ctx", 8, 4)]
+    stats = dispatcher.stats()
+    assert stats["coalesced"] == 3
+    assert stats["max_batch"] == 4
+    assert stats["handled"] == 2
+    assert stats["depth"] == 0
+
+
+def test_rotations_stay_apart_across_direction_press_and_other_events(make_dispatcher):
+    rec = _Recorder(hold_first=True)
+    dispatcher = make_dispatcher(rec)
+    dispatcher.submit("ctx", _event("keyDown"))
+    assert rec.entered.wait(1)
+    dispatcher.submit("ctx", _event("dialRotate", ticks=1))
+    dispatcher.submit("ctx", _event("dialRotate", ticks=-1))
+    dispatcher.submit("ctx", _event("dialRotate", ticks=-1, pressed=True))
+    dispatcher.submit("ctx", _event("dialDown"))
+    dispatcher.submit("ctx", _event("dialRotate", ticks=-1, pressed=True))
+    rec.release.set()
+    assert dispatcher.wait_idle(1)
+    assert [(h[0], h[2]) for h in rec.handled] == [
+        ("keyDown", None),
+        ("dialRotate", 1),
+        ("dialRotate", -1),
+        ("dialRotate", -1),
+        ("dialDown", None),
+        ("dialRotate", -1),
+    ]
+    assert dispatcher.stats()["coalesced"] == 0
+
+
+def test_legacy_delta_field_is_summed_as_ticks(make_dispatcher):
+    rec = _Recorder(hold_first=True)
+    dispatcher = make_dispatcher(rec)
+    dispatcher.submit("ctx", _event("keyDown"))
+    assert rec.entered.wait(1)
+    dispatcher.submit("ctx", _event("dialRotate", delta=3))
+    dispatcher.submit("ctx", _event("dialRotate", delta=2))
+    rec.release.set()
+    assert dispatcher.wait_idle(1)
+    assert rec.handled[-1] == ("dialRotate", "ctx", 5, 2)
+
+
+def test_handler_errors_are_counted_and_the_lane_keeps_going(make_dispatcher):
+    handled = []
+
+    def handler(item):
+        if item.event == "bad":
+            raise ValueError("boom")
+        handled.append(item.event)
+
+    dispatcher = make_dispatcher(handler)
+    dispatcher.submit("ctx", _event("bad"))
+    dispatcher.submit("ctx", _event("good"))
+    assert dispatcher.wait_idle(1)
+    assert handled == ["good"]
+    assert dispatcher.stats()["errors"] == 1
+
+
+def test_closed_dispatcher_rejects_events(make_dispatcher):
+    dispatcher = make_dispatcher(lambda item: None)
+    dispatcher.close(timeout_s=0.1)
+    assert not dispatcher.submit("ctx", _event("keyDown"))
+    started = time.monotonic()
+    assert dispatcher.wait_idle(1)
+    assert time.monotonic() - started < 0.1
@@ -0,0 +1,97 @@
+import threading
+import time
+
+import pytest
+
+from src.core.io_worker import IoWorker, WorkerMonitorManager
+
+
+@pytest.fixture
+def sim_env(monkeypatch):
+    # The spawned child inherits these when it starts.
+    monkeypatch.setenv("BRIGHTNESS_BACKENDS", "sim")
+    monkeypatch.setenv("BRIGHTNESS_SIM_MONITORS", "2")
+    monkeypatch.setenv("BRIGHTNESS_SIM_READ_MS", "0")
+    monkeypatch.setenv("BRIGHTNESS_SIM_WRITE_MS", "0")
+    monkeypatch.setenv("BRIGHTNESS_SIM_JITTER_MS", "0")
+    monkeypatch.setenv("BRIGHTNESS_SIM_BRIGHTNESS", "50")
+
+
+@pytest.fixture
+def worker(sim_env):
+    w = IoWorker()
+    yield w
+    w.close()
+
+
+def test_scan_read_write(worker):
+    ids = [d["id"] for d in worker.scan()]
+    assert ids == ["sim:0", "sim:1"]
+    assert worker.call("get", monitor_id="sim:0") == 50
+    assert worker.call("set", monitor_id="sim:0", percent=70) is True
+    assert worker.call("get", monitor_id="sim:0") == 70
+    assert worker.call("get", monitor_id="sim:1") == 50
+
+
+def test_deadline_miss_kills_and_respawns_with_replay(worker, monkeypatch):
+    worker.scan()
+    assert worker.starts == 1
+    # Only the next child is slow to write; the first one was spawned with fast writes.
+    monkeypatch.setenv("BRIGHTNESS_SIM_WRITE_MS", "5000")
+    first = worker._session
+    first.proc.kill()
+    first.proc.join(5)
+    # The dead child is noticed, a new one spawned and the registry replayed before the call.
+    assert worker.call("get", monitor_id="sim:1") == 50
+    assert worker.starts == 2
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        worker.call("set", timeout_s=0.3, monitor_id="sim:0", percent=90)
+    assert time.monotonic() - started < 3.0
+    assert worker.timeouts == 1
+    assert worker._session is None
+
+    monkeypatch.setenv("BRIGHTNESS_SIM_WRITE_MS", "0")
+    # Monitor IDs still resolve in the third child: the scan was replayed.
+    assert worker.call("set", monitor_id="sim:0", percent=30) is True
+    assert worker.call("get", monitor_id="sim:0") == 30
+    assert worker.starts == 3
+
+
+def test_calls_fail_fast_while_replay_runs(worker):
+    worker.scan()
+    release = threading.Event()
+    replaying = threading.Event()
+    original = worker._replay
+
+    def slow_replay(session):
+        replaying.set()
+        release.wait(5)
+        original(session)
+
+    worker._replay = slow_replay
+    worker._session.proc.kill()
+    worker._session.proc.join(5)
+
+    results = []
+    restarter = threading.Thread(target=lambda: results.append(worker.call("get", monitor_id="sim:0")))
+    restarter.start()
+    assert replaying.wait(10)
+    started = time.monotonic()
+    with pytest.raises(RuntimeError):
+        worker.call("get", monitor_id="sim:1")
+    assert time.monotonic() - started < 0.5
+    release.set()
+    restarter.join(10)
+    assert results == [50]
+
+
+def test_worker_monitor_manager_uses_child_backends(sim_env):
+    manager = WorkerMonitorManager(read_cache_ttl_s=0.0)
+    try:
+        manager.scan()
+        assert manager.get_monitor_ids() == ["sim:0", "sim:1"]
+        assert manager.get_brightness_percent(0) == 50
+    finally:
+        manager.close()
@@ -0,0 +1,75 @@
+import time
+
+from conftest import FakeMonitor
+from src.core.monitor_control import RESULT_SKIPPED
+
+
+def _settle(manager, monitor_id, timeout_s=1.0):
+    """Wait until the writer is idle; write listeners (the known-state model) have run by then."""
+    deadline = time.monotonic() + timeout_s
+    while manager.is_writing(monitor_id):
+        assert time.monotonic() < deadline, "write never settled"
+        time.sleep(0.005)
+
+
+def test_same_percent_twice_writes_once(fake_manager, fake_monitors, make_hub):
+    monitor = FakeMonitor(0, value=10)
+    fake_monitors.append(monitor)
+    hub = make_hub()
+    assert hub.write_monitor_brightness(0, 40, timeout_s=1.0).ok
+    _settle(fake_manager, monitor.monitor_id)
+
+    result = hub.write_monitor_brightness(0, 40, timeout_s=1.0)
+    assert result.status == RESULT_SKIPPED
+    assert monitor.writes == [40]
+    stats = hub.get_known_state_stats()
+    assert stats["skipped"] == 1
+    assert stats["checked"] == 2
+
+
+def test_force_writes_even_when_known(fake_manager, fake_monitors, make_hub):
+    monitor = FakeMonitor(0, value=10)
+    fake_monitors.append(monitor)
+    hub = make_hub()
+    assert hub.write_monitor_brightness(0, 40, timeout_s=1.0).ok
+    _settle(fake_manager, monitor.monitor_id)
+    assert hub.write_monitor_brightness(0, 40, timeout_s=1.0, force=True).ok
+    assert monitor.writes == [40, 40]
+    assert hub.get_known_state_stats()["skipped"] == 0
+
+
+def test_poll_seeing_an_external_change_replaces_the_known_value(fake_manager, fake_monitors, make_hub):
+    monitor = FakeMonitor(0, value=10)
+    fake_monitors.append(monitor)
+    hub = make_hub()
+    assert hub.write_monitor_brightness(0, 40, timeout_s=1.0).ok
+    _settle(fake_manager, monitor.monitor_id)
+
+    # Changed on the monitor's own OSD; the next poll notices.
+    monitor.value = 70
+    assert hub.read_monitor_brightness(0, timeout_s=1.0).value == 70
+    assert hub.get_known_state_stats()["external_changes"] == 1
+
+    # 40 is no longer what the monitor shows, so it is written again...
+    assert hub.write_monitor_brightness(0, 40, timeout_s=1.0).status != RESULT_SKIPPED
+    assert monitor.writes == [40, 40]
+    # ...while the value the poll saw is now trusted.
+    _settle(fake_manager, monitor.monitor_id)
+    monitor.value = 70
+    hub.read_monitor_brightness(0, timeout_s=1.0)
+    assert hub.write_monitor_brightness(0, 70, timeout_s=1.0).status == RESULT_SKIPPED
+    assert monitor.writes == [40, 40]
+
+
+def test_failed_write_forgets_the_known_value(fake_manager, fake_monitors, make_hub):
+    monitor = FakeMonitor(0, value=10)
+    fake_monitors.append(monitor)
+    hub = make_hub()
+    assert hub.write_monitor_brightness(0, 40, timeout_s=1.0).ok
+    _settle(fake_manager, monitor.monitor_id)
+    # Fails again after the hub's re-open and retry.
+    monitor.fail_writes = 2
+    assert not hub.write_monitor_brightness(0, 50, timeout_s=1.0).ok
+    _settle(fake_manager, monitor.monitor_id)
+    assert hub.get_known_state_stats()["entries"] == 0
+    assert hub.write_monitor_brightness(0, 40, timeout_s=1.0).status != RESULT_SKIPPED
@@ -0,0 +1,79 @@
+import time
+
+from src.core.monitor_health import HEALTH_DEGRADED, HEALTH_HEALTHY, HEALTH_QUARANTINED, MonitorHealth
+
+
+def _quarantine(health, monitor_id="m"):
+    for _ in range(3):
+        health.record_failure(monitor_id)
+
+
+def test_failures_degrade_then_quarantine():
+    health = MonitorHealth(quarantine_after=3)
+    assert health.state("m") == HEALTH_HEALTHY
+    assert health.record_failure("m") == HEALTH_DEGRADED
+    assert health.record_failure("m") == HEALTH_DEGRADED
+    assert health.record_failure("m") == HEALTH_QUARANTINED
+    assert health.is_quarantined("m")
+    assert health.quarantined_ids() == ["m"]
+    assert health.stats()["m"]["trips"] == 1
+
+
+def test_success_resets_the_failure_count():
+    health = MonitorHealth(quarantine_after=3)
+    health.record_failure("m")
+    health.record_failure("m")
+    health.record_success("m")
+    assert health.state("m") == HEALTH_HEALTHY
+    health.record_failure("m")
+    health.record_failure("m")
+    assert health.state("m") == HEALTH_DEGRADED
+
+
+def test_probe_is_due_once_per_interval():
+    health = MonitorHealth(probe_interval_s=0.05)
+    _quarantine(health)
+    assert health.due_probes() == []
+    time.sleep(0.06)
+    assert health.due_probes() == ["m"]
+    # Marked as probing until a verdict comes in.
+    assert health.due_probes() == []
+
+
+def test_failed_probe_backs_off():
+    health = MonitorHealth(probe_interval_s=0.05, max_probe_interval_s=0.15)
+    _quarantine(health)
+    for expected in (0.1, 0.15, 0.15):
+        health._entries["m"].next_probe_at = 0.0
+        assert health.due_probes() == ["m"]
+        assert health.record_failure("m") == HEALTH_QUARANTINED
+        assert health.stats()["m"]["next_probe_s"] <= expected
+        assert health._entries["m"].probe_interval_s == expected
+
+
+def test_successful_probe_closes_the_breaker():
+    health = MonitorHealth(probe_interval_s=0.0)
+    _quarantine(health)
+    assert health.due_probes() == ["m"]
+    health.record_success("m")
+    assert health.state("m") == HEALTH_HEALTHY
+    assert health.stats()["m"]["next_probe_s"] is None
+
+
+def test_skipped_read_gives_no_verdict():
+    health = MonitorHealth(probe_interval_s=0.0)
+    _quarantine(health)
+    assert health.due_probes() == ["m"]
+    health.record_skipped("m")
+    assert health.state("m") == HEALTH_QUARANTINED
+    assert health.due_probes() == ["m"]
+    health.record_skipped("unknown")
+    assert health.state("unknown") == HEALTH_HEALTHY
+
+
+def test_forget_drops_the_entry():
+    health = MonitorHealth()
+    _quarantine(health)
+    health.forget("m")
+    assert health.state("m") == HEALTH_HEALTHY
+    assert health.stats() == {}
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from conftest import FakeMonitor
+from src.core.monitor_registry import MonitorBackendRegistry
+from src.core.monitor_scanner import BackgroundScanner
+
+
+class _SlowScan:
+    def __init__(self):
+        self.calls = 0
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.calls += 1
+        self.entered.set()
+        assert self.release.wait(5)
+
+
+def _concurrently(n, fn):
+    results = [None] * n
+
+    def run(i):
+        results[i] = fn()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(2)
+    return results
+
+
+def test_requests_during_a_scan_share_it():
+    scan = _SlowScan()
+    scanner = BackgroundScanner(scan, min_interval_s=0.0)
+    first = scanner.request()
+    assert scan.entered.wait(1)
+    tickets = _concurrently(8, scanner.request)
+    assert set(tickets) == {first}
+    scan.release.set()
+    assert scanner.wait(first, 1)
+    time.sleep(0.05)
+    assert scan.calls == 1
+    assert not scanner.is_scanning()
+
+
+def test_forced_requests_during_a_scan_collapse_into_one_more():
+    scan = _SlowScan()
+    scanner = BackgroundScanner(scan, min_interval_s=0.0)
+    first = scanner.request(force=True)
+    assert scan.entered.wait(1)
+    tickets = _concurrently(8, lambda: scanner.request(force=True))
+    assert set(tickets) == {first + 1}
+    scan.release.set()
+    assert scanner.wait(first + 1, 1)
+    assert scan.calls == 2
+
+
+def test_requests_within_min_interval_are_throttled():
+    scan = _SlowScan()
+    scan.release.set()
+    scanner = BackgroundScanner(scan, min_interval_s=10.0)
+    assert scanner.wait(scanner.request(), 1)
+    assert scanner.wait(scanner.request(), 0)
+    assert scan.calls == 1
+
+
+def test_readers_do_not_block_on_a_scan(fake_manager, fake_monitors):
+    fake_monitors.append(FakeMonitor(0, value=40))
+    fake_manager.scan()
+    gate = threading.Event()
+    entered = threading.Event()
+
+    def slow_provider(manager, current):
+        entered.set()
+        assert gate.wait(5)
+        return list(current.values())
+
+    MonitorBackendRegistry.register("fake", slow_provider)
+    scanner = BackgroundScanner(fake_manager.scan, min_interval_s=0.0)
+    ticket = scanner.request(force=True)
+    assert entered.wait(1)
+
+    started = time.monotonic()
+    assert fake_manager.get_monitor_ids() == ["fake:0"]
+    assert fake_manager.read_brightness(0, timeout_s=1.0).value == 40
+    assert time.monotonic() - started < 0.2
+    assert not scanner.wait(ticket, 0)
+    gate.set()
+    assert scanner.wait(ticket, 1)
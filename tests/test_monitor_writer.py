@@ -0,0 +1,123 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.core.monitor_writer import (
+    WRITE_CANCELLED,
+    WRITE_FAILED,
+    WRITE_OK,
+    WRITE_SUPERSEDED,
+    MonitorWriter,
+)
+
+
+class _Hardware:
+    """Write function that blocks until released, recording what reached it."""
+
+    def __init__(self, ok: bool = True):
+        self.ok = ok
+        self.writes = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, percent):
+        self.writes.append(percent)
+        self.started.set()
+        assert self.release.wait(5)
+        return self.ok
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=2)
+    yield pool
+    pool.shutdown(wait=False)
+
+
+def test_burst_writes_only_in_flight_and_newest(executor):
+    hw = _Hardware()
+    writer = MonitorWriter("m", hw.write, executor)
+    first = writer.submit(10)
+    assert hw.started.wait(1)
+    middle = [writer.submit(p) for p in (20, 30, 40)]
+    last = writer.submit(50)
+    hw.release.set()
+    assert last.wait(1)
+    assert hw.writes == [10, 50]
+    assert first.status == WRITE_OK
+    assert [t.status for t in middle] == [WRITE_SUPERSEDED] * 3
+    stats = writer.stats()
+    assert stats["written"] == 2
+    assert stats["superseded"] == 3
+    assert not writer.busy
+
+
+def test_failed_write_and_exception_are_reported(executor):
+    hw = _Hardware(ok=False)
+    hw.release.set()
+    writer = MonitorWriter("m", hw.write, executor)
+    ticket = writer.submit(10)
+    assert ticket.wait(1)
+    assert ticket.status == WRITE_FAILED
+
+    def boom(percent):
+        raise OSError("bus error")
+
+    writer = MonitorWriter("m", boom, executor)
+    ticket = writer.submit(10)
+    assert ticket.wait(1)
+    assert ticket.status == WRITE_FAILED
+
+
+def test_cancel_only_before_start(executor):
+    hw = _Hardware()
+    writer = MonitorWriter("m", hw.write, executor)
+    running = writer.submit(10)
+    assert hw.started.wait(1)
+    queued = writer.submit(20)
+    assert not running.cancel()
+    assert queued.cancel()
+    assert queued.status == WRITE_CANCELLED
+    hw.release.set()
+    assert running.wait(1)
+    assert hw.writes == [10]
+
+
+def test_closed_writer_cancels_new_targets(executor):
+    hw = _Hardware()
+    hw.release.set()
+    writer = MonitorWriter("m", hw.write, executor)
+    writer.close()
+    ticket = writer.submit(10)
+    assert ticket.done()
+    assert ticket.status == WRITE_CANCELLED
+    assert hw.writes == []
+
+
+def test_callbacks_see_every_ticket_and_gate_runs_first(executor):
+    hw = _Hardware()
+    order = []
+    completed = []
+    writer = MonitorWriter("m", hw.write, executor, on_complete=lambda t: completed.append(t.status))
+    ticket = writer.submit(10, gate=lambda: order.append("gate"))
+    ticket.add_done_callback(lambda t: order.append("done"))
+    assert hw.started.wait(1)
+    order.append("write")
+    hw.release.set()
+    assert ticket.wait(1)
+    late = []
+    ticket.add_done_callback(lambda t: late.append(t.status))
+    assert order == ["gate", "write", "done"]
+    assert completed == [WRITE_OK]
+    assert late == [WRITE_OK]
+    assert writer.latency_ema_ms is not None
+
+
+def test_shut_down_executor_cancels_instead_of_hanging():
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.shutdown()
+    writer = MonitorWriter("m", lambda p: True, pool)
+    ticket = writer.submit(10)
+    assert ticket.wait(1)
+    assert ticket.status == WRITE_CANCELLED
@@ -0,0 +1,82 @@
+import base64
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from src.core.powershell_worker import PowerShellWorker, default_worker_argv
+
+_STANDIN = os.path.join(os.path.dirname(os.path.abspath(__file__)), "powershell_standin.py")
+
+
+@pytest.fixture
+def worker():
+    w = PowerShellWorker(argv=[sys.executable, _STANDIN], startup_grace_s=0.0)
+    yield w
+    w.close()
+
+
+def test_round_trip_decodes_json(worker):
+    assert worker.call_json('echo {"a": [1, 2]}', timeout_s=5.0) == {"a": [1, 2]}
+    assert worker.call_json("echo", timeout_s=5.0) is None
+    assert worker.starts == 1
+
+
+def test_error_reply_raises_and_keeps_worker(worker):
+    with pytest.raises(RuntimeError, match="boom"):
+        worker.call_json("fail boom", timeout_s=5.0)
+    assert worker.call_json("echo 1", timeout_s=5.0) == 1
+    assert worker.starts == 1
+
+
+def test_timeout_kills_and_next_call_restarts(worker):
+    first_pid = worker.call_json("pid", timeout_s=5.0)
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        worker.call_json("sleep 5 1", timeout_s=0.3)
+    assert time.monotonic() - started < 2.0
+    assert worker.call_json("pid", timeout_s=5.0) != first_pid
+    assert worker.starts == 2
+
+
+def test_restart_after_worker_exits(worker):
+    first_pid = worker.call_json("pid", timeout_s=5.0)
+    with pytest.raises(RuntimeError, match="exited"):
+        worker.call_json("exit", timeout_s=5.0)
+    assert worker.call_json("pid", timeout_s=5.0) != first_pid
+    assert worker.starts == 2
+
+
+def test_malformed_replies(worker):
+    # Junk lines on stdout are skipped; the real reply still arrives.
+    assert worker.call_json("garbage 7", timeout_s=5.0) == 7
+    with pytest.raises(ValueError):
+        worker.call_json("badjson", timeout_s=5.0)
+    assert worker.call_json("echo 8", timeout_s=5.0) == 8
+    assert worker.starts == 1
+
+
+def test_queued_call_deadline_starts_when_written(worker):
+    worker.call_json("echo 0", timeout_s=5.0)
+    results = {}
+
+    def slow():
+        results["slow"] = worker.call_json("sleep 0.5 1", timeout_s=2.0)
+
+    t = threading.Thread(target=slow)
+    t.start()
+    time.sleep(0.1)
+    # Waits ~0.4s behind the slow call, which must not count against its 0.3s.
+    results["queued"] = worker.call_json("echo 2", timeout_s=0.3)
+    t.join(5)
+    assert results == {"slow": 1, "queued": 2}
+    assert worker.starts == 1
+
+
+def test_default_argv_uses_encoded_command():
+    argv = default_worker_argv()
+    assert argv[-2] == "-EncodedCommand"
+    script = base64.b64decode(argv[-1]).decode("utf-16-le")
+    assert "ConvertFrom-Json" in script
@@ -0,0 +1,108 @@
+import json
+import time
+
+import pytest
+
+from src.core.settings_store import GlobalSettingsStore
+from src.core.timer import Timer
+
+
+def _wait_for(predicate, timeout_s=1.0):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+@pytest.fixture
+def sent():
+    return []
+
+
+@pytest.fixture
+def make_store(sent):
+    def _make(**kwargs):
+        return GlobalSettingsStore(Timer(), sent.append, **kwargs)
+
+    return _make
+
+
+def test_burst_of_updates_is_sent_once_after_quiet(make_store, sent):
+    store = make_store(quiet_ms=50, max_delay_ms=1000)
+    for i in range(5):
+        store.update({"value": i})
+        time.sleep(0.01)
+    assert sent == []
+    assert _wait_for(lambda: sent)
+    time.sleep(0.08)
+    assert sent == [{"value": 4}]
+    assert store.stats()["flushes"] == 1
+    assert store.stats()["updates"] == 5
+
+
+def test_max_delay_bounds_a_continuous_stream(make_store, sent):
+    store = make_store(quiet_ms=50, max_delay_ms=150)
+    started = time.monotonic()
+    while time.monotonic() - started < 0.4 and not sent:
+        store.update({"value": time.monotonic()})
+        time.sleep(0.01)
+    assert sent
+    assert time.monotonic() - started < 0.25
+
+
+def test_flush_sends_the_whole_dict(make_store, sent):
+    store = make_store(quiet_ms=1000)
+    store.note_persisted({"a": 1, "b": 2})
+    store.update({"b": 3})
+    assert store.flush()
+    assert sent == [{"a": 1, "b": 3}]
+
+
+def test_nothing_is_sent_when_nothing_changed(make_store, sent):
+    store = make_store(quiet_ms=20)
+    store.note_persisted({"a": 1})
+    store.update({"a": 1})
+    assert not store.flush()
+    store.update({"a": 2})
+    store.update({"a": 1})
+    time.sleep(0.06)
+    assert sent == []
+    assert store.stats()["dirty"] == []
+    assert store.stats()["skipped"] >= 1
+
+
+def test_mirror_is_written_and_read_back(make_store, sent, tmp_path):
+    path = tmp_path / "sub" / "global_settings.json"
+    store = make_store(mirror_path=str(path), quiet_ms=1000)
+    assert store.load_mirror() is None
+    store.update({"a": 1})
+    assert store.flush()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+    assert make_store(mirror_path=str(path)).load_mirror() == {"a": 1}
+
+
+def test_unreadable_or_unwritable_mirror_is_tolerated(make_store, sent, tmp_path):
+    bad = tmp_path / "bad.json"
+    bad.write_text("not json", encoding="utf-8")
+    assert make_store(mirror_path=str(bad)).load_mirror() is None
+    blocked = tmp_path / "file"
+    blocked.write_text("", encoding="utf-8")
+    store = make_store(mirror_path=str(blocked / "global_settings.json"), quiet_ms=1000)
+    store.update({"a": 1})
+    assert store.flush()
+    assert sent == [{"a": 1}]
+    assert store.stats()["mirror_errors"] == 1
+
+
+def test_send_failure_still_marks_flushed(make_store, tmp_path):
+    def failing(payload):
+        raise OSError("socket closed")
+
+    path = tmp_path / "global_settings.json"
+    store = GlobalSettingsStore(Timer(), failing, mirror_path=str(path), quiet_ms=1000)
+    store.update({"a": 1})
+    assert store.flush()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"a": 1}
+    assert not store.flush()
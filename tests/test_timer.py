@@ -0,0 +1,100 @@
+import threading
+import time
+
+from src.core.timer import Timer
+
+
+def _wait_for(predicate, timeout_s=1.0):
+    deadline = time.monotonic() + timeout_s
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+def test_call_later_runs_once_after_the_delay():
+    timer = Timer()
+    fired = []
+    started = time.monotonic()
+    timer.call_later(50, lambda: fired.append(time.monotonic() - started))
+    assert _wait_for(lambda: fired)
+    time.sleep(0.05)
+    assert len(fired) == 1
+    assert fired[0] >= 0.045
+
+
+def test_callbacks_run_in_deadline_order():
+    timer = Timer(max_workers=1)
+    order = []
+    timer.call_later(60, lambda: order.append("late"))
+    timer.call_later(20, lambda: order.append("early"))
+    timer.call_later(40, lambda: order.append("middle"))
+    assert _wait_for(lambda: len(order) == 3)
+    assert order == ["early", "middle", "late"]
+
+
+def test_keyed_call_later_replaces_the_pending_one():
+    timer = Timer()
+    fired = []
+    timer.call_later(30, lambda: fired.append("old"), key="k")
+    timer.call_later(30, lambda: fired.append("new"), key="k")
+    assert _wait_for(lambda: fired)
+    time.sleep(0.05)
+    assert fired == ["new"]
+    assert timer.stats()["scheduled"] == 0
+
+
+def test_cancelled_handle_never_runs():
+    timer = Timer()
+    fired = []
+    handle = timer.call_later(30, lambda: fired.append(1))
+    handle.cancel()
+    time.sleep(0.08)
+    assert fired == []
+
+
+def test_interval_repeats_until_cleared():
+    timer = Timer()
+    ticks = []
+    timer.set_interval("tick", 20, lambda: ticks.append(1))
+    assert _wait_for(lambda: len(ticks) >= 3)
+    timer.clear_interval("tick")
+    time.sleep(0.03)
+    count = len(ticks)
+    time.sleep(0.08)
+    assert len(ticks) == count
+
+
+def test_slow_interval_run_is_skipped_not_stacked():
+    timer = Timer()
+    running = []
+    release = threading.Event()
+
+    def slow():
+        running.append(1)
+        release.wait(1)
+
+    timer.set_interval("slow", 10, slow)
+    assert _wait_for(lambda: timer.stats()["overruns"] >= 2)
+    assert len(running) == 1
+    timer.clear_interval("slow")
+    release.set()
+
+
+def test_slow_callback_does_not_delay_other_tasks():
+    timer = Timer(max_workers=2)
+    release = threading.Event()
+    fired = threading.Event()
+    timer.call_later(0, lambda: release.wait(1))
+    timer.call_later(20, fired.set)
+    assert fired.wait(0.5)
+    release.set()
+
+
+def test_failing_callback_is_logged_and_the_timer_keeps_running():
+    timer = Timer()
+    fired = threading.Event()
+    timer.call_later(0, lambda: 1 / 0)
+    timer.call_later(10, fired.set)
+    assert fired.wait(1)
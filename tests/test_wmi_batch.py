@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+import src.core.monitor_control as monitor_control
+from src.core.monitor_control import MonitorManager
+
+
+class _PowerShell:
+    """Stands in for the PowerShell worker: answers WmiMonitorBrightness queries."""
+
+    def __init__(self, values, delay_s=0.0):
+        self.values = dict(values)
+        self.delay_s = delay_s
+        self.queries = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, script, timeout_s=2.5):
+        assert "WmiMonitorBrightness " in script
+        with self._lock:
+            self.queries += 1
+        time.sleep(self.delay_s)
+        return [{"InstanceName": name, "CurrentBrightness": value} for name, value in self.values.items()]
+
+
+@pytest.fixture
+def wmi(monkeypatch):
+    ps = _PowerShell({f"DISPLAY\\PNP{i}\\0_0": 10 * i for i in range(4)}, delay_s=0.05)
+    monkeypatch.setattr(monitor_control, "_run_powershell_json", ps)
+    manager = MonitorManager(read_cache_ttl_s=0.0, backends=("wmi",))
+    manager.scan()
+    yield ps, manager
+    manager.close()
+
+
+def test_scan_fills_the_batch(wmi):
+    ps, manager = wmi
+    assert len(manager.get_monitor_ids()) == 4
+    assert ps.queries == 1
+    assert [manager.get_brightness_percent(i) for i in range(4)] == [0, 10, 20, 30]
+    assert ps.queries == 1
+
+
+def test_n_monitors_share_one_query_per_refresh_window(wmi, monkeypatch):
+    ps, manager = wmi
+    monkeypatch.setattr(monitor_control, "_WMI_BATCH_MAX_AGE_S", 0.2)
+    time.sleep(0.25)
+    queries = ps.queries
+    # All four monitors read at once: one query between them.
+    threads = [threading.Thread(target=manager.get_brightness_percent, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(2)
+    assert ps.queries == queries + 1
+    # Still inside the window: no further queries.
+    assert [manager.get_brightness_percent(i) for i in range(4)] == [0, 10, 20, 30]
+    assert ps.queries == queries + 1
+    # The next window queries once more.
+    time.sleep(0.25)
+    ps.values["DISPLAY\\PNP2\\0_0"] = 55
+    assert [manager.get_brightness_percent(i) for i in range(4)] == [0, 10, 55, 30]
+    assert ps.queries == queries + 2
+
+
+def test_read_all_queries_once(wmi):
+    ps, manager = wmi
+    queries = ps.queries
+    assert manager.get_all_brightness_percent() == [0, 10, 20, 30]
+    assert ps.queries == queries + 1
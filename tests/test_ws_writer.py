@@ -0,0 +1,104 @@
+import json
+import threading
+import time
+
+from src.core.ws_writer import WebSocketWriter
+
+
+class _Socket:
+    def __init__(self, block: bool = False):
+        self.sent = []
+        self.gate = threading.Event()
+        if not block:
+            self.gate.set()
+
+    def send(self, text):
+        self.gate.wait(5)
+        self.sent.append(json.loads(text))
+
+
+def _events(sock):
+    return [(m["event"], m.get("context"), m.get("payload")) for m in sock.sent]
+
+
+def test_nothing_is_sent_until_connected():
+    sock = _Socket()
+    writer = WebSocketWriter(sock.send)
+    writer.send({"event": "showOk", "context": "a"})
+    time.sleep(0.05)
+    assert sock.sent == []
+    writer.set_connected(True)
+    assert writer.flush(1)
+    assert _events(sock) == [("showOk", "a", None)]
+    writer.close()
+
+
+def test_send_first_goes_ahead_of_queued_messages():
+    sock = _Socket()
+    writer = WebSocketWriter(sock.send)
+    writer.send({"event": "setTitle", "context": "a", "payload": 1})
+    writer.send_first({"event": "register"})
+    writer.set_connected(True)
+    assert writer.flush(1)
+    assert [m["event"] for m in sock.sent] == ["register", "setTitle"]
+    writer.close()
+
+
+def test_queued_titles_for_a_context_coalesce():
+    sock = _Socket()
+    writer = WebSocketWriter(sock.send)
+    for i in range(5):
+        writer.send({"event": "setTitle", "context": "a", "payload": i})
+    writer.send({"event": "setTitle", "context": "b", "payload": 0})
+    writer.set_connected(True)
+    assert writer.flush(1)
+    assert _events(sock) == [("setTitle", "a", 4), ("setTitle", "b", 0)]
+    assert writer.stats()["coalesced"] == 4
+    writer.close()
+
+
+def test_coalesced_title_does_not_overtake_later_message_for_its_context():
+    sock = _Socket()
+    writer = WebSocketWriter(sock.send)
+    writer.send({"event": "setTitle", "context": "a", "payload": 1})
+    writer.send({"event": "showOk", "context": "a"})
+    writer.send({"event": "setTitle", "context": "a", "payload": 2})
+    writer.send({"event": "setTitle", "context": "a", "payload": 3})
+    writer.set_connected(True)
+    assert writer.flush(1)
+    assert _events(sock) == [("setTitle", "a", 1), ("showOk", "a", None), ("setTitle", "a", 3)]
+    writer.close()
+
+
+def test_full_queue_drops_after_put_timeout():
+    sock = _Socket(block=True)
+    writer = WebSocketWriter(sock.send, max_pending=2, put_timeout_s=0.05)
+    writer.set_connected(True)
+    writer.send({"event": "showOk", "context": "x"})
+    time.sleep(0.05)  # the writer thread now holds this one in send()
+    assert writer.send({"event": "showOk", "context": "a"})
+    assert writer.send({"event": "showOk", "context": "b"})
+    started = time.monotonic()
+    assert not writer.send({"event": "showOk", "context": "c"})
+    assert time.monotonic() - started >= 0.045
+    sock.gate.set()
+    assert writer.flush(1)
+    stats = writer.stats()
+    assert stats["dropped"] == 1
+    assert stats["full_waits"] == 1
+    assert [m["context"] for m in sock.sent] == ["x", "a", "b"]
+    writer.close()
+
+
+def test_waiting_caller_gets_room_when_writer_drains():
+    sock = _Socket(block=True)
+    writer = WebSocketWriter(sock.send, max_pending=1, put_timeout_s=2.0)
+    writer.set_connected(True)
+    writer.send({"event": "showOk", "context": "x"})
+    time.sleep(0.05)
+    writer.send({"event": "showOk", "context": "a"})
+    threading.Timer(0.05, sock.gate.set).start()
+    assert writer.send({"event": "showOk", "context": "b"})
+    assert writer.flush(1)
+    assert [m["context"] for m in sock.sent] == ["x", "a", "b"]
+    writer.close()